@@ -0,0 +1,108 @@
+########## astar_benchmark.py ##########
+
+'''
+
+- This script benchmarks the heap based astar() against the original linear scan of the open list
+- Each maze is an open square grid so the timings isolate the cost of picking the next node from the open list
+- usage: python astar_benchmark.py [size ...]
+
+'''
+
+#########
+# imports
+#########
+
+from sys import argv
+from time import perf_counter
+from astar_maze_path_plot import astar, create_children, create_g, create_h
+from maze_grid import MazeGrid
+
+####################
+# initial conditions
+####################
+
+sizes = [256, 1024, 4096] # define the side length of each benchmark maze
+scan_max_size = 1024 # the linear scan is quadratic in the open list (~10 min at 1024), so skip it on bigger mazes
+
+######################
+# define the benchmark
+######################
+
+def astar_linear_scan(start, end, grid):
+	'''
+	- the original astar() which scans the whole open list for the lowest f cost on every expansion
+	'''
+	g = {}
+	f = {}
+	g[start] = 0
+	f[start] = create_h(start, end)
+	closed_list = set()
+	open_list = set([start])
+	parent = {}
+	while len(open_list) > 0:
+		current_node = None
+		current_f = None
+		for node in open_list:
+			if current_node is None or f[node] < current_f:
+				current_f = f[node]
+				current_node = node
+		if current_node == end:
+			path = [current_node]
+			while current_node in parent:
+				current_node = parent[current_node]
+				path.append(current_node)
+			path.reverse()
+			return path
+		open_list.remove(current_node)
+		closed_list.add(current_node)
+		children = create_children(current_node, grid)
+		for child in children:
+			if child in closed_list:
+				continue
+			candidates_g = g[current_node] + create_g(current_node, child)
+			if child not in open_list:
+				open_list.add(child)
+			elif candidates_g >= g[current_node]:
+				continue
+			parent[child] = current_node
+			g[child] = candidates_g
+			f[child] = g[child] + create_h(child, end)
+
+def path_cost(path):
+	'''
+	- sum the move costs along a path
+	'''
+	return sum(create_g(path[i], path[i + 1]) for i in range(len(path) - 1))
+
+def time_search(search, start, end, grid):
+	'''
+	- run a search once and return the path with the elapsed wall clock time
+	'''
+	start_time = perf_counter()
+	path = search(start, end, grid)
+	return path, perf_counter() - start_time
+
+def benchmark(sizes):
+	'''
+	- time both searches corner to far side on an open maze of each size
+	'''
+	print('{:>6} {:>12} {:>12} {:>9} {:>12} {:>12}'.format('size', 'scan (s)', 'heap (s)', 'speedup', 'scan cost', 'heap cost'))
+	for size in sizes:
+		start = (1, 1)
+		end = (size - 2, size // 2)
+		grid = MazeGrid.from_barriers(0, size, [])
+		heap_path, heap_time = time_search(astar, start, end, grid)
+		if size > scan_max_size:
+			print('{:>6} {:>12} {:>12.4f} {:>9} {:>12} {:>12.3f}'.format(size, '-', heap_time, '-', '-', path_cost(heap_path)))
+			continue
+		scan_path, scan_time = time_search(astar_linear_scan, start, end, grid)
+		print('{:>6} {:>12.4f} {:>12.4f} {:>8.1f}x {:>12.3f} {:>12.3f}'.format(size, scan_time, heap_time, scan_time / heap_time, path_cost(scan_path), path_cost(heap_path)))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		sizes = [int(size) for size in argv[1:]]
+	benchmark(sizes)
@@ -1,270 +1,410 @@
-########## astar_maze_path_plot.py ##########
-
-'''
-
-- This script implements the A* path finding algorithm and plots the result
-
-'''
-
-#########
-# imports
-#########
-
-from math import sqrt
-import matplotlib.pyplot as plt
-from operator import itemgetter
-
-####################
-# initial conditions
-####################
-
-edge_min = 0
-edge_max = 8
-maze_edges = [[edge_min, edge_min], [edge_min, edge_max], [edge_max, edge_max], [edge_max, edge_min]]
-barriers = [(2, 4), (2, 5), (2, 6), (3, 6), (4, 6), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (4, 2), (3, 2)]
-start = (7, 7)
-end = (4, 5)
-
-######################
-# create the algorithm
-######################
-
-
-def plot_maze(maze_edges, barriers):
-	'''
-	- plot the maze board as defined by the maze edges and barriers
-	'''
-	# plot the board
-	i = 0
-	j = 1
-	while j < len(maze_edges):
-		plt.plot([maze_edges[i][0], maze_edges[j][0]], [maze_edges[i][1], maze_edges[j][1]], 'k-')
-		i += 1
-		j += 1
-	plt.plot([maze_edges[-1][0], maze_edges[0][0]], [maze_edges[-1][1], maze_edges[0][1]], 'k-')
-	# plot the barriers
-	i = 0
-	j = 1
-	while j < len(barriers):
-		plt.plot([barriers[i][0], barriers[j][0]], [barriers[i][1], barriers[j][1]], 'k-')
-		i += 1
-		j += 1
-
-def create_g(current_node, child):
-	'''
-	- define the g cost for the A* algorithm
-	'''
-	if child[0] == current_node[0] or child[1] == current_node[1]:
-		g = 1			
-	else:
-		g = sqrt(2)
-	return g
-
-
-def create_h(start, end):
-	'''
-	- define the h cost for the A* algorithm
-	'''
-	distx = abs(start[0] - end[0])
-	disty = abs(start[1] - end[1])
-	if distx > disty:
-		h = sqrt(2)*disty + (distx - disty)
-	else:
-		h = sqrt(2)*distx + (disty - distx)
-	return h
-
-def create_children(current_node, edge_min, edge_max, barriers):
-	'''
-	- create the children of a parent node
-	'''
-	children = []
-	for new_position in [(0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (-1, 1), (1, -1), (1, 1)]:
-		node_position = (current_node[0] + new_position[0], current_node[1] + new_position[1])
-		# check if moving to this position puts the path off the map
-		if node_position[0] == edge_max or node_position[0] == edge_min or node_position[1] == edge_max or node_position[1] == edge_min:
-			continue
-		# check if moving to this position is blocked
-		blocked = False
-		for barrier in barriers:
-			if node_position == barrier:
-				blocked = True
-				break
-		if blocked:
-			continue
-		children.append(node_position)
-	return children
-
-def astar(start, end):
-	g = {}
-	f = {}
-	g[start] = 0
-	f[start] = create_h(start, end)
-	closed_list = set()
-	open_list = set([start])
-	parent = {}
-	while len(open_list) > 0:
-		# get the child in the open list with the lowest f cost
-		current_node = None
-		current_f = None
-		for node in open_list:
-			if current_node is None or f[node] < current_f:
-				current_f = f[node]
-				current_node = node
-		# check if the maze is complete
-		if current_node == end:
-			# retrace our steps
-			path = [current_node]
-			while current_node in parent:
-				current_node = parent[current_node]
-				path.append(current_node)
-			path.reverse()
-			return path
-		# mark the current parent as closed
-		open_list.remove(current_node)
-		closed_list.add(current_node)
-		# update the costs for each child of the parent
-		children = create_children(current_node, edge_min, edge_max, barriers)
-		for child in children:
-			if child in closed_list:
-				continue # we already processed this node
-			candidates_g = g[current_node] + create_g(current_node, child)
-			if child not in open_list:
-				open_list.add(child)
-			elif candidates_g >= g[current_node]:
-				continue # this g score is worse than previously found
-			# adopt this g score
-			parent[child] = current_node
-			g[child] = candidates_g
-			h = create_h(child, end)
-			f[child] = g[child] + h
-
-#########
-# testing
-#########
-maze = plot_maze(maze_edges, barriers)
-path = astar(start, end)
-plt.plot([i[0] for i in path], [i[1] for i in path])
-plt.show()
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-# def create_node(position, parent, g, h, f):
-# 	'''
-# 	- create a noce as defined by its position, its parent, and its g, h, and f costs
-# 	'''
-# 	return [position, parent, g, h, f]
-
-# def create_children(current_node, edge_min, edge_max, barriers):
-# 	'''
-# 	- create the children of a parent node
-# 	'''
-	# children = []
-	# for new_position in [[0, -1], [0, 1], [-1, 0], [1, 0], [-1, -1], [-1, 1], [1, -1], [1, 1]]:
-	# 	node_position = [current_node[0][0] + new_position[0], current_node[0][1] + new_position[1]]
-	# 	# check if moving to this position puts the path off the map
-	# 	if node_position[0] == edge_max or node_position[0] == edge_min or node_position[1] == edge_max or node_position[1] == edge_min:
-	# 		continue
-	# 	# check if moving to this position is blocked
-	# 	blocked = False
-	# 	for barrier in barriers:
-	# 		if node_position == barrier:
-	# 			blocked = True
-	# 			break
-	# 	if blocked:
-	# 		continue
-	# 	new_node = create_node(node_position, start_parent, start_g, start_h, start_f)
-	# 	children.append(new_node)
-# 	return children
-# 	# loop through the children
-# 	# for child in children:
-# 	# 	# create parent, g, h, f values for the children
-# 	# 	child[1] = [[current_node[0]], [current_node[1]], [current_node[2]], [current_node[3]]]
-# 	# 	if child[0][0] == current_node[0][0] or child[0][1] == current_node[0][1]:
-# 	# 		child[2] = current_node[2] + 1
-# 	# 	else:
-# 	# 		child[2] = current_node[2] + sqrt(2)
-# 	# 	distx = abs(child[0][1] - end_node[1])
-# 	# 	disty = abs(child[0][0] - end_node[0])
-# 	# 	if distx > disty:
-# 	# 		child[3] = sqrt(2)*disty + (distx - disty)
-# 	# 	else:
-# 	# 		child[3] = sqrt(2)*distx + (disty - distx)
-# 	# 	child[4] = child[2] + child[3]
-# 	# return children
-
-
-# def astar():
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-# 	open_list = []
-# 	closed_list = []
-# 	start = create_node(start_node, start_parent, start_g, start_h, start_f)
-# 	target = create_node(end_node, start_parent, start_g, start_h, start_f)
-# 	open_list.append(start)
-# 	while len(open_list) > 0:
-# 		open_list = sorted(open_list, key = itemgetter(-1))
-# 		current_node = open_list[0]
-# 		open_list.remove(current_node)
-# 		closed_list.append(current_node)
-# 		if current_node[0] == target[0]:
-# 			path = []
-# 			current = current_node
-# 			while current[0] != start[0]:
-# 				path.append(current)
-# 				current = current[1]
-# 			path.append(start)
-# 			path = path[::-1]
-# 			best_path = []
-# 			for node in path:
-# 				best_path.append(node[0])
-# 			return best_path
-# 			break
-# 		children = create_children(current_node, edge_min, edge_max, barriers)
-# 		for child in children:
-# 			if child in closed_list:
-# 				continue
-# 			if child not in open_list:
-# 				child[1] = current_node
-# 				if child not in open_list:
-# 					open_list.append(child)
-
-
-
-# # maze_plot = plot_maze(maze_edges, barriers)
-# # current_node = create_node([5, 1], start_parent, start_g, start_h, start_f)
-# # plt.plot(current_node[0][0], current_node[0][1], 'ro')
-# # children = create_children(current_node, edge_min, edge_max, barriers)
-# # print(children)
-# # plt.gca().set_aspect('equal')
-# # plt.show()
-
-# path = astar()
+########## astar_maze_path_plot.py ##########
+
+'''
+
+- This script implements the A* path finding algorithm and plots the result
+
+'''
+
+#########
+# imports
+#########
+
+from math import sqrt
+from heapq import heapify, heappush, heappop
+from time import perf_counter
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from operator import itemgetter
+from maze_grid import MazeGrid, mask_codes, move_costs
+
+####################
+# initial conditions
+####################
+
+edge_min = 0
+edge_max = 8
+maze_edges = [[edge_min, edge_min], [edge_min, edge_max], [edge_max, edge_max], [edge_max, edge_min]]
+barriers = [(2, 4), (2, 5), (2, 6), (3, 6), (4, 6), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (4, 2), (3, 2)]
+start = (7, 7)
+end = (4, 5)
+grid = MazeGrid.from_barriers(edge_min, edge_max, barriers)
+anytime_weight = 2.0 # define the weight anytime_astar() finds its first path with
+weight_step = 0.5 # define how much anytime_astar() lowers the weight after each path it finds
+
+######################
+# create the algorithm
+######################
+
+
+def plot_maze(maze_edges, barriers):
+	'''
+	- plot the maze board as defined by the maze edges and barriers
+	- the board outline and the barrier chain are drawn as one LineCollection instead of one plt.plot() per segment
+	'''
+	ax = plt.gca()
+	ax.add_collection(LineCollection([list(maze_edges) + [maze_edges[0]], barriers], colors='k'))
+	ax.autoscale_view()
+
+def create_g(current_node, child):
+	'''
+	- define the g cost for the A* algorithm
+	'''
+	if child[0] == current_node[0] or child[1] == current_node[1]:
+		g = 1			
+	else:
+		g = sqrt(2)
+	return g
+
+
+def create_h(start, end):
+	'''
+	- define the h cost for the A* algorithm
+	'''
+	distx = abs(start[0] - end[0])
+	disty = abs(start[1] - end[1])
+	if distx > disty:
+		h = sqrt(2)*disty + (distx - disty)
+	else:
+		h = sqrt(2)*distx + (disty - distx)
+	return h
+
+def create_children(current_node, grid):
+	'''
+	- create the children of a parent node
+	'''
+	return grid.children(current_node)
+
+def astar(start, end, grid=grid, stats=None, landmarks=None, weight=None, deadline=None):
+	'''
+	- find the lowest cost path from start to end with the A* algorithm
+	- the open list is a binary heap ordered by (f, h), so ties in f are broken toward the node closest to the end
+	- a node whose g score improves is pushed again and the stale heap entry is skipped when it is popped (lazy deletion)
+	- the maze is walked through grid.neighbour_table(), so inside the search a node is its flat cell index x * height + y
+	- if stats is a dict, the counters of the search are written to it: expanded nodes, generated nodes (children seen for the first time),
+	  reopened nodes (open nodes pushed again with a better g score), stale heap entries skipped and the peak size of the closed list,
+	  they are worked out from the sizes of g, the open and the closed list when the search ends, so the loop carries no counters (see search_stats.py)
+	- landmarks is an optional landmarks.Landmarks of the grid, h is then the larger of create_h() and the lower bound of the landmarks that suit this query best
+	- weight > 1 orders the open list by g + weight * h (weighted A*): fewer nodes are expanded and the path costs at most weight times the optimal cost,
+	  weight=None is 1 (plain A*) without a deadline
+	- with a deadline (in seconds) the search is anytime_astar(): the best path found when the deadline passes is returned,
+	  and stats also gets the suboptimality bound of that path and the list of improvements,
+	  weight is then the weight of its first path and weight=None is anytime_weight (2.0), so a suboptimal first path is found quickly
+	'''
+	if deadline is not None:
+		path = None
+		for path, cost, suboptimality in anytime_astar(start, end, grid, anytime_weight if weight is None else weight, deadline, landmarks, stats):
+			pass
+		return path
+	if weight is None:
+		weight = 1.0
+	table = grid.neighbour_table()
+	bound = None if landmarks is None else landmarks.bound_to(end, start)
+	height = table.height
+	masks = table.masks_view
+	offsets = table.offsets
+	end_x, end_y = end
+	start_node = table.cell(start)
+	end_node = table.cell(end)
+	g = {}
+	g[start_node] = 0
+	h = create_h(start, end)
+	if bound is not None:
+		h = max(h, bound(start_node))
+	closed_list = set()
+	open_list = [(weight * h, h, start_node)]
+	parent = {}
+	reopened = 0
+	while len(open_list) > 0:
+		# get the child in the open list with the lowest f cost
+		current_f, current_h, current_node = heappop(open_list)
+		if current_node in closed_list:
+			continue # stale entry, this node was already expanded with a lower f cost
+		# check if the maze is complete
+		if current_node == end_node:
+			# retrace our steps
+			path = [end]
+			while current_node in parent:
+				current_node = parent[current_node]
+				path.append(divmod(current_node, height))
+			path.reverse()
+			if stats is not None:
+				write_counters(stats, g, open_list, closed_list, reopened, True)
+			return path
+		# mark the current parent as closed
+		closed_list.add(current_node)
+		# update the costs for each child of the parent
+		current_g = g[current_node]
+		for code in mask_codes[masks[current_node]]:
+			child = current_node + offsets[code]
+			if child in closed_list:
+				continue # we already processed this node
+			candidates_g = current_g + move_costs[code]
+			if child in g:
+				if candidates_g >= g[child]:
+					continue # this g score is worse than previously found
+				reopened += 1
+			# adopt this g score
+			parent[child] = current_node
+			g[child] = candidates_g
+			# h is create_h(child, end) written out, so no position tuple is built for the child
+			distx = abs(child // height - end_x)
+			disty = abs(child % height - end_y)
+			if distx > disty:
+				h = sqrt(2)*disty + (distx - disty)
+			else:
+				h = sqrt(2)*distx + (disty - distx)
+			if bound is not None:
+				h = max(h, bound(child))
+			heappush(open_list, (candidates_g + weight * h, h, child))
+	if stats is not None:
+		write_counters(stats, g, open_list, closed_list, reopened, False)
+
+def write_counters(stats, g, open_list, closed_list, reopened, found):
+	'''
+	- write the counters of an astar() search to stats
+	- every node in g was pushed once, plus once more per reopening, so the pops and the stale entries follow from the sizes of the lists
+	'''
+	pushes = len(g) + reopened
+	pops = pushes - len(open_list)
+	stats['expanded'] = len(closed_list)
+	stats['generated'] = len(g) - 1
+	stats['reopened'] = reopened
+	stats['stale'] = pops - len(closed_list) - (1 if found else 0)
+	stats['peak_closed'] = len(closed_list)
+
+def anytime_astar(start, end, grid=grid, weight=anytime_weight, deadline=None, landmarks=None, stats=None):
+	'''
+	- anytime repairing A* (ARA*): find a first path quickly with f = g + weight * h, then lower the weight by weight_step and improve the path, until the weight is 1
+	- every round reuses the g scores of the last one, nodes whose g score improved after they were expanded wait in an inconsistent set for the next round
+	  instead of being expanded again in this one, so each round expands a node at most once
+	- yields (path, cost, suboptimality) for every cheaper path found and whenever a round tightens the bound of the path,
+	  suboptimality is an upper bound on cost / optimal cost (1.0 once the path is proven optimal)
+	- the search stops when deadline seconds have passed, but not before the first path is found
+	- if stats is a dict, the expanded nodes, the final suboptimality and the list of (seconds, cost, suboptimality) improvements are written to it
+	'''
+	start_time = perf_counter()
+	table = grid.neighbour_table()
+	bound = None if landmarks is None else landmarks.bound_to(end, start)
+	height = table.height
+	masks = table.masks_view
+	offsets = table.offsets
+	end_x, end_y = end
+	start_node = table.cell(start)
+	end_node = table.cell(end)
+	g = {start_node: 0}
+	hs = {start_node: create_h(start, end) if bound is None else max(create_h(start, end), bound(start_node))}
+	parent = {}
+	open_list = [(weight * hs[start_node], hs[start_node], start_node)]
+	closed_list = set()
+	inconsistent = set()
+	path = None
+	best_cost = float('inf')
+	suboptimality = float('inf')
+	improvements = []
+	expanded = 0
+	out_of_time = False
+	while True:
+		# expand nodes until no open node can lead to a cheaper path than the one to the end at this weight
+		while open_list:
+			current_f, current_h, current_node = open_list[0]
+			if current_f >= g.get(end_node, best_cost):
+				break
+			heappop(open_list)
+			if current_node in closed_list or current_f > g[current_node] + weight * current_h:
+				continue # stale entry
+			if path is not None and deadline is not None and expanded & 255 == 0 and perf_counter() - start_time > deadline:
+				heappush(open_list, (current_f, current_h, current_node))
+				out_of_time = True
+				break
+			closed_list.add(current_node)
+			expanded += 1
+			current_g = g[current_node]
+			for code in mask_codes[masks[current_node]]:
+				child = current_node + offsets[code]
+				candidates_g = current_g + move_costs[code]
+				if child in g and candidates_g >= g[child]:
+					continue # this g score is worse than previously found
+				g[child] = candidates_g
+				parent[child] = current_node
+				if child in closed_list:
+					inconsistent.add(child) # expanded with a worse g score this round, it is opened again next round
+					continue
+				h = hs.get(child)
+				if h is None:
+					distx = abs(child // height - end_x)
+					disty = abs(child % height - end_y)
+					if distx > disty:
+						h = sqrt(2)*disty + (distx - disty)
+					else:
+						h = sqrt(2)*distx + (disty - distx)
+					if bound is not None:
+						h = max(h, bound(child))
+					hs[child] = h
+				heappush(open_list, (candidates_g + weight * h, h, child))
+		# every cheaper path passes an open or inconsistent node, so their lowest g + h bounds the optimal cost from below
+		lower = min([g[node] + hs[node] for f, h, node in open_list if node not in closed_list] + [g[node] + hs[node] for node in inconsistent], default=float('inf'))
+		limit = float('inf') if out_of_time else weight # a finished round is within weight of the optimal cost
+		if end_node in g and g[end_node] < best_cost:
+			current_node = end_node
+			path = [end]
+			while current_node in parent:
+				current_node = parent[current_node]
+				path.append(divmod(current_node, height))
+			path.reverse()
+			# parents improved after the end was reached can make the path cheaper than g[end_node], so its cost is summed
+			best_cost = sum(create_g(path[i], path[i + 1]) for i in range(len(path) - 1))
+			suboptimality = 1.0 if best_cost == 0 else min(limit, best_cost / min(lower, best_cost))
+			improvements.append((perf_counter() - start_time, best_cost, suboptimality))
+			yield path, best_cost, suboptimality
+		elif path is not None and min(limit, best_cost / min(lower, best_cost)) < suboptimality - 1e-9:
+			suboptimality = min(limit, best_cost / min(lower, best_cost)) # no cheaper path, but the bound of this one got tighter
+			improvements.append((perf_counter() - start_time, best_cost, suboptimality))
+			yield path, best_cost, suboptimality
+		if path is None or weight <= 1.0 or out_of_time or suboptimality <= 1.0:
+			break
+		if deadline is not None and perf_counter() - start_time > deadline:
+			break
+		# lower the weight and open the inconsistent nodes with the open ones
+		weight = max(1.0, weight - weight_step)
+		nodes = {node for f, h, node in open_list if node not in closed_list} | inconsistent
+		open_list = [(g[node] + weight * hs[node], hs[node], node) for node in nodes if g[node] + hs[node] < best_cost]
+		heapify(open_list)
+		closed_list = set()
+		inconsistent = set()
+	if stats is not None:
+		stats['expanded'] = expanded
+		stats['suboptimality'] = suboptimality
+		stats['improvements'] = improvements
+
+#########
+# testing
+#########
+if __name__ == '__main__':
+	maze = plot_maze(maze_edges, barriers)
+	path = astar(start, end)
+	plt.plot([i[0] for i in path], [i[1] for i in path])
+	plt.show()
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+# def create_node(position, parent, g, h, f):
+# 	'''
+# 	- create a noce as defined by its position, its parent, and its g, h, and f costs
+# 	'''
+# 	return [position, parent, g, h, f]
+
+# def create_children(current_node, edge_min, edge_max, barriers):
+# 	'''
+# 	- create the children of a parent node
+# 	'''
+	# children = []
+	# for new_position in [[0, -1], [0, 1], [-1, 0], [1, 0], [-1, -1], [-1, 1], [1, -1], [1, 1]]:
+	# 	node_position = [current_node[0][0] + new_position[0], current_node[0][1] + new_position[1]]
+	# 	# check if moving to this position puts the path off the map
+	# 	if node_position[0] == edge_max or node_position[0] == edge_min or node_position[1] == edge_max or node_position[1] == edge_min:
+	# 		continue
+	# 	# check if moving to this position is blocked
+	# 	blocked = False
+	# 	for barrier in barriers:
+	# 		if node_position == barrier:
+	# 			blocked = True
+	# 			break
+	# 	if blocked:
+	# 		continue
+	# 	new_node = create_node(node_position, start_parent, start_g, start_h, start_f)
+	# 	children.append(new_node)
+# 	return children
+# 	# loop through the children
+# 	# for child in children:
+# 	# 	# create parent, g, h, f values for the children
+# 	# 	child[1] = [[current_node[0]], [current_node[1]], [current_node[2]], [current_node[3]]]
+# 	# 	if child[0][0] == current_node[0][0] or child[0][1] == current_node[0][1]:
+# 	# 		child[2] = current_node[2] + 1
+# 	# 	else:
+# 	# 		child[2] = current_node[2] + sqrt(2)
+# 	# 	distx = abs(child[0][1] - end_node[1])
+# 	# 	disty = abs(child[0][0] - end_node[0])
+# 	# 	if distx > disty:
+# 	# 		child[3] = sqrt(2)*disty + (distx - disty)
+# 	# 	else:
+# 	# 		child[3] = sqrt(2)*distx + (disty - distx)
+# 	# 	child[4] = child[2] + child[3]
+# 	# return children
+
+
+# def astar():
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+# 	open_list = []
+# 	closed_list = []
+# 	start = create_node(start_node, start_parent, start_g, start_h, start_f)
+# 	target = create_node(end_node, start_parent, start_g, start_h, start_f)
+# 	open_list.append(start)
+# 	while len(open_list) > 0:
+# 		open_list = sorted(open_list, key = itemgetter(-1))
+# 		current_node = open_list[0]
+# 		open_list.remove(current_node)
+# 		closed_list.append(current_node)
+# 		if current_node[0] == target[0]:
+# 			path = []
+# 			current = current_node
+# 			while current[0] != start[0]:
+# 				path.append(current)
+# 				current = current[1]
+# 			path.append(start)
+# 			path = path[::-1]
+# 			best_path = []
+# 			for node in path:
+# 				best_path.append(node[0])
+# 			return best_path
+# 			break
+# 		children = create_children(current_node, edge_min, edge_max, barriers)
+# 		for child in children:
+# 			if child in closed_list:
+# 				continue
+# 			if child not in open_list:
+# 				child[1] = current_node
+# 				if child not in open_list:
+# 					open_list.append(child)
+
+
+
+# # maze_plot = plot_maze(maze_edges, barriers)
+# # current_node = create_node([5, 1], start_parent, start_g, start_h, start_f)
+# # plt.plot(current_node[0][0], current_node[0][1], 'ro')
+# # children = create_children(current_node, edge_min, edge_max, barriers)
+# # print(children)
+# # plt.gca().set_aspect('equal')
+# # plt.show()
+
+# path = astar()
 # print(path)
\ No newline at end of file
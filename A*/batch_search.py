@@ -0,0 +1,143 @@
+########## batch_search.py ##########
+
+'''
+
+- This script answers many independent (start, end) queries on one maze across a pool of worker processes
+- The cells of the maze are copied once into shared memory and every worker searches that copy, so the maze is never pickled per query
+- The move masks of the neighbour table (1 byte per cell) are compiled once here and shared the same way, so the workers don't compile their own copy
+  (a packed grid or a grid of more than maze_grid.table_limit cells has no masks, its workers read the moves from the shared cells)
+- Queries are sent to the workers in chunks and results are yielded as soon as each chunk finishes, in completion order
+- usage: python batch_search.py [size] [queries]
+
+'''
+
+#########
+# imports
+#########
+
+from multiprocessing import Pool, cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from random import Random
+from sys import argv
+from time import perf_counter
+from numpy import asarray, ndarray, uint8
+from astar_maze_path_plot import astar
+from maze_grid import MazeGrid, PackedMazeGrid
+
+####################
+# initial conditions
+####################
+
+chunksize = 16 # define how many queries are sent to a worker at a time
+worker = {} # the grid and search function of a worker process, set up once by attach()
+
+######################
+# define the workers
+######################
+
+def share(grid):
+	'''
+	- copy the cells of a grid (or the bits of a packed grid) and the move masks of its neighbour table, if it has any, into a new shared memory block
+	- return the block and the arguments a worker needs to rebuild the grid and its table from it
+	'''
+	packed = isinstance(grid, PackedMazeGrid)
+	cells = grid.bits if packed else grid.cells
+	masks = grid.neighbour_table().masks
+	size = cells.nbytes + (0 if masks is None else masks.nbytes)
+	memory = SharedMemory(create=True, size=max(size, 1))
+	ndarray(cells.shape, dtype=uint8, buffer=memory.buf)[:] = cells
+	if masks is not None:
+		ndarray(masks.shape, dtype=uint8, buffer=memory.buf, offset=cells.nbytes)[:] = masks # the masks follow the cells in the block
+	return memory, (memory.name, cells.shape, packed, grid.width, grid.height, masks is not None)
+
+def attach(layout, search):
+	'''
+	- pool initializer: map the shared cells (and masks) and build the grid every query of this worker is answered on
+	'''
+	name, shape, packed, width, height, shared_masks = layout
+	try:
+		memory = SharedMemory(name=name, track=False) # the parent owns the block and unlinks it
+	except TypeError:
+		memory = SharedMemory(name=name) # python < 3.13 has no track argument
+	cells = ndarray(shape, dtype=uint8, buffer=memory.buf)
+	worker['memory'] = memory # keep the block mapped for the life of the worker
+	worker['grid'] = PackedMazeGrid(cells, width, height) if packed else MazeGrid(cells)
+	if shared_masks:
+		worker['grid'].neighbour_table(ndarray(width * height, dtype=uint8, buffer=memory.buf, offset=cells.nbytes))
+	worker['search'] = search
+
+def search_chunk(chunk):
+	'''
+	- answer a chunk of (index, start, end) queries on the shared grid
+	'''
+	grid = worker['grid']
+	search = worker['search']
+	return [(index, search(start, end, grid)) for index, start, end in chunk]
+
+######################
+# define the batch api
+######################
+
+def as_queries(queries):
+	'''
+	- turn an array of query pairs, shape (n, 2, 2) or (n, 4), into a list of (index, start, end) with python int positions
+	'''
+	values = asarray(queries).reshape(-1, 4).tolist()
+	return [(index, (sx, sy), (ex, ey)) for index, (sx, sy, ex, ey) in enumerate(values)]
+
+def search_batch(queries, grid, search=astar, processes=None, chunksize=chunksize):
+	'''
+	- answer every (start, end) query on grid and yield (index of the query, path) as the searches finish
+	- search can be any module level function with the astar(start, end, grid) signature, for example jps or bidirectional_astar
+	- processes defaults to the number of cores, processes=1 searches in this process without starting a pool
+	'''
+	queries = as_queries(queries)
+	if processes is None:
+		processes = cpu_count()
+	if processes == 1:
+		for index, start, end in queries:
+			yield index, search(start, end, grid)
+		return
+	chunks = [queries[i:i + chunksize] for i in range(0, len(queries), chunksize)]
+	memory, layout = share(grid)
+	try:
+		with Pool(processes, initializer=attach, initargs=(layout, search)) as pool:
+			for results in pool.imap_unordered(search_chunk, chunks):
+				yield from results
+	finally:
+		memory.close()
+		memory.unlink()
+
+def search_all(queries, grid, search=astar, processes=None, chunksize=chunksize):
+	'''
+	- answer every query and return the paths in the order of the queries
+	'''
+	paths = [None] * len(asarray(queries).reshape(-1, 4))
+	for index, path in search_batch(queries, grid, search, processes, chunksize):
+		paths[index] = path
+	return paths
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	from numpy import argwhere
+	from maze_generator import random_maze
+	size = int(argv[1]) if len(argv) > 1 else 512
+	count = int(argv[2]) if len(argv) > 2 else 256
+	grid = random_maze(size)
+	free = [tuple(cell) for cell in argwhere(grid.cells == 0).tolist()]
+	rng = Random(0)
+	queries = [rng.choice(free) + rng.choice(free) for i in range(count)]
+	baseline = None
+	processes = 1
+	while processes <= max(cpu_count(), 2): # always run the pool at least once
+		start_time = perf_counter()
+		paths = search_all(queries, grid, processes=processes)
+		elapsed = perf_counter() - start_time
+		if baseline is None:
+			baseline = elapsed
+			expected = paths
+		print('{:>3} processes: {:.3f} s, {:.1f} queries/s, {:.2f}x speedup, same paths: {}'.format(processes, elapsed, count / elapsed, baseline / elapsed, paths == expected))
+		processes *= 2
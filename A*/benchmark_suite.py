@@ -0,0 +1,146 @@
+########## benchmark_suite.py ##########
+
+'''
+
+- This script runs the path finding scripts of this folder on reproducible generated mazes and records the results as a regression baseline
+- Mazes: open, random obstacles at several densities, recursive backtracker corridors and rooms, from 64x64 up to 4096x4096
+- For every maze it runs astar() and the create_path variants corner to corner and records time, nodes expanded (steps of the path for the create_path variants), peak memory,
+  whether the end was reached and the path cost relative to astar() (astar() is optimal, so 1.0 is the best possible)
+- The results are written to results_file; if baseline_file exists (a copy of an earlier results file) the times are compared against it
+- usage: python benchmark_suite.py [size ...]
+
+'''
+
+#########
+# imports
+#########
+
+import json
+from os import path as os_path
+from platform import python_version
+from random import seed as seed_random
+from sys import argv
+from time import perf_counter, strftime
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+from astar_maze_path_plot import astar
+from jps_benchmark import path_cost
+from maze_generator import corners, corridor_maze, open_maze, random_maze, rooms_maze
+import guess_maze_path
+import guess_maze_path_continue_if_blocked
+import guess_maze_path_mutate_if_blocked
+import guess_maze_path_stop_if_blocked
+
+####################
+# initial conditions
+####################
+
+sizes = [64, 256, 1024, 4096] # define the side length of each benchmark maze
+densities = [0.1, 0.2, 0.3] # define the obstacle densities of the random mazes
+seed = 0 # every maze is generated from this seed, so each run searches exactly the same mazes
+guess_max_size = 1024 # the create_path variants check membership in a list for every step, so they are skipped on bigger mazes
+walk_steps = 100000 # define how many steps the random walk of guess_maze_path.create_path() may take
+mutations = 100 # define how many mutations create_full_path() may make
+repeats = 3 # define how many times each search is timed, the fastest time is kept
+min_compare_time = 0.005 # runs faster than this (in seconds) are too noisy to compare against the baseline
+min_change = 1.25 # define how much faster or slower than the baseline a run must be to be reported
+results_file = 'benchmark_results.json'
+baseline_file = 'benchmark_baseline.json'
+
+mazes = [('open', lambda size: open_maze(size))]
+mazes += [('random {:.1f}'.format(density), lambda size, density=density: random_maze(size, density, seed)) for density in densities]
+mazes += [('corridors', lambda size: corridor_maze(size, seed)), ('rooms', lambda size: rooms_maze(size, room_size=32, seed=seed))]
+
+# each search takes (start, end, grid) and returns a list of positions from start towards end
+searches = [
+	('astar', astar, None),
+	('guess_maze_path', lambda start, end, grid: guess_maze_path.create_path(grid, start, end, walk_steps), guess_max_size),
+	('continue_if_blocked', lambda start, end, grid: guess_maze_path_continue_if_blocked.create_path(grid, start, end, 0.0, 0.0, 0.0), guess_max_size),
+	('stop_if_blocked', lambda start, end, grid: guess_maze_path_stop_if_blocked.create_path(grid, start, end, 0.0, 0.0, 0.0), guess_max_size),
+	('mutate_if_blocked', lambda start, end, grid: guess_maze_path_mutate_if_blocked.create_full_path(grid, start, end, mutations), guess_max_size),
+]
+
+######################
+# define the benchmark
+######################
+
+def run_search(search, start, end, grid):
+	'''
+	- time a search repeats times, then run it once more under tracemalloc for the peak memory (tracing slows python down, so it isn't timed)
+	- return the path, the fastest time, the nodes expanded (astar() reports them, for the other searches it is the number of steps of the path) and the peak memory in bytes
+	- the random module is seeded before each run so the random walks are reproducible too
+	'''
+	elapsed = float('inf')
+	stats = {}
+	for i in range(repeats):
+		seed_random(seed)
+		start_time = perf_counter()
+		path = search(start, end, grid, stats) if search is astar else search(start, end, grid)
+		elapsed = min(elapsed, perf_counter() - start_time)
+	expanded = stats['expanded'] if search is astar else (0 if path is None else len(path) - 1)
+	seed_random(seed)
+	start_tracing()
+	try:
+		search(start, end, grid)
+		peak = get_traced_memory()[1]
+	finally:
+		stop_tracing()
+	return path, elapsed, expanded, peak
+
+def benchmark(sizes):
+	'''
+	- run every search on every maze type and size and return one result per run
+	'''
+	results = []
+	print('{:>10} {:>6} {:>20} {:>10} {:>12} {:>12} {:>8} {:>10}'.format('maze', 'size', 'search', 'time (s)', 'expanded', 'peak (MB)', 'reached', 'cost/A*'))
+	for name, create_maze in mazes:
+		for size in sizes:
+			grid = create_maze(size)
+			start, end = corners(grid)
+			grid.neighbour_table() # compile the neighbour table before timing the searches
+			optimal_cost = None
+			for search_name, search, max_size in searches:
+				if max_size is not None and size > max_size:
+					continue
+				path, elapsed, expanded, peak = run_search(search, start, end, grid)
+				reached = path is not None and path[-1] == end
+				cost = path_cost(path) if reached else None
+				if search_name == 'astar':
+					optimal_cost = cost
+				ratio = cost / optimal_cost if reached and optimal_cost else None
+				results.append({'maze': name, 'size': size, 'search': search_name, 'time': elapsed, 'expanded': expanded, 'peak_memory': peak, 'reached': reached, 'cost': cost, 'cost_ratio': ratio})
+				print('{:>10} {:>6} {:>20} {:>10.4f} {:>12} {:>12.2f} {:>8} {:>10}'.format(name, size, search_name, elapsed, expanded, peak / 1e6, str(reached), '-' if ratio is None else '{:.3f}'.format(ratio)))
+	return results
+
+def compare(results, baseline):
+	'''
+	- print the runs that got slower or faster than the same run in the baseline by more than min_change, or whose astar() path cost changed
+	'''
+	previous = {(result['maze'], result['size'], result['search']): result for result in baseline['results']}
+	print('compared with {} ({}):'.format(baseline_file, baseline['date']))
+	for result in results:
+		old = previous.get((result['maze'], result['size'], result['search']))
+		if old is None:
+			continue
+		speedup = old['time'] / result['time'] if result['time'] > 0 else float('inf')
+		changes = []
+		if max(old['time'], result['time']) >= min_compare_time and (speedup > min_change or speedup < 1 / min_change):
+			changes.append('{:.2f}x {}'.format(speedup, 'faster' if speedup > 1 else 'slower'))
+		if result['search'] == 'astar' and old['cost'] is not None and result['cost'] is not None and abs(old['cost'] - result['cost']) > 1e-9:
+			changes.append('cost {:.3f} -> {:.3f}'.format(old['cost'], result['cost']))
+		if changes:
+			print('{:>10} {:>6} {:>20}: {}'.format(result['maze'], result['size'], result['search'], ', '.join(changes)))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		sizes = [int(size) for size in argv[1:]]
+	results = benchmark(sizes)
+	if os_path.exists(baseline_file):
+		with open(baseline_file) as file:
+			compare(results, json.load(file))
+	with open(results_file, 'w') as file:
+		json.dump({'date': strftime('%Y-%m-%d %H:%M:%S'), 'python': python_version(), 'seed': seed, 'results': results}, file, indent=1)
+	print('results written to', results_file)
@@ -0,0 +1,119 @@
+########## bidirectional_astar.py ##########
+
+'''
+
+- This script implements a bidirectional A* search that grows one frontier from the start and one from the end at the same time
+- The forward search aims at the end and the backward search aims at the start, both with create_h() and create_g()
+- The best meeting cost found so far is only returned once neither frontier can improve on it, so the path is optimal
+
+'''
+
+#########
+# imports
+#########
+
+from heapq import heappush, heappop
+from astar_maze_path_plot import create_g, create_h, start, end, grid
+
+######################
+# define the algorithm
+######################
+
+def top_f(open_list, closed_list, other_closed):
+	'''
+	- drop stale entries from the top of a heap and return the lowest f cost left, or None if the heap is empty
+	- a node already closed by the other search is nipped: its cost through both sides is already counted in the best meeting, so it is closed without being expanded
+	'''
+	while open_list and (open_list[0][2] in closed_list or open_list[0][2] in other_closed):
+		closed_list.add(heappop(open_list)[2])
+	if open_list:
+		return open_list[0][0]
+	return None
+
+def expand(grid, open_list, closed_list, g, parent, target, other_g, best_cost):
+	'''
+	- expand the best node of one frontier and return the cheapest meeting with the other frontier found among its children
+	- children whose f cost is no better than the best meeting so far are trimmed, they cannot lead to a cheaper path
+	'''
+	current_f, current_h, current_node = heappop(open_list)
+	closed_list.add(current_node)
+	best_node = None
+	for child in grid.children(current_node):
+		if child in closed_list:
+			continue # we already processed this node
+		candidates_g = g[current_node] + create_g(current_node, child)
+		if child in g and candidates_g >= g[child]:
+			continue # this g score is worse than previously found
+		h = create_h(child, target)
+		if best_cost is not None and candidates_g + h >= best_cost:
+			continue # trim this child
+		parent[child] = current_node
+		g[child] = candidates_g
+		heappush(open_list, (candidates_g + h, h, child))
+		if child in other_g and (best_cost is None or candidates_g + other_g[child] < best_cost):
+			best_cost = candidates_g + other_g[child]
+			best_node = child
+	return best_cost, best_node
+
+def bidirectional_astar(start, end, grid=grid, stats=None):
+	'''
+	- find the lowest cost path from start to end with a forward and a backward A* search
+	- every undiscovered path still has to pass through both frontiers, so max(lowest forward f, lowest backward f) bounds its cost and the search stops once the best meeting is no worse
+	- the frontier with fewer open nodes is expanded next
+	- pass a dict as stats to have the expansions written to stats['expanded_forward'] and stats['expanded_backward']
+	'''
+	forward_g = {start: 0}
+	backward_g = {end: 0}
+	forward_parent = {}
+	backward_parent = {}
+	forward_closed = set()
+	backward_closed = set()
+	h = create_h(start, end)
+	forward_open = [(h, h, start)]
+	backward_open = [(h, h, end)]
+	expanded_forward = 0
+	expanded_backward = 0
+	best_cost = 0 if start == end else None
+	meeting_node = start if start == end else None
+	while True:
+		forward_f = top_f(forward_open, forward_closed, backward_closed)
+		backward_f = top_f(backward_open, backward_closed, forward_closed)
+		if forward_f is None or backward_f is None:
+			break # one side has run out of nodes, so every path it could reach has been seen
+		if best_cost is not None and best_cost <= max(forward_f, backward_f):
+			break # neither frontier can lead to a cheaper path
+		if len(forward_open) <= len(backward_open):
+			cost, node = expand(grid, forward_open, forward_closed, forward_g, forward_parent, end, backward_g, best_cost)
+			expanded_forward += 1
+		else:
+			cost, node = expand(grid, backward_open, backward_closed, backward_g, backward_parent, start, forward_g, best_cost)
+			expanded_backward += 1
+		if node is not None:
+			best_cost = cost
+			meeting_node = node
+	if stats is not None:
+		stats['expanded_forward'] = expanded_forward
+		stats['expanded_backward'] = expanded_backward
+	if meeting_node is None:
+		return None
+	# retrace our steps back to the start, then forward to the end
+	path = [meeting_node]
+	current_node = meeting_node
+	while current_node in forward_parent:
+		current_node = forward_parent[current_node]
+		path.append(current_node)
+	path.reverse()
+	current_node = meeting_node
+	while current_node in backward_parent:
+		current_node = backward_parent[current_node]
+		path.append(current_node)
+	return path
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	stats = {}
+	print(bidirectional_astar(start, end, grid, stats))
+	print(stats)
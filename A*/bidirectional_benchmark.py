@@ -0,0 +1,61 @@
+########## bidirectional_benchmark.py ##########
+
+'''
+
+- This script compares bidirectional A* against the forward only astar() on corridor and rooms mazes
+- It reports the nodes expanded in each direction, wall clock time and path cost
+- usage: python bidirectional_benchmark.py [size ...]
+
+'''
+
+#########
+# imports
+#########
+
+from sys import argv
+from time import perf_counter
+from astar_maze_path_plot import astar
+from bidirectional_astar import bidirectional_astar
+from jps_benchmark import path_cost
+from maze_generator import corners, corridor_maze, rooms_maze
+
+####################
+# initial conditions
+####################
+
+sizes = [256, 1024] # define the side length of each benchmark maze
+mazes = [('rooms', lambda size: rooms_maze(size, room_size=32, seed=0)), ('corridors', lambda size: corridor_maze(size, seed=0))]
+
+######################
+# define the benchmark
+######################
+
+def benchmark(sizes):
+	'''
+	- run both searches corner to corner on every maze type and size
+	'''
+	print('{:>10} {:>6} {:>12} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10}'.format('maze', 'size', 'A* expanded', 'forward', 'backward', 'A* (s)', 'bi (s)', 'A* cost', 'bi cost'))
+	for name, create_maze in mazes:
+		for size in sizes:
+			grid = create_maze(size)
+			start, end = corners(grid)
+			grid.neighbour_table() # compile the neighbour table before timing astar()
+			stats = {}
+			start_time = perf_counter()
+			astar_path = astar(start, end, grid, stats)
+			astar_time = perf_counter() - start_time
+			astar_expanded = stats['expanded']
+			stats = {}
+			start_time = perf_counter()
+			bidirectional_path = bidirectional_astar(start, end, grid, stats)
+			bidirectional_time = perf_counter() - start_time
+			print('{:>10} {:>6} {:>12} {:>10} {:>10} {:>10.4f} {:>10.4f} {:>10.3f} {:>10.3f}'.format(name, size, astar_expanded, stats['expanded_forward'], stats['expanded_backward'], astar_time, bidirectional_time, path_cost(astar_path), path_cost(bidirectional_path)))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		sizes = [int(size) for size in argv[1:]]
+	benchmark(sizes)
@@ -0,0 +1,189 @@
+########## d_star_lite.py ##########
+
+'''
+
+- This script implements D* Lite, an incremental planner that keeps its search state when cells of the maze are blocked or freed
+- The search runs backward from the end, so after a change only the nodes whose cost to the end changed are repaired instead of searching again from scratch
+- It uses the same moves (MazeGrid.children) and costs (create_g, create_h) as astar(), so the paths are optimal and have the same cost
+
+'''
+
+#########
+# imports
+#########
+
+from heapq import heappush, heappop
+from astar_maze_path_plot import create_g, create_h, start, end, grid
+
+####################
+# initial conditions
+####################
+
+inf = float('inf')
+tolerance = 1e-9 # costs are sums of 1 and sqrt(2), so two keys for the same cost can differ by rounding error
+
+####################
+# define the planner
+####################
+
+def key_less(key, other_key):
+	'''
+	- compare two (f, g) keys lexicographically, treating values within the tolerance as equal
+	'''
+	if key[0] < other_key[0] - tolerance:
+		return True
+	return key[0] <= other_key[0] + tolerance and key[1] < other_key[1] - tolerance
+
+class DStarLite:
+	'''
+	- incremental shortest path planner from start to end on a maze grid
+	- g is the cost to the end found so far and rhs is the one step lookahead of g, a node is consistent when the two agree
+	- edit the maze through set_blocked() so the planner knows which nodes to repair, then call path() to replan
+	- expanded counts the nodes taken off the open list over the lifetime of the planner
+	'''
+
+	def __init__(self, start, end, grid=grid):
+		self.grid = grid
+		self.start = start
+		self.end = end
+		self.g = {}
+		self.rhs = {end: 0}
+		self.km = 0 # how far the start has moved, added to every key so old keys stay valid lower bounds
+		self.open_list = []
+		self.open_keys = {} # the key each inconsistent node is queued with, older heap entries are stale
+		self.expanded = 0
+		self.queue(end)
+
+	def calculate_key(self, node):
+		'''
+		- the priority of a node: (lowest of g and rhs + h from the start, lowest of g and rhs)
+		'''
+		cost = min(self.g.get(node, inf), self.rhs.get(node, inf))
+		return (cost + create_h(self.start, node) + self.km, cost)
+
+	def queue(self, node):
+		'''
+		- push a node onto the open list with its current key
+		'''
+		key = self.calculate_key(node)
+		self.open_keys[node] = key
+		heappush(self.open_list, (key, node))
+
+	def update_vertex(self, node):
+		'''
+		- recompute the rhs of a node from its children and queue it if it is inconsistent
+		'''
+		if node != self.end:
+			rhs = inf
+			if not self.grid.is_blocked(node):
+				for child in self.grid.children(node):
+					cost = create_g(node, child) + self.g.get(child, inf)
+					if cost < rhs:
+						rhs = cost
+			if rhs == inf:
+				self.rhs.pop(node, None)
+			else:
+				self.rhs[node] = rhs
+		self.update_queue(node)
+
+	def update_queue(self, node):
+		'''
+		- queue a node if it is inconsistent, otherwise take it off the open list
+		'''
+		if self.g.get(node, inf) != self.rhs.get(node, inf):
+			self.queue(node)
+		else:
+			self.open_keys.pop(node, None)
+
+	def compute_shortest_path(self):
+		'''
+		- expand inconsistent nodes until the start is consistent and nothing on the open list can change its cost
+		'''
+		g = self.g
+		rhs = self.rhs
+		while self.open_list:
+			key, node = self.open_list[0]
+			if self.open_keys.get(node) != key:
+				heappop(self.open_list) # stale entry
+				continue
+			if not key_less(key, self.calculate_key(self.start)) and rhs.get(self.start, inf) == g.get(self.start, inf):
+				break
+			heappop(self.open_list)
+			self.expanded += 1
+			new_key = self.calculate_key(node)
+			if key_less(key, new_key):
+				self.queue(node) # the start has moved since this node was queued
+			elif g.get(node, inf) > rhs.get(node, inf):
+				# the node got cheaper: fix its g and lower the rhs of its neighbours that can now reach the end through it
+				cost = rhs[node]
+				g[node] = cost
+				del self.open_keys[node]
+				for child in self.grid.children(node):
+					if child != self.end:
+						child_rhs = create_g(child, node) + cost
+						if child_rhs < rhs.get(child, inf):
+							rhs[child] = child_rhs
+					self.update_queue(child)
+			else:
+				# the node got more expensive: forget its g and recompute the rhs of the node and every neighbour that relied on it
+				old_cost = g.pop(node, inf)
+				del self.open_keys[node]
+				self.update_vertex(node)
+				for child in self.grid.children(node):
+					if child != self.end and abs(rhs.get(child, inf) - (create_g(child, node) + old_cost)) <= tolerance:
+						self.update_vertex(child)
+					else:
+						self.update_queue(child)
+
+	def set_blocked(self, position, blocked=True):
+		'''
+		- block or free a cell of the maze and queue the nodes whose rhs depends on it
+		'''
+		if self.grid.is_blocked(position) == blocked:
+			return
+		self.grid.set_blocked(position, blocked)
+		self.update_vertex(position)
+		for child in self.grid.children(position):
+			self.update_vertex(child)
+
+	def move_start(self, position):
+		'''
+		- move the start (for example as an agent walks the path) without invalidating the open list
+		'''
+		self.km += create_h(self.start, position)
+		self.start = position
+
+	def path(self):
+		'''
+		- replan and return the lowest cost path from the start to the end, or None if the end can't be reached
+		'''
+		self.compute_shortest_path()
+		if self.g.get(self.start, inf) == inf:
+			return None
+		current_node = self.start
+		path = [current_node]
+		while current_node != self.end:
+			best_node = None
+			best_cost = inf
+			for child in self.grid.children(current_node):
+				cost = create_g(current_node, child) + self.g.get(child, inf)
+				if cost < best_cost:
+					best_cost = cost
+					best_node = child
+			if best_node is None:
+				return None
+			current_node = best_node
+			path.append(current_node)
+		return path
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	planner = DStarLite(start, end, grid)
+	path = planner.path()
+	print(path)
+	planner.set_blocked(path[5]) # block a cell on the path and replan
+	print(planner.path())
+	print('expanded:', planner.expanded)
@@ -0,0 +1,90 @@
+########## d_star_lite_benchmark.py ##########
+
+'''
+
+- This script compares replanning with D* Lite against running astar() from scratch after every change to the maze
+- Each round removes walls added in earlier rounds and adds random walls, one of them on the current path so the path has to change
+- usage: python d_star_lite_benchmark.py [size] [rounds]
+
+'''
+
+#########
+# imports
+#########
+
+from random import Random
+from sys import argv
+from time import perf_counter
+from astar_maze_path_plot import astar
+from d_star_lite import DStarLite
+from jps_benchmark import path_cost
+from maze_generator import corners, random_maze
+
+####################
+# initial conditions
+####################
+
+size = 1024 # define the side length of the benchmark maze
+density = 0.2 # define the chance that a cell of the maze is blocked
+rounds = 20 # define how many rounds of changes to replan after
+flips = 4 # define how many cells change each round
+seed = 0
+
+######################
+# define the benchmark
+######################
+
+def benchmark(size, rounds):
+	'''
+	- plan once, then flip cells and time the D* Lite repair against a full astar() search each round
+	'''
+	rng = Random(seed)
+	grid = random_maze(size, density, seed)
+	start, end = corners(grid)
+	start_time = perf_counter()
+	planner = DStarLite(start, end, grid)
+	path = planner.path()
+	print('initial plan: D* Lite {:.3f} s ({} expanded)'.format(perf_counter() - start_time, planner.expanded))
+	start_time = perf_counter()
+	astar(start, end, grid)
+	print('initial plan: astar() {:.3f} s'.format(perf_counter() - start_time))
+	print('{:>6} {:>12} {:>12} {:>12} {:>9} {:>12} {:>12}'.format('round', 'expanded', 'D* Lite (s)', 'astar() (s)', 'speedup', 'D* cost', 'A* cost'))
+	added = []
+	total_replan = 0
+	total_search = 0
+	for i in range(rounds):
+		# free half of the walls from earlier rounds, then add random walls and one wall on the current path so the path has to change
+		removals = min(len(added), flips // 2)
+		for j in range(removals):
+			planner.set_blocked(added.pop(rng.randrange(len(added))), False)
+		for j in range(flips - removals):
+			if j == 0 and path is not None and len(path) > 2:
+				cell = path[rng.randrange(1, len(path) - 1)]
+			else:
+				cell = (rng.randrange(1, size - 1), rng.randrange(1, size - 1))
+			if cell == start or cell == end or grid.is_blocked(cell):
+				continue
+			planner.set_blocked(cell, True)
+			added.append(cell)
+		expanded = planner.expanded
+		start_time = perf_counter()
+		path = planner.path()
+		replan_time = perf_counter() - start_time
+		start_time = perf_counter()
+		astar_path = astar(start, end, grid)
+		search_time = perf_counter() - start_time
+		total_replan += replan_time
+		total_search += search_time
+		print('{:>6} {:>12} {:>12.4f} {:>12.4f} {:>8.1f}x {:>12.3f} {:>12.3f}'.format(i, planner.expanded - expanded, replan_time, search_time, search_time / replan_time, path_cost(path), path_cost(astar_path)))
+	print('total: D* Lite {:.3f} s, astar() {:.3f} s ({:.1%} of a full search per replan)'.format(total_replan, total_search, total_replan / total_search))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		size = int(argv[1])
+	if len(argv) > 2:
+		rounds = int(argv[2])
+	benchmark(size, rounds)
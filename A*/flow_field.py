@@ -0,0 +1,144 @@
+########## flow_field.py ##########
+
+'''
+
+- This script answers many queries that share one end cell with a single search from the end, instead of one astar() per start
+- A FlowField holds the lowest cost from every cell to the end (one dijkstra() over the whole maze) and the move that goes downhill from each cell,
+  so the optimal path from any start is read off by following the moves, in time proportional to the length of the path
+- FlowFieldCache keeps the fields of the most recently used ends, keyed on the maze fingerprint like path_cache.py, so a thousand agents heading to one end cost one field
+- usage: FlowFieldCache().path(start, end, grid) has the astar(start, end, grid) signature
+
+'''
+
+#########
+# imports
+#########
+
+from collections import OrderedDict
+from numpy import full, inf, int8, isinf, pad
+from scipy.sparse.csgraph import dijkstra
+from astar_maze_path_plot import start, end, grid
+from landmarks import create_graph
+from maze_grid import move_costs, moves
+
+####################
+# initial conditions
+####################
+
+maxsize = 16 # define how many fields the cache holds before the least recently used one is evicted, a field takes 9 bytes per cell of the maze
+
+######################
+# define the field
+######################
+
+class FlowField:
+	'''
+	- distance[x][y] is the lowest cost from the cell to the end (inf if the end can't be reached from it)
+	- flow[x][y] is the index into moves of the first move of an optimal path from the cell, -1 at the end and on cells that can't reach it
+	- the field is only valid for the grid version it was computed on
+	'''
+
+	def __init__(self, grid, end):
+		if grid.is_blocked(end):
+			raise ValueError('the end {} is blocked or off the maze'.format(end))
+		self.grid = grid
+		self.version = grid.version
+		self.end = end
+		width, height = grid.width, grid.height
+		self.distance = dijkstra(create_graph(grid), indices=end[0] * height + end[1]).reshape(width, height)
+		# every cell moves to the neighbour that minimizes move cost + distance, cells off the maze and blocked cells are at inf
+		padded = pad(self.distance, 1, constant_values=inf)
+		best = full((width, height), inf)
+		self.flow = full((width, height), -1, dtype=int8)
+		for code, move in enumerate(moves):
+			candidate = padded[1 + move[0]:1 + move[0] + width, 1 + move[1]:1 + move[1] + height] + move_costs[code]
+			better = candidate < best
+			best[better] = candidate[better]
+			self.flow[better] = code
+		self.flow[isinf(self.distance)] = -1
+		self.flow[end[0], end[1]] = -1
+		self._flow = memoryview(self.flow)
+
+	def cost(self, start):
+		'''
+		- return the lowest cost from start to the end (inf if there is no path)
+		'''
+		return float(self.distance[start[0], start[1]])
+
+	def path(self, start):
+		'''
+		- follow the flow from start and return the positions of the path to the end, or None if the end can't be reached from start
+		'''
+		if self.grid.version != self.version:
+			raise ValueError('the grid was edited after the flow field was computed')
+		if self.grid.is_blocked(start) or isinf(self.distance[start[0], start[1]]):
+			return None
+		flow = self._flow
+		x, y = start
+		path = [start]
+		code = flow[x, y]
+		while code >= 0:
+			move = moves[code]
+			x += move[0]
+			y += move[1]
+			path.append((x, y))
+			code = flow[x, y]
+		return path
+
+class FlowFieldCache:
+	'''
+	- LRU cache of flow fields keyed on (maze fingerprint, end), any edit to the maze changes the key so stale fields are never used
+	- hits and misses count how paths were answered
+	'''
+
+	def __init__(self, maxsize=maxsize):
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._fields = OrderedDict() # (fingerprint, end) -> FlowField, least recently used first
+
+	def field(self, end, grid=grid):
+		'''
+		- return the flow field towards end, computing it only if it isn't cached
+		'''
+		key = (grid.fingerprint(), end)
+		if key in self._fields:
+			self._fields.move_to_end(key)
+			self.hits += 1
+			return self._fields[key]
+		self.misses += 1
+		field = FlowField(grid, end)
+		self._fields[key] = field
+		if len(self._fields) > self.maxsize:
+			self._fields.popitem(last=False)
+		return field
+
+	def path(self, start, end, grid=grid):
+		'''
+		- return the optimal path from start to end read off the cached field of end
+		'''
+		return self.field(end, grid).path(start)
+
+	def clear(self):
+		'''
+		- drop every cached field and reset the counters
+		'''
+		self._fields.clear()
+		self.hits = 0
+		self.misses = 0
+
+	def cache_info(self):
+		'''
+		- return the counters and size of the cache
+		'''
+		return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize, 'currsize': len(self._fields)}
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	cache = FlowFieldCache()
+	print(cache.path(start, end, grid))
+	print(cache.path((1, 1), end, grid))
+	print(cache.cache_info()) # the second path was read off the field of the first
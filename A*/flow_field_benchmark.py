@@ -0,0 +1,77 @@
+########## flow_field_benchmark.py ##########
+
+'''
+
+- This script compares routing many agents to one end cell with a cached flow field against one astar() per agent
+- It reports the time to compute the field, the time per path read off it, the time per astar() query and the total for all the agents
+- usage: python flow_field_benchmark.py [size] [agents]
+
+'''
+
+#########
+# imports
+#########
+
+from random import Random
+from sys import argv
+from time import perf_counter
+from numpy import argwhere, asarray
+from astar_maze_path_plot import astar
+from flow_field import FlowFieldCache
+from jps_benchmark import path_cost
+from maze_generator import corners, random_maze, rooms_maze
+
+####################
+# initial conditions
+####################
+
+size = 1024 # define the side length of the benchmark mazes
+agents = 1000 # define how many agents route to the end cell
+astar_agents = 20 # astar() is only timed on this many of the agents, its total is extrapolated from the time per query
+mazes = [('random 0.2', lambda size: random_maze(size, 0.2, 0)), ('rooms', lambda size: rooms_maze(size, room_size=32, seed=0))]
+
+######################
+# define the benchmark
+######################
+
+def benchmark(size, agents):
+	'''
+	- route the agents from random free cells to the bottom right corner of each maze
+	'''
+	print('{:>10} {:>6} {:>7} {:>10} {:>12} {:>12} {:>12} {:>12} {:>9}'.format('maze', 'size', 'agents', 'field (s)', 'path (ms)', 'astar (ms)', 'field total', 'astar total', 'speedup'))
+	for name, create_maze in mazes:
+		grid = create_maze(size)
+		grid.neighbour_table() # compile the neighbour table before timing anything
+		end = corners(grid)[1]
+		free = [tuple(cell) for cell in argwhere(asarray(grid.cells) == 0).tolist()]
+		rng = Random(0)
+		starts = [rng.choice(free) for i in range(agents)]
+		cache = FlowFieldCache()
+		start_time = perf_counter()
+		cache.field(end, grid)
+		field_time = perf_counter() - start_time
+		start_time = perf_counter()
+		paths = [cache.path(start, end, grid) for start in starts]
+		path_time = (perf_counter() - start_time) / agents
+		assert cache.misses == 1
+		astar_time = 0.0
+		for start, path in zip(starts[:astar_agents], paths):
+			start_time = perf_counter()
+			astar_path = astar(start, end, grid)
+			astar_time += perf_counter() - start_time
+			assert (path is None) == (astar_path is None)
+			assert path is None or abs(path_cost(path) - path_cost(astar_path)) < 1e-6, 'the flow field path is not optimal'
+		astar_time /= astar_agents
+		field_total = field_time + path_time * agents
+		print('{:>10} {:>6} {:>7} {:>10.3f} {:>12.4f} {:>12.2f} {:>11.2f}s {:>11.2f}s {:>8.0f}x'.format(name, size, agents, field_time, path_time * 1e3, astar_time * 1e3, field_total, astar_time * agents, astar_time * agents / field_total))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		size = int(argv[1])
+	if len(argv) > 2:
+		agents = int(argv[2])
+	benchmark(size, agents)
@@ -0,0 +1,82 @@
+########## fringe_benchmark.py ##########
+
+'''
+
+- This script compares the memory and time of fringe_search() against astar() on corner to corner queries
+- Peak memory is measured with tracemalloc in a separate untimed run, since tracing slows python down,
+  the neighbour table both searches read is compiled before the run and its size is added to the peak of each search
+- Every maze is also searched as a PackedMazeGrid, whose table is never compiled (the moves are read from the bits)
+- usage: python fringe_benchmark.py [size ...]
+
+'''
+
+#########
+# imports
+#########
+
+from sys import argv
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+from astar_maze_path_plot import astar
+from fringe_search import fringe_search
+from jps_benchmark import path_cost
+from maze_generator import corners, corridor_maze, random_maze, rooms_maze
+from maze_grid import PackedMazeGrid
+
+####################
+# initial conditions
+####################
+
+sizes = [1024, 2048] # define the side length of each benchmark maze
+mazes = [('random 0.3', lambda size: random_maze(size, 0.3, 0)), ('rooms', lambda size: rooms_maze(size, room_size=32, seed=0)), ('corridors', lambda size: corridor_maze(size, seed=0))]
+
+######################
+# define the benchmark
+######################
+
+def peak_memory(search, start, end, grid):
+	'''
+	- run a search under tracemalloc and return the peak memory it allocated in bytes, plus the memory of the neighbour table of the grid
+	'''
+	table = grid.neighbour_table()
+	start_tracing()
+	try:
+		search(start, end, grid)
+		return get_traced_memory()[1] + table.nbytes
+	finally:
+		stop_tracing()
+
+def benchmark(sizes):
+	'''
+	- run both searches corner to corner on every maze type and size
+	'''
+	print('{:>10} {:>6} {:>7} {:>12} {:>12} {:>10} {:>10} {:>11} {:>11} {:>10}'.format('maze', 'size', 'packed', 'A* expanded', 'fringe exp.', 'A* (s)', 'fringe (s)', 'A* (MB)', 'fringe (MB)', 'memory'))
+	for name, create_maze in mazes:
+		for size, packed in [(size, packed) for size in sizes for packed in (False, True)]:
+			grid = create_maze(size)
+			if packed:
+				grid = PackedMazeGrid.from_grid(grid)
+			start, end = corners(grid)
+			grid.neighbour_table() # compile the neighbour table before timing the searches
+			astar_stats = {}
+			start_time = perf_counter()
+			astar_path = astar(start, end, grid, astar_stats)
+			astar_time = perf_counter() - start_time
+			fringe_stats = {}
+			start_time = perf_counter()
+			fringe_path = fringe_search(start, end, grid, fringe_stats)
+			fringe_time = perf_counter() - start_time
+			assert (astar_path is None) == (fringe_path is None)
+			assert astar_path is None or abs(path_cost(astar_path) - path_cost(fringe_path)) < 1e-9, 'fringe_search() found a more expensive path'
+			astar_memory = peak_memory(astar, start, end, grid)
+			fringe_memory = peak_memory(fringe_search, start, end, grid)
+			print('{:>10} {:>6} {:>7} {:>12} {:>12} {:>10.3f} {:>10.3f} {:>11.1f} {:>11.1f} {:>9.1f}x'.format(name, size, str(packed), astar_stats['expanded'], fringe_stats['expanded'], astar_time, fringe_time, astar_memory / 1e6, fringe_memory / 1e6, astar_memory / fringe_memory))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		sizes = [int(size) for size in argv[1:]]
+	benchmark(sizes)
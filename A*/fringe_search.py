@@ -0,0 +1,137 @@
+########## fringe_search.py ##########
+
+'''
+
+- This script implements fringe search, a low memory alternative to astar() for huge mazes
+- astar() keeps a python dict entry for g and parent, a closed set entry and heap tuples for every node it touches, a few hundred bytes per node
+- Fringe search keeps no heap: like IDA* it deepens an f limit, but it keeps the fringe between iterations instead of starting again from the start
+- Its state is flat arrays over the cells of the maze (the g score, the move into the cell and a flag byte, 10 bytes per cell)
+  and two array('q') fringe lists of 8 bytes per entry, so its memory is fixed by the size of the maze and not by how much of it is searched
+- It walks the maze through the same neighbour table as astar(), 1 more byte per cell (nothing for a packed grid, whose moves are read
+  from the bits), so all told it needs about 11 bytes per cell: 46 MB for a 2048 x 2048 maze where astar() peaks at 763 MB (see fringe_benchmark.py)
+- usage: fringe_search(start, end, grid, stats) has the astar(start, end, grid, stats) signature
+
+'''
+
+#########
+# imports
+#########
+
+from array import array
+from math import sqrt
+from numpy import full, inf, int8, uint8, zeros
+from astar_maze_path_plot import create_h, start, end, grid
+from maze_grid import mask_codes, move_costs
+
+####################
+# initial conditions
+####################
+
+expanded_flag = 1 # the node was expanded with its current g score
+deferred_flag = 2 # the node is on the fringe list of the next iteration
+f_step = 1.0 # define how far past the lowest deferred f each new f limit goes, 0 gives the fewest expansions but one iteration per distinct f value
+
+######################
+# define the algorithm
+######################
+
+def fringe_search(start, end, grid=grid, stats=None):
+	'''
+	- find the lowest cost path from start to end with fringe search and the same octile h as astar()
+	- every iteration expands the fringe nodes with f <= the f limit and defers the others to the next iteration, whose limit is the lowest deferred f plus f_step
+	- a node whose g score improves is expanded again, nodes with f at least the cost of the best path found so far are dropped,
+	  and the search stops once no deferred node can lead to a cheaper path, so the path is optimal
+	- if stats is a dict, the expanded nodes, the iterations and the peak memory in bytes are written to it,
+	  the peak memory is the search state plus the neighbour table the search reads (0 bytes for a packed grid, see maze_grid.NeighbourTable)
+	'''
+	table = grid.neighbour_table()
+	height = table.height
+	masks = table.masks_view
+	offsets = table.offsets
+	end_x, end_y = end
+	start_node = table.cell(start)
+	end_node = table.cell(end)
+	size = table.width * table.height
+	g_scores = full(size, inf)
+	move_into = full(size, -1, dtype=int8)
+	flags = zeros(size, dtype=uint8)
+	g = memoryview(g_scores)
+	parent = memoryview(move_into)
+	flag = memoryview(flags)
+	g[start_node] = 0.0
+	now = array('q', [start_node])
+	later = array('q')
+	f_limit = create_h(start, end)
+	best_cost = inf
+	expanded = 0
+	iterations = 0
+	peak_fringe = 1
+	while now:
+		iterations += 1
+		f_min = inf
+		while now:
+			node = now.pop()
+			node_flag = flag[node]
+			if node_flag & expanded_flag:
+				continue # a copy of a node that was already expanded with its current g score
+			node_g = g[node]
+			distx = abs(node // height - end_x)
+			disty = abs(node % height - end_y)
+			if distx > disty:
+				f = node_g + sqrt(2)*disty + (distx - disty)
+			else:
+				f = node_g + sqrt(2)*distx + (disty - distx)
+			if f >= best_cost:
+				continue # can't lead to a cheaper path
+			if f > f_limit:
+				if f < f_min:
+					f_min = f
+				if not node_flag & deferred_flag:
+					flag[node] = node_flag | deferred_flag
+					later.append(node)
+				continue
+			if node == end_node:
+				best_cost = node_g
+				continue
+			flag[node] = node_flag | expanded_flag
+			expanded += 1
+			for code in mask_codes[masks[node]]:
+				child = node + offsets[code]
+				child_g = node_g + move_costs[code]
+				if child_g >= g[child]:
+					continue # this g score is worse than previously found
+				g[child] = child_g
+				parent[child] = code
+				flag[child] &= deferred_flag # a better g score has to be expanded again
+				now.append(child)
+			if len(now) + len(later) > peak_fringe:
+				peak_fringe = len(now) + len(later)
+		if best_cost <= f_min:
+			break # every deferred node has f at least the cost of the best path, so it is optimal
+		f_limit = f_min + f_step
+		for node in later:
+			flag[node] &= expanded_flag
+		now, later = later, now
+	if stats is not None:
+		stats['expanded'] = expanded
+		stats['iterations'] = iterations
+		stats['peak_memory'] = table.nbytes + g_scores.nbytes + move_into.nbytes + flags.nbytes + peak_fringe * now.itemsize
+	if best_cost == inf:
+		return None
+	# retrace our steps
+	node = end_node
+	path = [end]
+	while node != start_node:
+		node -= offsets[parent[node]]
+		path.append(divmod(node, height))
+	path.reverse()
+	return path
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	stats = {}
+	print(fringe_search(start, end, grid, stats))
+	print(stats)
@@ -3,6 +3,7 @@
 '''
 
 - This script guesses the path around a maze
+- create_paths() runs many random walks at once as numpy arrays to estimate if and how quickly a random walk reaches the end of the maze
 
 '''
 
@@ -10,7 +11,10 @@
 # imports
 #########
 
-from random import choice
+from random import randrange
+from numpy import arange, argsort, asarray, empty, flatnonzero, frombuffer, full, iinfo, int8, int64, intp, maximum, median, percentile, stack, take_along_axis, uint8, where
+from numpy.random import default_rng
+from maze_grid import MazeGrid, mask_codes, moves
 
 ####################
 # initial conditions
@@ -22,8 +26,12 @@ maze = [[0, 0, 0, 0, 1, 0],
 		[0, 1, 0, 0, 1, 0],
 		[0, 0, 1, 1, 1, 0],
 		[0, 0, 0, 0, 0, 0]]
-start_node = [2, 3] # define where the maze starts
-end_node = [0, 5] # define where the maze ends
+grid = MazeGrid.from_maze(maze) # define the occupancy grid the path searches
+start_node = (2, 3) # define where the maze starts
+end_node = (0, 5) # define where the maze ends
+mask_counts = asarray([len(codes) for codes in mask_codes], dtype=intp) # how many moves each move bit mask allows
+mask_moves = asarray([codes + (0,) * (len(moves) - len(codes)) for codes in mask_codes], dtype=intp) # mask_moves[mask][:mask_counts[mask]] are the moves the mask allows, in the order of moves
+rejected = iinfo(int64).min # marks the random bytes create_paths() draws again in its step table
 
 ######################
 # define the algorithm
@@ -35,38 +43,122 @@ def create_node(position):
 	'''
 	return [position]
 
-def create_path(maze, start_node, end_node):
+def create_path(grid, start_node, end_node, max_steps=None):
 	'''
 	create a random path around the maze
+	max_steps (optional) stops the walk after that many steps even if it hasn't found the end_node
 	'''
-	on_path = [] # define which full nodes are already in the path
+	table = grid.neighbour_table() # the free neighbours of every cell of the maze, compiled once per maze
+	masks = table.masks_view
+	offsets = table.offsets
 	path = [] # define the node x,y positions the algorithm takes to solve the maze
 	current_node = create_node(start_node) # define the current node of the path as the start_node
-	on_path.append(current_node) # add the start_node to the on_path list
 	path.append(current_node[0]) # add the start_node x,y position to the path
+	current_cell = table.cell(start_node)
+	end_cell = table.cell(end_node)
 	# define the path through the maze
-	while current_node[0] != end_node: # break the loop if the path finds the end of the maze
-		next_moves = [] # define a list of potential next moves the path could take
-		for new_position in [[0, -1], [0, 1], [-1, 0], [1, 0], [-1, -1], [-1, 1], [1, -1], [1, 1]]: # the path can either go up/down, left/right, or in any of the 4 diagonal directions
-			node_position = [current_node[0][0] + new_position[0], current_node[0][1] + new_position[1]] # this is full list of potential possible next moves in the path
-			# check if moving to this position puts the path off the maze
-			if node_position[0] > (len(maze) - 1) or node_position[0] < 0 or node_position[1] > (len(maze[len(maze)-1]) -1) or node_position[1] < 0:
-				continue # if moving to this position puts us off the maze, skip it
-			# check if moving to this position is blocked
-			if maze[node_position[0]][node_position[1]] != 0:
-				continue # if moving to this position is blocked, skip it
-			new_node = create_node(node_position) # if this potnential next position is on the maze and not blocked, create a node for it
-			next_moves.append(new_node) # add the node we just created to a list of potential moves we can make next in the maze
-		random_next_move = choice(next_moves) # make a random guess on where to move next along the path in the maze -> not implementing A* b/c we are randomly moving forward instead of moving forward in the optimal way
-		on_path.append(random_next_move) # append the on_path list to include the new random position
-		current_node = on_path[-1] # update the current node to the last node in the path
-		path.append(current_node[0]) # update the path with the new node's x,y position
+	while current_cell != end_cell: # break the loop if the path finds the end of the maze
+		if max_steps is not None and len(path) > max_steps:
+			break # the walk ran out of steps before it found the end of the maze
+		# the path can either go up/down, left/right, or in any of the 4 diagonal directions, as long as the move stays on the maze and is not blocked
+		codes = mask_codes[masks[current_cell]]
+		current_cell += offsets[codes[randrange(len(codes))]] # make a random guess on where to move next along the path in the maze -> not implementing A* b/c we are randomly moving forward instead of moving forward in the optimal way
+		path.append(table.position(current_cell)) # update the path with the new node's x,y position
 	return path
 
-def visualize_path(maze, path):
+def create_valid_moves(grid):
+	'''
+	create a mask of the valid moves of every cell of the maze: valid[cell][i] is True if moves[i] from the cell stays on the maze and is not blocked
+	cells are indexed by the flat cell index x * height + y, blocked cells have no valid moves
+	'''
+	return grid.valid_moves()
+
+def create_move_table(grid, valid=None):
+	'''
+	create the valid moves of every cell of the maze, indexed by the flat cell index x * height + y
+	counts[cell] is how many moves the cell has and table[cell][:counts[cell]] are their indices into moves (in the order of grid.children())
+	'''
+	if valid is None:
+		valid = create_valid_moves(grid)
+	counts = valid.sum(axis=1).astype(int8)
+	table = argsort(~valid, axis=1, kind='stable').astype(int8) # the valid moves of each cell first, in the order of moves
+	return counts, table
+
+def create_step_table(offsets):
+	'''
+	create the table create_paths() moves its walkers with: step_table[mask << 8 | byte] is the flat index offset of the move
+	a random byte picks for a cell with that move mask (see maze_grid.NeighbourTable), offsets are the flat index offsets of the moves
+	byte b picks move b % count of the mask's count moves, so every move is equally likely like create_path(),
+	the bytes from the last multiple of count up are rejected and drawn again (at most 4 in 256), and a cell with no moves stays put
+	'''
+	counts = maximum(mask_counts, 1)[:, None]
+	picks = arange(256) % counts
+	steps = asarray(offsets, dtype=int64)[mask_moves]
+	steps[mask_counts == 0] = 0
+	return where(arange(256) < 256 - 256 % counts, take_along_axis(steps, picks, axis=1), rejected).reshape(-1)
+
+def hitting_time_stats(times):
+	'''
+	summarize the hitting times of a swarm of walks (-1 means the walk never reached the end)
+	'''
+	reached = times[times >= 0]
+	stats = {'walkers': len(times), 'reached': len(reached), 'hit_rate': len(reached) / len(times) if len(times) else 0.0}
+	if len(reached):
+		stats.update({'mean': float(reached.mean()), 'std': float(reached.std()), 'min': int(reached.min()), 'median': float(median(reached)), 'p90': float(percentile(reached, 90)), 'max': int(reached.max())})
+	return stats
+
+def create_paths(grid, start_node, end_node, walkers, max_steps, seed=None, return_walks=False):
+	'''
+	run walkers random walks from start_node at once, each takes up to max_steps steps of create_path() and stops when it hits end_node
+	every step moves all walkers that are still walking with a few numpy operations instead of a python loop per walker:
+	one random byte per walker and one lookup in the step table of create_step_table()
+	returns the hitting time of every walker (the number of steps it took to reach the end_node, -1 if it didn't) and hitting_time_stats() of them
+	return_walks=True also returns the walks as an array of shape (max_steps + 1, walkers, 2), walkers that hit the end_node stay on it
+	'''
+	table = grid.neighbour_table()
+	step_table = create_step_table(table.offsets)
+	height = table.height
+	rng = default_rng(seed)
+	start = start_node[0] * height + start_node[1]
+	end = end_node[0] * height + end_node[1]
+	times = full(walkers, -1, dtype=int64)
+	walking = empty(0, dtype=int64) if start == end or table.masks_view[start] == 0 else full(walkers, start, dtype=int64) # flat cell index of every walker that is still walking
+	ids = asarray(range(walkers), dtype=int64) # which walker each entry of walking is
+	if start == end:
+		times[:] = 0
+	walks = None
+	if return_walks:
+		walks = full((max_steps + 1, walkers), end if start == end else start, dtype=int64)
+	for step in range(1, max_steps + 1):
+		if not len(walking):
+			break
+		picks = table.masks_of(walking).astype(intp) << 8
+		picks |= frombuffer(rng.bytes(len(picks)), dtype=uint8) # pick one of the free neighbours of each cell, uniformly like create_path()
+		steps = step_table[picks]
+		redraw = flatnonzero(steps == rejected)
+		while len(redraw):
+			picks[redraw] = (picks[redraw] & ~255) | frombuffer(rng.bytes(len(redraw)), dtype=uint8)
+			steps[redraw] = step_table[picks[redraw]]
+			redraw = redraw[steps[redraw] == rejected]
+		walking += steps
+		if walks is not None:
+			walks[step] = walks[step - 1]
+			walks[step, ids] = walking
+		hit = walking == end
+		if hit.any():
+			times[ids[hit]] = step
+			walking = walking[~hit]
+			ids = ids[~hit]
+	stats = hitting_time_stats(times)
+	if walks is not None:
+		return times, stats, stack([walks // height, walks % height], axis=-1)
+	return times, stats
+
+def visualize_path(grid, path):
 	'''
 	visualize the maze path by printing the path to the screen
 	'''
+	maze = grid.to_maze()
 	for node in path:
 		maze[node[0]][node[1]] = '>' # use the ge character to show the path 
 	for i in maze:
@@ -76,7 +168,22 @@ def visualize_path(maze, path):
 # visualize the solution
 ########################
 
-path = create_path(maze, start_node, end_node)
-print(path)
-visualize_path(maze, path)
+if __name__ == '__main__':
+	path = create_path(grid, start_node, end_node)
+	print(path)
+	visualize_path(grid, path)
+	# estimate the hitting time with a swarm of walks and compare its steps per second with looping over create_path()
+	from time import perf_counter
+	walkers = 100000
+	max_steps = 10000
+	start_time = perf_counter()
+	times, stats = create_paths(grid, start_node, end_node, walkers, max_steps, seed=0)
+	swarm_time = perf_counter() - start_time
+	print(stats)
+	start_time = perf_counter()
+	loop_times = [len(create_path(grid, start_node, end_node)) - 1 for i in range(walkers // 100)]
+	loop_time = perf_counter() - start_time
+	swarm_rate = where(times >= 0, times, max_steps).sum() / swarm_time
+	loop_rate = sum(loop_times) / loop_time
+	print('mean hitting time {:.1f} (create_path() loop: {:.1f}), {} walks in {:.3f} s, {:.1f}M steps/s against {:.2f}M steps/s for create_path(): {:.0f}x faster'.format(stats['mean'], sum(loop_times) / len(loop_times), walkers, swarm_time, swarm_rate / 1e6, loop_rate / 1e6, swarm_rate / loop_rate))
 
@@ -1,155 +1,160 @@
-########## astar_maze_path.py ##########
-
-'''
-
-- todo
-
-'''
-
-#########
-# imports
-#########
-
-from math import sqrt
-from random import choice
-
-####################
-# initial conditions
-####################
-
-maze = [[0, 0, 0, 0, 1, 0], 
-		[0, 0, 1, 1, 1, 0],
-		[0, 1, 0, 0, 1, 0],
-		[0, 1, 0, 0, 1, 0],
-		[0, 0, 1, 1, 1, 0],
-		[0, 0, 0, 0, 0, 0]]
-start_node = [2, 3] # define where the maze starts
-end_node = [0, 5] # define where the maze ends
-start_g = 0.0; start_h = 0.0; start_f = 0.0 # initialize A* parameters
-population_size = 1 # define how many initial guesses at paths that the algorithm will take
-elite_size = 1 # define how many paths from the population will automatically make the next generation
-mutation_rate = 0.01 # define the chance to remove the path and create a new one
-generations = 1 # define how many generations of paths the algorithm will analyze
-
-######################
-# define the algorithm
-######################
-
-def create_node(position, g, h, f):
-	'''
-	- create a node as a location on the maze with corresponding g, h, and f values
-	'''
-	return [position, g, h, f]
-
-def create_optimal_path(maze, start_node, end_node, g, h, f):
-	'''
-	- create the optimal path around the maze from node to node
-	- if the optimal path is blocked, the path ends at the block
-	'''
-	on_path = [] # define which full nodes are on the path
-	path = [] # define the node x,y positions the algorithm takes to solve the maze
-	current_node = create_node(start_node, start_g, start_h, start_f) # define the current node of the path as the start_node
-	on_path.append(current_node) # add the start_node to the on_path list
-	path.append(current_node[0]) # add the start_node x,y position to the path
-	# define the path through the maze
-	while current_node[0] != end_node: # break the loop if the path finds the end of the maze
-		next_moves = [] # define a list of potential next moves the path could take
-		for new_position in [[0, -1], [0, 1], [-1, 0], [1, 0], [-1, -1], [-1, 1], [1, -1], [1, 1]]: # the path can either go up/down, left/right, or in any of the 4 diagonal directions
-			node_position = [current_node[0][0] + new_position[0], current_node[0][1] + new_position[1]] # this is full list of potential possible next moves in the path
-			# check if moving to this position puts the path off the maze
-			if node_position[0] > (len(maze) - 1) or node_position[0] < 0 or node_position[1] > (len(maze[len(maze)-1]) -1) or node_position[1] < 0:
-				continue # if moving to this position puts us off the maze, skip it
-			# check if moving to this position is blocked
-			if maze[node_position[0]][node_position[1]] != 0:
-				continue # if moving to this position is blocked, skip it
-			new_node = create_node(node_position, start_g, start_h, start_f) # if this potnential next position is on the maze and not blocked, create a node for it
-			next_moves.append(new_node) # add the node we just created to a list of potential moves we can make next in the maze
-		for node in next_moves:
-			if node[0] in path: # check if the potential node is on the path already
-				continue # if this node is already in the path, skip it (avoid cycling b/w the same nodes over and over again)
-			# create g, h, f values for each potential node
-			if node[0][0] == current_node[0][0] or node[0][1] == current_node[0][1]:
-				node[1] = current_node[1] + 1
-			else:
-				node[1] = current_node[1] + sqrt(2)
-			node[2] = (node[0][0] - end_node[0])**2 + (node[0][1] - end_node[1])**2 # h = the distance b/w the current node and the end_node
-			node[3] = node[1] + node[2] # f = g + h
-		# delete potential nodes that are already in the path (https://stackoverflow.com/questions/1207406/how-to-remove-items-from-a-list-while-iterating)
-		next_moves = [node for node in next_moves if not node[1] == 0]
-		if not next_moves: # check if there are no potential next moves (the path is stuck in the maze and has failed)
-			break # break the while loop. the path is stuck and didn't reach the end_goal, resulting in an epic fail
-		next_moves.sort(key=lambda x: x[-1]) # sort the next moves by f score
-		best_next_move = next_moves[0] # ensure that the next move incorporates the lowest f score
-		if best_next_move[-1] > on_path[-1][-1] and on_path[-1][-1] != 0: # check if the next move results in a decreased f score
-			break
-		on_path.append(best_next_move) # append the on_path list to include the new random position
-		current_node = on_path[-1] # update the current node to the last node in the path
-		path.append(current_node[0]) # update the path with the new node's x,y position
-	return on_path
-
-
-def mutate_path(maze, node):
-	on_path = [] # define which full nodes are on the path
-	path = [] # define the node x,y positions the algorithm takes to solve the maze
-	current_node = node # define the current node of the path as the start_node
-	on_path.append(current_node) # add the start_node to the on_path list
-	path.append(current_node[0]) # add the start_node x,y position to the path
-	# define the path through the maze
-	next_moves = [] # define a list of potential next moves the path could take
-	for new_position in [[0, -1], [0, 1], [-1, 0], [1, 0], [-1, -1], [-1, 1], [1, -1], [1, 1]]: # the path can either go up/down, left/right, or in any of the 4 diagonal directions
-		node_position = [current_node[0][0] + new_position[0], current_node[0][1] + new_position[1]] # this is full list of potential possible next moves in the path
-		# check if moving to this position puts the path off the maze
-		if node_position[0] > (len(maze) - 1) or node_position[0] < 0 or node_position[1] > (len(maze[len(maze)-1]) -1) or node_position[1] < 0:
-			continue # if moving to this position puts us off the maze, skip it
-		# check if moving to this position is blocked
-		if maze[node_position[0]][node_position[1]] != 0:
-			continue # if moving to this position is blocked, skip it
-		new_node = create_node(node_position, start_g, start_h, start_f) # if this potnential next position is on the maze and not blocked, create a node for it
-		next_moves.append(new_node) # add the node we just created to a list of potential moves we can make next in the maze
-	for node in next_moves:
-		if node[0] in path: # check if the potential node is on the path already
-			continue # if this node is already in the path, skip it (avoid cycling b/w the same nodes over and over again)
-		# create g, h, f values for each potential node
-		node[1] = current_node[1] + 1 # g = the current step in the path (ex: for path[0], g = 0. for path[1], g = 1. for path[2], g = 2.....)
-		node[2] = (node[0][0] - end_node[0])**2 + (node[0][1] - end_node[1])**2 # h = the distance b/w the current node and the end_node
-		node[3] = node[1] + node[2] # f = g + h
-	# delete potential nodes that are already in the path (https://stackoverflow.com/questions/1207406/how-to-remove-items-from-a-list-while-iterating)
-	next_moves = [node for node in next_moves if not node[1] == 0]
-	sub_optimal_move = choice(next_moves)
-	on_path.append(sub_optimal_move) # append the on_path list to include the new random position
-	current_node = on_path[-1] # update the current node to the last node in the path
-	path.append(current_node[0]) # update the path with the new node's x,y position
-	return on_path
-
-def create_full_path():
-	'''
-	- create a full path by first analyzing an optimal path, then mutating it until any blocks in the maze are navigated
-	'''
-	optimal_path = create_optimal_path(maze, start_node, end_node, start_g, start_h, start_f)
-	path = [optimal_path[0][0]]
-	while optimal_path[-1][0] != end_node:
-		suboptimal_step = mutate_path(maze, optimal_path[0])
-		optimal_path = create_optimal_path(maze, suboptimal_step[-1][0], end_node, suboptimal_step[-1][1], suboptimal_step[-1][2], suboptimal_step[-1][-1])
-		path.append(optimal_path[0][0])
-	path.pop(-1)
-	for i in optimal_path:
-		path.append(i[0])
-	return path
-
-def visualize_path(maze, path):
-	'''
-	- visualize the maze path by printing the path to the screen
-	'''
-	for node in path:
-		maze[node[0]][node[1]] = '>' # use the ge character to show the path 
-	for i in maze:
-		print(*i) # print the maze showing the path we took
-
-########################
-# visualize the solution
-########################
-
-path = create_full_path()
-print(path)
-visualize_path(maze, path)
-
+########## astar_maze_path.py ##########
+
+'''
+
+- todo
+
+'''
+
+#########
+# imports
+#########
+
+from random import randrange
+from maze_grid import MazeGrid, mask_codes, move_costs
+from path_nodes import NodePath
+from search_stats import walk_stats
+from maze_path_ga import genetic_algorithm
+
+####################
+# initial conditions
+####################
+
+maze = [[0, 0, 0, 0, 1, 0], 
+		[0, 0, 1, 1, 1, 0],
+		[0, 1, 0, 0, 1, 0],
+		[0, 1, 0, 0, 1, 0],
+		[0, 0, 1, 1, 1, 0],
+		[0, 0, 0, 0, 0, 0]]
+grid = MazeGrid.from_maze(maze) # define the occupancy grid the path searches
+start_node = (2, 3) # define where the maze starts
+end_node = (0, 5) # define where the maze ends
+start_g = 0.0; start_h = 0.0; start_f = 0.0 # initialize A* parameters
+population_size = 1000 # define how many initial guesses at paths that the algorithm will take
+elite_size = 100 # define how many paths from the population will automatically make the next generation
+mutation_rate = 0.01 # define the chance that each move of a path is replaced by a random move
+generations = 300 # define how many generations of paths the algorithm will analyze
+
+######################
+# define the algorithm
+######################
+
+def create_node(position, g, h, f):
+	'''
+	- create a node as a location on the maze with corresponding g, h, and f values
+	'''
+	return [position, g, h, f]
+
+def create_optimal_path(grid, start_node, end_node, g, h, f, stats=None):
+	'''
+	- create the optimal path around the maze from node to node
+	- if the optimal path is blocked, the path ends at the block
+	- if stats is a dict, the per-step counters of the walk are written to it (see search_stats.walk_stats())
+	- the nodes are returned as a NodePath, nodes[i] is the [position, g, h, f] node i like create_node()
+	'''
+	nodes = NodePath() # define the full nodes on the path, stored once in a compact array (see path_nodes.py)
+	nodes.append(start_node, start_g, start_h, start_f) # add the start_node to the path
+	current_position = start_node; current_g = start_g; current_f = start_f # the current node of the path, g and f stay python floats so the float32 copies in nodes can't change a step
+	visited = set() # define the flat cells of the nodes on the path, so checking if a node is on the path doesn't search the whole path
+	table = grid.neighbour_table() # the free neighbours of every cell of the maze and their move costs, compiled once per maze
+	masks = table.masks_view
+	offsets = table.offsets
+	height = table.height
+	current_cell = table.cell(current_position)
+	visited.add(current_cell)
+	# define the path through the maze
+	while current_position != end_node: # break the loop if the path finds the end of the maze
+		best_cell = -1 # define the best potential next move the path could take (-1 until one is found)
+		best_g = best_h = best_f = 0
+		for code in mask_codes[masks[current_cell]]: # the path can either go up/down, left/right, or in any of the 4 diagonal directions, as long as the move stays on the maze and is not blocked
+			cell = current_cell + offsets[code]
+			if cell in visited: # check if the potential node is on the path already
+				continue # if this node is already in the path, skip it (avoid cycling b/w the same nodes over and over again)
+			# create g, h, f values for each potential node
+			g = current_g + move_costs[code] # 1 for up/down or left/right and sqrt(2) for a diagonal move
+			x = cell // height
+			h = (x - end_node[0])**2 + (cell - x * height - end_node[1])**2 # h = the distance b/w the current node and the end_node
+			f = g + h # f = g + h
+			if best_cell < 0 or f < best_f: # keep the potential node with the lowest f score (the first one if there is a tie)
+				best_cell = cell; best_g = g; best_h = h; best_f = f
+		if best_cell < 0: # check if there are no potential next moves (the path is stuck in the maze and has failed)
+			break # break the while loop. the path is stuck and didn't reach the end_goal, resulting in an epic fail
+		if best_f > current_f and current_f != 0: # check if the next move results in a decreased f score
+			break
+		current_position = table.position(best_cell) # the next move is the one with the lowest f score
+		nodes.append(current_position, best_g, best_h, best_f) # add the new node to the path
+		current_g = best_g; current_f = best_f
+		current_cell = best_cell
+		visited.add(current_cell)
+	if stats is not None:
+		walk_stats(grid, nodes.positions(), end_node, stats)
+	return nodes
+
+
+def mutate_path(grid, node, end_node=end_node):
+	nodes = NodePath(2) # define the full nodes on the path, the node and one random move (see path_nodes.py)
+	nodes.append(*node) # add the [position, g, h, f] node to the path
+	# define the path through the maze
+	table = grid.neighbour_table() # the free neighbours of every cell of the maze, compiled once per maze
+	current_cell = table.cell(node[0])
+	# the path can either go up/down, left/right, or in any of the 4 diagonal directions, as long as the move stays on the maze and is not blocked
+	# none of the neighbours are on the path yet (it only holds the current node), so any of them can be the random next move
+	codes = mask_codes[table.masks_view[current_cell]]
+	x, y = table.position(current_cell + table.offsets[codes[randrange(len(codes))]])
+	# create g, h, f values for the random next move
+	g = node[1] + 1 # g = the current step in the path (ex: for path[0], g = 0. for path[1], g = 1. for path[2], g = 2.....)
+	h = (x - end_node[0])**2 + (y - end_node[1])**2 # h = the distance b/w the current node and the end_node
+	nodes.append((x, y), g, h, g + h) # f = g + h
+	return nodes
+
+def create_full_path(grid=grid, start_node=start_node, end_node=end_node, max_mutations=None):
+	'''
+	- create a full path by first analyzing an optimal path, then mutating it until any blocks in the maze are navigated
+	- max_mutations (optional) gives up after that many mutations, the path then ends where the last optimal path got stuck
+	'''
+	optimal_path = create_optimal_path(grid, start_node, end_node, start_g, start_h, start_f)
+	path = [optimal_path[0][0]]
+	while optimal_path[-1][0] != end_node:
+		if max_mutations is not None and len(path) > max_mutations:
+			break # too many mutations, give up on reaching the end of the maze
+		suboptimal_step = mutate_path(grid, optimal_path[0], end_node)
+		optimal_path = create_optimal_path(grid, suboptimal_step[-1][0], end_node, suboptimal_step[-1][1], suboptimal_step[-1][2], suboptimal_step[-1][-1])
+		path.append(optimal_path[0][0])
+	path.pop(-1)
+	path.extend(optimal_path.positions())
+	return path
+
+def create_population_path(grid=grid, start_node=start_node, end_node=end_node, processes=None, stats=None):
+	'''
+	- evolve a population of paths with the genetic algorithm in maze_path_ga.py, driven by population_size, elite_size, mutation_rate and generations
+	- a move into a block is mutated into a random valid move, like mutate_path()
+	- processes > 1 evaluates the population on a process pool, stats (optional) is filled in by genetic_algorithm()
+	'''
+	return genetic_algorithm(grid, start_node, end_node, population_size, elite_size, mutation_rate, generations, 'mutate', processes=processes, stats=stats)
+
+def visualize_path(grid, path):
+	'''
+	- visualize the maze path by printing the path to the screen
+	'''
+	maze = grid.to_maze()
+	for node in path:
+		maze[node[0]][node[1]] = '>' # use the ge character to show the path 
+	for i in maze:
+		print(*i) # print the maze showing the path we took
+
+########################
+# visualize the solution
+########################
+
+if __name__ == '__main__':
+	path = create_full_path()
+	print(path)
+	visualize_path(grid, path)
+	# evolve a population of paths and compare it with astar()
+	from astar_maze_path_plot import astar
+	from jps_benchmark import path_cost
+	stats = {}
+	path = create_population_path(stats=stats)
+	print(path)
+	visualize_path(grid, path)
+	print('reached the end: {}, cost {:.3f} (astar(): {:.3f})'.format(stats['reached'], stats['cost'], path_cost(astar(start_node, end_node, grid))))
@@ -0,0 +1,329 @@
+########## hierarchical_astar.py ##########
+
+'''
+
+- This script implements hierarchical path finding (HPA*) for mazes too big for a flat astar() search
+- The maze is split into square clusters, entrances between neighbouring clusters become transition nodes, and the cost between the transitions of a cluster is precomputed once
+- A query searches the small abstract graph of transitions and then refines only the clusters the abstract path passes through
+- Paths are close to optimal but not guaranteed optimal, since they are forced through the transition nodes
+
+'''
+
+#########
+# imports
+#########
+
+from heapq import heappush, heappop
+from math import sqrt
+from numpy import arange, concatenate, full, isinf, nonzero
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from astar_maze_path_plot import create_h, start, end, grid
+from maze_grid import moves
+
+####################
+# initial conditions
+####################
+
+cluster_size = 32 # define the side length of a cluster
+max_single_entrance = 6 # entrances shorter than this get one transition in the middle, longer ones get a transition at each end
+
+#####################
+# define the clusters
+#####################
+
+def entrance_runs(mask):
+	'''
+	- return (first, last) index pairs of every run of True values in a 1d boolean array
+	'''
+	padded = concatenate(([False], mask, [False]))
+	edges = nonzero(padded[1:] != padded[:-1])[0]
+	return [(int(edges[i]), int(edges[i + 1]) - 1) for i in range(0, len(edges), 2)]
+
+class HierarchicalMaze:
+	'''
+	- abstract graph of a maze grid for HPA* queries
+	- border_pairs maps a pair of neighbouring clusters to the (cell, cell, cost) moves that cross between them at a transition
+	- intra_edges maps a cluster to the costs between its transitions, inter_edges maps a transition to the transitions across its borders
+	- edit the maze through set_blocked() so only the clusters touching the edited cell are rebuilt
+	'''
+
+	def __init__(self, grid=grid, cluster_size=cluster_size):
+		self.grid = grid
+		self.cluster_size = cluster_size
+		self.clusters_x = -(-grid.width // cluster_size)
+		self.clusters_y = -(-grid.height // cluster_size)
+		self.border_pairs = {}
+		self.inter_edges = {}
+		self.intra_edges = {}
+		self.rebuilt = 0 # number of clusters whose intra edges have been computed
+		for cluster_x in range(self.clusters_x):
+			for cluster_y in range(self.clusters_y):
+				for other in [(cluster_x + 1, cluster_y), (cluster_x, cluster_y + 1), (cluster_x + 1, cluster_y + 1), (cluster_x + 1, cluster_y - 1)]:
+					self.build_border((cluster_x, cluster_y), other)
+		for cluster_x in range(self.clusters_x):
+			for cluster_y in range(self.clusters_y):
+				self.build_intra_edges((cluster_x, cluster_y))
+
+	def cluster_of(self, position):
+		'''
+		- return the cluster that a cell belongs to
+		'''
+		return (position[0] // self.cluster_size, position[1] // self.cluster_size)
+
+	def cluster_bounds(self, cluster):
+		'''
+		- return the cells covered by a cluster as x0, x1, y0, y1 (x1 and y1 exclusive)
+		'''
+		x0 = cluster[0] * self.cluster_size
+		y0 = cluster[1] * self.cluster_size
+		return x0, min(x0 + self.cluster_size, self.grid.width), y0, min(y0 + self.cluster_size, self.grid.height)
+
+	def neighbour_clusters(self, cluster):
+		'''
+		- return the up to 8 clusters around a cluster
+		'''
+		neighbours = []
+		for move in moves:
+			other = (cluster[0] + move[0], cluster[1] + move[1])
+			if 0 <= other[0] < self.clusters_x and 0 <= other[1] < self.clusters_y:
+				neighbours.append(other)
+		return neighbours
+
+	def find_border_pairs(self, cluster, other):
+		'''
+		- return the (cell, cell, cost) moves from cluster into other that are used as transitions
+		- each run of free cells facing each other across a side border is one entrance, diagonal crossings are kept only where a straight crossing doesn't already cover a cell
+		'''
+		cells = self.grid.cells
+		dx = other[0] - cluster[0]
+		dy = other[1] - cluster[1]
+		if dx != 0 and dy != 0:
+			# the corner where four clusters meet: one diagonal move
+			x = other[0] * self.cluster_size if dx > 0 else cluster[0] * self.cluster_size
+			y = other[1] * self.cluster_size if dy > 0 else cluster[1] * self.cluster_size
+			a = (x - 1, y - 1) if dy > 0 else (x - 1, y)
+			b = (x, y) if dy > 0 else (x, y - 1)
+			if not self.grid.is_blocked(a) and not self.grid.is_blocked(b):
+				return [(a, b, sqrt(2))]
+			return []
+		x0, x1, y0, y1 = self.cluster_bounds(cluster)
+		if dx != 0:
+			# a border of constant x: cells (x1 - 1, y) face (x1, y)
+			side_a = cells[x1 - 1, y0:y1] == 0
+			side_b = cells[x1, y0:y1] == 0
+			cell_a = lambda i: (x1 - 1, y0 + i)
+			cell_b = lambda i: (x1, y0 + i)
+		else:
+			# a border of constant y: cells (x, y1 - 1) face (x, y1)
+			side_a = cells[x0:x1, y1 - 1] == 0
+			side_b = cells[x0:x1, y1] == 0
+			cell_a = lambda i: (x0 + i, y1 - 1)
+			cell_b = lambda i: (x0 + i, y1)
+		straight = side_a & side_b
+		pairs = []
+		for first, last in entrance_runs(straight):
+			if last - first + 1 < max_single_entrance:
+				middle = (first + last) // 2
+				pairs.append((cell_a(middle), cell_b(middle), 1))
+			else:
+				pairs.append((cell_a(first), cell_b(first), 1))
+				pairs.append((cell_a(last), cell_b(last), 1))
+		for i in range(len(straight) - 1):
+			if side_a[i] and side_b[i + 1] and not (straight[i] and straight[i + 1]):
+				pairs.append((cell_a(i), cell_b(i + 1), sqrt(2)))
+			if side_a[i + 1] and side_b[i] and not (straight[i + 1] and straight[i]):
+				pairs.append((cell_a(i + 1), cell_b(i), sqrt(2)))
+		return pairs
+
+	def build_border(self, cluster, other):
+		'''
+		- recompute the transitions between two neighbouring clusters and the inter edges that cross between them
+		'''
+		if not (0 <= other[0] < self.clusters_x and 0 <= other[1] < self.clusters_y):
+			return
+		key = (min(cluster, other), max(cluster, other))
+		for a, b, cost in self.border_pairs.pop(key, []):
+			self.inter_edges[a].pop(b, None)
+			self.inter_edges[b].pop(a, None)
+		pairs = self.find_border_pairs(key[0], key[1])
+		if pairs:
+			self.border_pairs[key] = pairs
+		for a, b, cost in pairs:
+			self.inter_edges.setdefault(a, {})[b] = cost
+			self.inter_edges.setdefault(b, {})[a] = cost
+
+	def transitions(self, cluster):
+		'''
+		- return the transition cells inside a cluster
+		'''
+		nodes = set()
+		for other in self.neighbour_clusters(cluster):
+			for a, b, cost in self.border_pairs.get((min(cluster, other), max(cluster, other)), []):
+				nodes.add(a if self.cluster_of(a) == cluster else b)
+		return sorted(nodes)
+
+	def cluster_graph(self, cluster):
+		'''
+		- return the cells of a cluster as a sparse graph of moves that stay inside the cluster, with its bounds
+		'''
+		x0, x1, y0, y1 = self.cluster_bounds(cluster)
+		free = self.grid.cells[x0:x1, y0:y1] == 0
+		width = x1 - x0
+		height = y1 - y0
+		index = arange(width * height).reshape(width, height)
+		rows = []
+		columns = []
+		costs = []
+		for move in moves:
+			source = (slice(max(0, -move[0]), width - max(0, move[0])), slice(max(0, -move[1]), height - max(0, move[1])))
+			target = (slice(max(0, move[0]), width - max(0, -move[0])), slice(max(0, move[1]), height - max(0, -move[1])))
+			allowed = free[source] & free[target]
+			rows.append(index[source][allowed])
+			columns.append(index[target][allowed])
+			costs.append(full(allowed.sum(), 1.0 if move[0] == 0 or move[1] == 0 else sqrt(2)))
+		graph = csr_matrix((concatenate(costs), (concatenate(rows), concatenate(columns))), shape=(width * height, width * height))
+		return graph, (x0, y0, height)
+
+	def cluster_distances(self, cluster, sources, return_predecessors=False):
+		'''
+		- run Dijkstra inside a cluster from each source cell, returning the costs to every cell of the cluster
+		'''
+		graph, (x0, y0, height) = self.cluster_graph(cluster)
+		indices = [(source[0] - x0) * height + (source[1] - y0) for source in sources]
+		return dijkstra(graph, indices=indices, return_predecessors=return_predecessors), (x0, y0, height)
+
+	def build_intra_edges(self, cluster):
+		'''
+		- compute the cost between every pair of transitions in a cluster that can reach each other inside it
+		'''
+		nodes = self.transitions(cluster)
+		self.intra_edges[cluster] = {}
+		self.rebuilt += 1
+		if not nodes:
+			return
+		distances, (x0, y0, height) = self.cluster_distances(cluster, nodes)
+		targets = [(node[0] - x0) * height + (node[1] - y0) for node in nodes]
+		for i, node in enumerate(nodes):
+			edges = {}
+			for j, other in enumerate(nodes):
+				if i != j and not isinf(distances[i, targets[j]]):
+					edges[other] = float(distances[i, targets[j]])
+			self.intra_edges[cluster][node] = edges
+
+	def set_blocked(self, position, blocked=True):
+		'''
+		- block or free a cell and rebuild only the clusters it affects
+		- a cell inside a cluster only changes that cluster's intra edges, a cell on a cluster border also changes the transitions shared with the neighbouring clusters
+		'''
+		self.grid.set_blocked(position, blocked)
+		cluster = self.cluster_of(position)
+		x0, x1, y0, y1 = self.cluster_bounds(cluster)
+		if x0 < position[0] < x1 - 1 and y0 < position[1] < y1 - 1:
+			self.build_intra_edges(cluster)
+			return
+		for other in self.neighbour_clusters(cluster):
+			self.build_border(cluster, other)
+		self.build_intra_edges(cluster)
+		for other in self.neighbour_clusters(cluster):
+			self.build_intra_edges(other)
+
+	def local_path(self, cluster, a, b):
+		'''
+		- refine an abstract edge: return the cells of the lowest cost path from a to b inside a cluster
+		'''
+		(distances, predecessors), (x0, y0, height) = self.cluster_distances(cluster, [a], return_predecessors=True)
+		source = (a[0] - x0) * height + (a[1] - y0)
+		index = (b[0] - x0) * height + (b[1] - y0)
+		path = []
+		while index != source:
+			path.append((x0 + index // height, y0 + index % height))
+			index = int(predecessors[0, index])
+		path.append(a)
+		path.reverse()
+		return path
+
+	def connect(self, node):
+		'''
+		- return temporary edges from a query cell to the transitions of its cluster
+		'''
+		cluster = self.cluster_of(node)
+		nodes = self.transitions(cluster)
+		distances, (x0, y0, height) = self.cluster_distances(cluster, [node])
+		edges = {}
+		for other in nodes:
+			cost = distances[0, (other[0] - x0) * height + (other[1] - y0)]
+			if other != node and not isinf(cost):
+				edges[other] = float(cost)
+		return edges
+
+	def path(self, start, end, stats=None):
+		'''
+		- find a path from start to end by searching the abstract graph and refining the clusters it passes through
+		- pass a dict as stats to have the abstract nodes expanded and clusters refined written to it
+		'''
+		if self.grid.is_blocked(start) or self.grid.is_blocked(end):
+			return None
+		# insert the start and end into the abstract graph
+		extra = {start: self.connect(start), end: {}}
+		for other, cost in self.connect(end).items():
+			extra.setdefault(other, {})[end] = cost
+		if self.cluster_of(start) == self.cluster_of(end):
+			distances, (x0, y0, height) = self.cluster_distances(self.cluster_of(start), [start])
+			cost = distances[0, (end[0] - x0) * height + (end[1] - y0)]
+			if not isinf(cost):
+				extra[start][end] = float(cost)
+		# search the abstract graph
+		g = {start: 0}
+		h = create_h(start, end)
+		open_list = [(h, h, start)]
+		closed_list = set()
+		parent = {}
+		expanded = 0
+		while open_list:
+			current_f, current_h, current_node = heappop(open_list)
+			if current_node in closed_list:
+				continue
+			if current_node == end:
+				break
+			closed_list.add(current_node)
+			expanded += 1
+			cluster = self.cluster_of(current_node)
+			for edges in (self.intra_edges[cluster].get(current_node, {}), self.inter_edges.get(current_node, {}), extra.get(current_node, {})):
+				for child, cost in edges.items():
+					if child in closed_list:
+						continue
+					candidates_g = g[current_node] + cost
+					if child in g and candidates_g >= g[child]:
+						continue
+					parent[child] = current_node
+					g[child] = candidates_g
+					h = create_h(child, end)
+					heappush(open_list, (candidates_g + h, h, child))
+		if end not in g:
+			return None
+		abstract_path = [end]
+		while abstract_path[-1] in parent:
+			abstract_path.append(parent[abstract_path[-1]])
+		abstract_path.reverse()
+		# refine each abstract edge into cells
+		path = [start]
+		refined = 0
+		for a, b in zip(abstract_path, abstract_path[1:]):
+			if self.cluster_of(a) != self.cluster_of(b):
+				path.append(b) # an inter edge is a single move across a border
+			else:
+				path.extend(self.local_path(self.cluster_of(a), a, b)[1:])
+				refined += 1
+		if stats is not None:
+			stats['abstract_expanded'] = expanded
+			stats['refined_clusters'] = refined
+		return path
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	hierarchy = HierarchicalMaze(grid, cluster_size=4)
+	print(hierarchy.path(start, end))
@@ -0,0 +1,87 @@
+########## hierarchical_benchmark.py ##########
+
+'''
+
+- This script compares HPA* queries against flat astar() queries on a large rooms maze
+- It reports the one time build cost, the query speedup, the path length overhead against the optimal astar() path, and the cost of rebuilding after a wall changes
+- usage: python hierarchical_benchmark.py [size] [queries]
+
+'''
+
+#########
+# imports
+#########
+
+from random import Random
+from sys import argv
+from time import perf_counter
+from astar_maze_path_plot import astar
+from hierarchical_astar import HierarchicalMaze
+from jps_benchmark import path_cost
+from maze_generator import rooms_maze
+
+####################
+# initial conditions
+####################
+
+size = 2048 # define the side length of the benchmark maze
+queries = 20 # define how many random (start, end) queries to run
+cluster_size = 32
+seed = 0
+
+######################
+# define the benchmark
+######################
+
+def random_free_cell(grid, rng):
+	'''
+	- pick a random free cell of the maze
+	'''
+	while True:
+		cell = (rng.randrange(grid.width), rng.randrange(grid.height))
+		if not grid.is_blocked(cell):
+			return cell
+
+def benchmark(size, queries):
+	'''
+	- build the hierarchy once, then time random queries with both searches and a few wall edits
+	'''
+	rng = Random(seed)
+	grid = rooms_maze(size, room_size=64, seed=seed)
+	start_time = perf_counter()
+	hierarchy = HierarchicalMaze(grid, cluster_size)
+	print('build: {:.3f} s for {} clusters'.format(perf_counter() - start_time, hierarchy.rebuilt))
+	total_hierarchical = 0
+	total_flat = 0
+	overheads = []
+	for i in range(queries):
+		start = random_free_cell(grid, rng)
+		end = random_free_cell(grid, rng)
+		start_time = perf_counter()
+		path = hierarchy.path(start, end)
+		total_hierarchical += perf_counter() - start_time
+		start_time = perf_counter()
+		optimal_path = astar(start, end, grid)
+		total_flat += perf_counter() - start_time
+		if optimal_path is not None and len(optimal_path) > 1:
+			overheads.append(path_cost(path) / path_cost(optimal_path) - 1)
+	print('queries: HPA* {:.4f} s, astar() {:.4f} s per query ({:.1f}x faster)'.format(total_hierarchical / queries, total_flat / queries, total_flat / total_hierarchical))
+	print('path length overhead: mean {:.2%}, max {:.2%}'.format(sum(overheads) / len(overheads), max(overheads)))
+	start_time = perf_counter()
+	rebuilt = hierarchy.rebuilt
+	for i in range(queries):
+		cell = random_free_cell(grid, rng)
+		hierarchy.set_blocked(cell, True)
+		hierarchy.set_blocked(cell, False)
+	print('wall edits: {:.4f} s per edit, {:.1f} clusters rebuilt per edit'.format((perf_counter() - start_time) / (2 * queries), (hierarchy.rebuilt - rebuilt) / (2 * queries)))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		size = int(argv[1])
+	if len(argv) > 2:
+		queries = int(argv[2])
+	benchmark(size, queries)
@@ -0,0 +1,66 @@
+########## jps_benchmark.py ##########
+
+'''
+
+- This script compares Jump Point Search against astar() on open rooms and on corridor mazes
+- It reports nodes expanded, wall clock time and path cost for each search
+- usage: python jps_benchmark.py [size ...]
+
+'''
+
+#########
+# imports
+#########
+
+from sys import argv
+from time import perf_counter
+from astar_maze_path_plot import astar, create_g
+from jump_point_search import jps
+from maze_generator import corners, corridor_maze, open_maze, rooms_maze
+
+####################
+# initial conditions
+####################
+
+sizes = [256, 1024] # define the side length of each benchmark maze
+mazes = [('open', lambda size: open_maze(size)), ('rooms', lambda size: rooms_maze(size, room_size=32, seed=0)), ('corridors', lambda size: corridor_maze(size, seed=0))]
+
+######################
+# define the benchmark
+######################
+
+def path_cost(path):
+	'''
+	- sum the move costs along a path
+	'''
+	return sum(create_g(path[i], path[i + 1]) for i in range(len(path) - 1))
+
+def benchmark(sizes):
+	'''
+	- run both searches corner to corner on every maze type and size
+	'''
+	print('{:>10} {:>6} {:>12} {:>12} {:>10} {:>10} {:>10} {:>10}'.format('maze', 'size', 'A* expanded', 'JPS expanded', 'A* (s)', 'JPS (s)', 'A* cost', 'JPS cost'))
+	for name, create_maze in mazes:
+		for size in sizes:
+			grid = create_maze(size)
+			start, end = corners(grid)
+			grid.neighbour_table() # compile the neighbour table before timing astar()
+			stats = {}
+			start_time = perf_counter()
+			astar_path = astar(start, end, grid, stats)
+			astar_time = perf_counter() - start_time
+			astar_expanded = stats['expanded']
+			stats = {}
+			start_time = perf_counter()
+			jps_path = jps(start, end, grid, stats)
+			jps_time = perf_counter() - start_time
+			print('{:>10} {:>6} {:>12} {:>12} {:>10.4f} {:>10.4f} {:>10.3f} {:>10.3f}'.format(name, size, astar_expanded, stats['expanded'], astar_time, jps_time, path_cost(astar_path), path_cost(jps_path)))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		sizes = [int(size) for size in argv[1:]]
+	benchmark(sizes)
@@ -0,0 +1,177 @@
+########## jump_point_search.py ##########
+
+'''
+
+- This script implements Jump Point Search, an A* search that only expands jump points on a uniform cost 8 connected grid
+- Straight and diagonal runs through open space are skipped with jump() instead of being pushed onto the open list one cell at a time
+- The moves and costs are the same as astar() (diagonal moves may cut corners, costs of 1 and sqrt(2)) so the paths are optimal and have the same cost
+
+'''
+
+#########
+# imports
+#########
+
+from heapq import heappush, heappop
+from astar_maze_path_plot import create_h, start, end, grid
+
+######################
+# define the algorithm
+######################
+
+def sign(value):
+	'''
+	- return -1, 0 or 1 for the direction of a step
+	'''
+	if value > 0:
+		return 1
+	if value < 0:
+		return -1
+	return 0
+
+def prune_neighbours(grid, node, parent):
+	'''
+	- return the natural and forced neighbours of a node reached from its parent
+	- the start node has no parent, so all of its free neighbours are kept
+	'''
+	if parent is None:
+		return grid.children(node)
+	x, y = node
+	dx = sign(x - parent[0])
+	dy = sign(y - parent[1])
+	blocked = grid.is_blocked
+	neighbours = []
+	if dx != 0 and dy != 0:
+		# natural neighbours of a diagonal move
+		if not blocked((x, y + dy)):
+			neighbours.append((x, y + dy))
+		if not blocked((x + dx, y)):
+			neighbours.append((x + dx, y))
+		if not blocked((x + dx, y + dy)):
+			neighbours.append((x + dx, y + dy))
+		# forced neighbours of a diagonal move
+		if blocked((x - dx, y)) and not blocked((x - dx, y + dy)):
+			neighbours.append((x - dx, y + dy))
+		if blocked((x, y - dy)) and not blocked((x + dx, y - dy)):
+			neighbours.append((x + dx, y - dy))
+	elif dx != 0:
+		# natural and forced neighbours of a move along x
+		if not blocked((x + dx, y)):
+			neighbours.append((x + dx, y))
+		if blocked((x, y + 1)) and not blocked((x + dx, y + 1)):
+			neighbours.append((x + dx, y + 1))
+		if blocked((x, y - 1)) and not blocked((x + dx, y - 1)):
+			neighbours.append((x + dx, y - 1))
+	else:
+		# natural and forced neighbours of a move along y
+		if not blocked((x, y + dy)):
+			neighbours.append((x, y + dy))
+		if blocked((x + 1, y)) and not blocked((x + 1, y + dy)):
+			neighbours.append((x + 1, y + dy))
+		if blocked((x - 1, y)) and not blocked((x - 1, y + dy)):
+			neighbours.append((x - 1, y + dy))
+	return neighbours
+
+def jump_straight(grid, x, y, dx, dy, end):
+	'''
+	- step from (x, y) along x or y until the end, a wall, or a cell with a forced neighbour is found
+	- return the jump point, or None if the run hits a wall
+	'''
+	blocked = grid.is_blocked
+	while True:
+		x += dx
+		y += dy
+		if blocked((x, y)):
+			return None
+		if (x, y) == end:
+			return (x, y)
+		if dx != 0:
+			if (blocked((x, y + 1)) and not blocked((x + dx, y + 1))) or (blocked((x, y - 1)) and not blocked((x + dx, y - 1))):
+				return (x, y)
+		else:
+			if (blocked((x + 1, y)) and not blocked((x + 1, y + dy))) or (blocked((x - 1, y)) and not blocked((x - 1, y + dy))):
+				return (x, y)
+
+def jump(grid, x, y, dx, dy, end):
+	'''
+	- step from (x, y) in the direction (dx, dy) and return the next jump point, or None if there is none
+	- a diagonal step is a jump point if it has a forced neighbour or if either of its straight runs finds a jump point
+	'''
+	if dx == 0 or dy == 0:
+		return jump_straight(grid, x, y, dx, dy, end)
+	blocked = grid.is_blocked
+	while True:
+		x += dx
+		y += dy
+		if blocked((x, y)):
+			return None
+		if (x, y) == end:
+			return (x, y)
+		if (blocked((x - dx, y)) and not blocked((x - dx, y + dy))) or (blocked((x, y - dy)) and not blocked((x + dx, y - dy))):
+			return (x, y)
+		if jump_straight(grid, x, y, dx, 0, end) is not None or jump_straight(grid, x, y, 0, dy, end) is not None:
+			return (x, y)
+
+def fill_path(jump_points):
+	'''
+	- expand a list of jump points into every cell along the straight and diagonal runs between them
+	'''
+	path = [jump_points[0]]
+	for node in jump_points[1:]:
+		x, y = path[-1]
+		dx = sign(node[0] - x)
+		dy = sign(node[1] - y)
+		while (x, y) != node:
+			x += dx
+			y += dy
+			path.append((x, y))
+	return path
+
+def jps(start, end, grid=grid, stats=None):
+	'''
+	- find the lowest cost path from start to end with Jump Point Search
+	- the open list, tie breaking and lazy deletion are the same as astar(), only the successors differ
+	- pass a dict as stats to have the number of expanded nodes written to stats['expanded']
+	'''
+	g = {}
+	g[start] = 0
+	h = create_h(start, end)
+	closed_list = set()
+	open_list = [(h, h, start)]
+	parent = {}
+	expanded = 0
+	while len(open_list) > 0:
+		current_f, current_h, current_node = heappop(open_list)
+		if current_node in closed_list:
+			continue # stale entry, this node was already expanded with a lower f cost
+		if current_node == end:
+			jump_points = [current_node]
+			while current_node in parent:
+				current_node = parent[current_node]
+				jump_points.append(current_node)
+			jump_points.reverse()
+			if stats is not None:
+				stats['expanded'] = expanded
+			return fill_path(jump_points)
+		closed_list.add(current_node)
+		expanded += 1
+		for neighbour in prune_neighbours(grid, current_node, parent.get(current_node)):
+			child = jump(grid, current_node[0], current_node[1], neighbour[0] - current_node[0], neighbour[1] - current_node[1], end)
+			if child is None or child in closed_list:
+				continue
+			candidates_g = g[current_node] + create_h(current_node, child) # a jump is a straight or diagonal run, so its cost is the octile distance
+			if child in g and candidates_g >= g[child]:
+				continue # this g score is worse than previously found
+			parent[child] = current_node
+			g[child] = candidates_g
+			h = create_h(child, end)
+			heappush(open_list, (candidates_g + h, h, child))
+	if stats is not None:
+		stats['expanded'] = expanded
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	print(jps(start, end))
@@ -0,0 +1,88 @@
+########## landmark_benchmark.py ##########
+
+'''
+
+- This script measures what the landmark (ALT) heuristic of landmarks.py buys astar() for different numbers of landmarks K
+- For every maze it reports the preprocessing time and memory of the landmark distances against the nodes expanded and the search time,
+  summed over the corner to corner query and a set of random queries, next to the plain octile create_h() (K = 0)
+- usage: python landmark_benchmark.py [size ...]
+
+'''
+
+#########
+# imports
+#########
+
+from random import Random
+from sys import argv
+from time import perf_counter
+from numpy import argwhere, asarray
+from astar_maze_path_plot import astar
+from jps_benchmark import path_cost
+from landmarks import Landmarks
+from maze_generator import corners, corridor_maze, random_maze, rooms_maze
+
+####################
+# initial conditions
+####################
+
+sizes = [256, 1024] # define the side length of each benchmark maze
+counts = [0, 1, 2, 4, 8, 16] # define the numbers of landmarks to compare, 0 is astar() without landmarks
+queries = 20 # define how many random queries are searched on each maze besides the corner to corner query
+mazes = [('random 0.3', lambda size: random_maze(size, 0.3, 0)), ('rooms', lambda size: rooms_maze(size, room_size=32, seed=0)), ('corridors', lambda size: corridor_maze(size, seed=0))]
+
+######################
+# define the benchmark
+######################
+
+def create_queries(grid, count, seed=0):
+	'''
+	- return the corner to corner query and count random queries between free cells that are connected to each other
+	'''
+	start, end = corners(grid)
+	pairs = [(start, end)]
+	free = [tuple(cell) for cell in argwhere(asarray(grid.cells) == 0).tolist()]
+	rng = Random(seed)
+	while len(pairs) <= count:
+		pair = (rng.choice(free), rng.choice(free))
+		if astar(pair[0], pair[1], grid) is not None:
+			pairs.append(pair)
+	return pairs
+
+def benchmark(sizes):
+	'''
+	- search every query with every number of landmarks and compare the expanded nodes and times with K = 0
+	'''
+	print('{:>10} {:>6} {:>4} {:>12} {:>11} {:>12} {:>10} {:>10} {:>10}'.format('maze', 'size', 'K', 'memory (MB)', 'build (s)', 'expanded', 'reduction', 'time (s)', 'speedup'))
+	for name, create_maze in mazes:
+		for size in sizes:
+			grid = create_maze(size)
+			grid.neighbour_table() # compile the neighbour table before timing anything
+			pairs = create_queries(grid, queries)
+			baseline = None
+			for count in counts:
+				start_time = perf_counter()
+				landmarks = Landmarks.from_grid(grid, count) if count else None
+				build_time = perf_counter() - start_time
+				expanded = 0
+				cost = 0.0
+				start_time = perf_counter()
+				for start, end in pairs:
+					stats = {}
+					cost += path_cost(astar(start, end, grid, stats, landmarks))
+					expanded += stats['expanded']
+				elapsed = perf_counter() - start_time
+				if baseline is None:
+					baseline = (expanded, elapsed, cost)
+				assert abs(cost - baseline[2]) < 1e-6 * baseline[2], 'the landmark heuristic changed the cost of a path'
+				memory = landmarks.nbytes() / 1e6 if landmarks else 0.0
+				print('{:>10} {:>6} {:>4} {:>12.1f} {:>11.3f} {:>12} {:>9.1f}x {:>10.3f} {:>9.2f}x'.format(name, size, count, memory, build_time, expanded, baseline[0] / expanded, elapsed, baseline[1] / elapsed))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		sizes = [int(size) for size in argv[1:]]
+	benchmark(sizes)
@@ -0,0 +1,138 @@
+########## landmarks.py ##########
+
+'''
+
+- This script precomputes landmark (ALT: A*, landmarks, triangle inequality) lower bounds so astar() expands fewer nodes on mazes with long detours
+- K landmarks are picked far apart from each other and the lowest cost from each of them to every cell of the maze is stored as float32
+- By the triangle inequality |d(L, n) - d(L, end)| <= d(n, end) for every landmark L, so the largest of these bounds is an admissible and consistent h
+- The distances can be written to a .npy file and opened again as a memory map, so a big maze only pays the preprocessing once
+- usage: astar(start, end, grid, landmarks=Landmarks.from_grid(grid, count))
+
+'''
+
+#########
+# imports
+#########
+
+from numpy import asarray, bincount, float32, flatnonzero, full, inf, isfinite, load, minimum, nonzero, where, zeros
+from numpy.lib.format import open_memmap
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, dijkstra
+from astar_maze_path_plot import astar, start, end, grid
+from maze_grid import move_costs, moves
+
+####################
+# initial conditions
+####################
+
+landmark_count = 8 # define how many landmarks are picked, each one costs 4 bytes per cell of the maze
+active_count = 4 # define how many of the landmarks a query uses, the ones with the largest bound at its start
+
+########################
+# define the landmarks
+########################
+
+def create_graph(grid):
+	'''
+	- return the moves of the grid as a scipy sparse matrix weighted by the move costs, row c holds the free neighbours of the flat cell c in the order of moves
+	'''
+	cells, codes = nonzero(grid.valid_moves())
+	offsets = asarray([move[0] * grid.height + move[1] for move in moves])
+	size = grid.width * grid.height
+	return csr_matrix((asarray(move_costs)[codes], (cells, cells + offsets[codes])), shape=(size, size))
+
+class Landmarks:
+	'''
+	- landmark lower bounds of a maze grid: distances[cell][k] is the lowest cost between landmark k and the flat cell index x * height + y (inf if there is no path)
+	- the distances of a cell are next to each other, so the bound of a node reads one short run of memory
+	- the bounds are only valid for the grid version they were computed on, after set_blocked() build new landmarks
+	'''
+
+	def __init__(self, grid, distances):
+		if distances.ndim != 2 or len(distances) != grid.width * grid.height:
+			raise ValueError('landmark distances must have shape ({}, count), got {}'.format(grid.width * grid.height, distances.shape))
+		self.grid = grid
+		self.version = grid.version
+		self.distances = distances
+		self.count = distances.shape[1]
+		self.cells = [int(cell) for cell in distances.argmin(axis=0)] # the distance from a landmark to itself is the only 0
+		finite = distances[isfinite(distances)]
+		# float32 rounds each distance by up to 2**-24 of its value, the bounds are lowered by this much so they never overestimate
+		self.tolerance = float(finite.max()) * 2**-22 if len(finite) else 0.0
+		self._view = memoryview(distances.reshape(-1))
+
+	@classmethod
+	def from_grid(cls, grid, count=landmark_count, path=None):
+		'''
+		- pick count landmarks on the grid and compute their distances with dijkstra()
+		- the first landmark is the cell farthest from a cell of the largest connected region, every next one is the cell farthest from all the landmarks so far
+		- if path is given the distances are written to that .npy file as a memory map instead of being kept in memory
+		'''
+		graph = create_graph(grid)
+		size = grid.width * grid.height
+		shape = (size, count)
+		distances = zeros(shape, dtype=float32) if path is None else open_memmap(path, mode='w+', dtype=float32, shape=shape)
+		free = flatnonzero(asarray(grid.cells).reshape(-1) == 0)
+		if len(free) and count:
+			labels = connected_components(graph, directed=False)[1]
+			largest = bincount(labels[free]).argmax()
+			nearest = full(size, inf)
+			distance = dijkstra(graph, indices=int(free[labels[free] == largest][0]))
+			for k in range(count):
+				landmark = int(where(isfinite(distance), distance, -1).argmax())
+				distance = dijkstra(graph, indices=landmark)
+				distances[:, k] = distance
+				nearest = minimum(nearest, distance)
+				distance = nearest
+		else:
+			distances[:] = inf
+		if path is not None:
+			distances.flush()
+		return cls(grid, distances)
+
+	@classmethod
+	def from_file(cls, grid, path):
+		'''
+		- open the distances written by from_grid(grid, count, path) as a read only memory map, the grid must be the same maze
+		'''
+		return cls(grid, load(path, mmap_mode='r'))
+
+	def nbytes(self):
+		'''
+		- return the size of the distance arrays in bytes
+		'''
+		return self.distances.nbytes
+
+	def bound_to(self, end, start=None, active=active_count):
+		'''
+		- return a function of a flat cell index that gives the landmark lower bound on the cost from that cell to the end position
+		- landmarks that can't reach the end say nothing about it and are skipped, None is returned if none of them can
+		- if a start position is given only the active landmarks with the largest bound at the start are used,
+		  every landmark costs time at every node and the best ones for a query usually stay the best along its path
+		'''
+		if self.grid.version != self.version:
+			raise ValueError('the grid was edited after the landmarks were computed')
+		view = self._view
+		count = self.count
+		tolerance = self.tolerance
+		end_cell = end[0] * self.grid.height + end[1]
+		targets = [(k, target) for k, target in enumerate(view[end_cell * count:(end_cell + 1) * count]) if target != inf]
+		if not targets:
+			return None
+		if start is not None and len(targets) > active:
+			first = (start[0] * self.grid.height + start[1]) * count
+			targets.sort(key=lambda pair: -abs(view[first + pair[0]] - pair[1]))
+			targets = targets[:active]
+		def bound(cell):
+			first = cell * count
+			return max([abs(view[first + k] - target) for k, target in targets]) - tolerance
+		return bound
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	landmarks = Landmarks.from_grid(grid, 2)
+	print('landmarks', [divmod(cell, grid.height) for cell in landmarks.cells])
+	print(astar(start, end, grid, landmarks=landmarks))
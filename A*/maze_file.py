@@ -0,0 +1,141 @@
+########## maze_file.py ##########
+
+'''
+
+- This script defines an on disk maze format and converts the list of lists and barrier tuple mazes to it
+- A maze file is a 16 byte header followed by the occupancy bits, 1 bit per cell packed along y (the same layout as PackedMazeGrid.bits)
+- header: b'MAZE', format version (uint16), header size (uint16), width (uint32), height (uint32), all little endian
+- open_maze_file() maps the bits with numpy.memmap instead of reading them, so opening is instant whatever the size of the maze
+  and every process that opens the same file shares one copy of it in the page cache
+- usage: python maze_file.py [size]
+
+'''
+
+#########
+# imports
+#########
+
+from struct import calcsize, pack, unpack
+from sys import argv
+from time import perf_counter
+from numpy import asarray, memmap, packbits, uint8
+from maze_grid import MazeGrid, PackedMazeGrid
+
+####################
+# initial conditions
+####################
+
+magic = b'MAZE'
+format_version = 1
+header_format = '<4sHHII' # magic, format version, header size, width, height
+header_size = calcsize(header_format)
+block_rows = 1024 # define how many rows of a maze are packed at a time while writing, so converting never holds a second full copy
+
+#####################
+# define the format
+#####################
+
+def read_header(path):
+	'''
+	- read and check the header of a maze file and return (width, height)
+	'''
+	with open(path, 'rb') as file:
+		header = file.read(header_size)
+	if len(header) != header_size:
+		raise ValueError('{} is too short to be a maze file'.format(path))
+	file_magic, version, size, width, height = unpack(header_format, header)
+	if file_magic != magic:
+		raise ValueError('{} is not a maze file'.format(path))
+	if version != format_version or size != header_size:
+		raise ValueError('{} has maze file format version {}, expected {}'.format(path, version, format_version))
+	return width, height
+
+def write_rows(path, width, height, rows):
+	'''
+	- write a maze file from an iterable of packed rows (each (height + 7) // 8 bytes), in order of x
+	'''
+	written = 0
+	with open(path, 'wb') as file:
+		file.write(pack(header_format, magic, format_version, header_size, width, height))
+		for row in rows:
+			file.write(row)
+			written += len(row)
+	if written != width * ((height + 7) // 8):
+		raise ValueError('wrote {} bytes of cells for a {}x{} maze'.format(written, width, height))
+
+def save_maze(path, grid):
+	'''
+	- write a MazeGrid or PackedMazeGrid to a maze file
+	'''
+	def rows():
+		for x in range(0, grid.width, block_rows):
+			if isinstance(grid, PackedMazeGrid):
+				yield asarray(grid.bits[x:x + block_rows], dtype=uint8).tobytes()
+			else:
+				yield packbits(grid.cells[x:x + block_rows] != 0, axis=1).tobytes()
+	write_rows(path, grid.width, grid.height, rows())
+
+def open_maze_file(path, mode='r'):
+	'''
+	- open a maze file as a PackedMazeGrid backed by numpy.memmap, no cells are read until a search touches them
+	- mode='r' maps the file read only, mode='r+' lets set_blocked() write edits back to the file
+	'''
+	width, height = read_header(path)
+	bits = memmap(path, dtype=uint8, mode=mode, offset=header_size, shape=(width, (height + 7) // 8))
+	return PackedMazeGrid(bits, width, height)
+
+######################
+# define the converters
+######################
+
+def convert_maze(maze, path):
+	'''
+	- write a list of lists maze (any non zero entry is blocked) to a maze file, one row at a time
+	'''
+	height = len(maze[0]) if maze else 0
+	def rows():
+		for row in maze:
+			if len(row) != height:
+				raise ValueError('every row of the maze must have {} cells, got {}'.format(height, len(row)))
+			yield packbits([1 if cell != 0 else 0 for cell in row]).tobytes()
+	write_rows(path, len(maze), height, rows())
+
+def convert_barriers(edge_min, edge_max, barriers, path):
+	'''
+	- write a maze given by its edges and barrier positions (the astar_maze_path_plot.py format) to a maze file
+	'''
+	save_maze(path, MazeGrid.from_barriers(edge_min, edge_max, barriers))
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	from tempfile import TemporaryDirectory
+	from os import path as os_path
+	from astar_maze_path_plot import astar, edge_min, edge_max, barriers, start, end
+	from jps_benchmark import path_cost
+	from maze_generator import corners, random_maze
+	size = int(argv[1]) if len(argv) > 1 else 4096
+	with TemporaryDirectory() as directory:
+		# the demo maze of astar_maze_path_plot.py
+		demo_path = os_path.join(directory, 'demo.maze')
+		convert_barriers(edge_min, edge_max, barriers, demo_path)
+		print(astar(start, end, open_maze_file(demo_path)))
+		# a large random maze
+		grid = random_maze(size)
+		large_path = os_path.join(directory, 'large.maze')
+		start_time = perf_counter()
+		save_maze(large_path, grid)
+		print('{0}x{0}: saved in {1:.3f} s, {2:.1f} MB on disk ({3:.1f} MB as uint8)'.format(size, perf_counter() - start_time, os_path.getsize(large_path) / 1e6, grid.cells.nbytes / 1e6))
+		start_time = perf_counter()
+		packed = open_maze_file(large_path)
+		print('{}x{}: opened in {:.6f} s'.format(size, size, perf_counter() - start_time))
+		query = corners(grid)
+		start_time = perf_counter()
+		packed_cost = path_cost(astar(query[0], query[1], packed))
+		packed_time = perf_counter() - start_time
+		start_time = perf_counter()
+		cost = path_cost(astar(query[0], query[1], grid))
+		print('astar(): {:.3f} s from the file, {:.3f} s in memory, same cost: {}'.format(packed_time, perf_counter() - start_time, packed_cost == cost))
+		del packed
@@ -0,0 +1,96 @@
+########## maze_generator.py ##########
+
+'''
+
+- This script generates reproducible synthetic mazes as MazeGrid occupancy grids for benchmarking the path finding scripts
+- Every maze is size x size with a blocked border, and the same (size, seed) always gives the same maze
+
+'''
+
+#########
+# imports
+#########
+
+from random import Random
+from numpy import argwhere, asarray, ones, uint8, zeros
+from numpy.random import default_rng
+from maze_grid import MazeGrid
+
+#######################
+# define the generators
+#######################
+
+def open_maze(size):
+	'''
+	- an empty room surrounded by the border
+	'''
+	cells = zeros((size, size), dtype=uint8)
+	cells[0, :] = cells[-1, :] = cells[:, 0] = cells[:, -1] = 1
+	return MazeGrid(cells)
+
+def random_maze(size, density=0.2, seed=0):
+	'''
+	- an open room where each inner cell is blocked independently with probability density
+	'''
+	cells = (default_rng(seed).random((size, size)) < density).astype(uint8)
+	cells[0, :] = cells[-1, :] = cells[:, 0] = cells[:, -1] = 1
+	return MazeGrid(cells)
+
+def rooms_maze(size, room_size=32, seed=0):
+	'''
+	- a grid of open rooms separated by single walls, with one random doorway in every wall between two neighbouring rooms
+	'''
+	rng = Random(seed)
+	cells = zeros((size, size), dtype=uint8)
+	cells[0, :] = cells[-1, :] = cells[:, 0] = cells[:, -1] = 1
+	walls = list(range(room_size, size - 2, room_size))
+	for wall in walls:
+		cells[wall, :] = 1
+		cells[:, wall] = 1
+	bounds = [0] + walls + [size - 1]
+	for wall in walls:
+		for i in range(len(bounds) - 1):
+			low = bounds[i] + 1
+			high = bounds[i + 1] - 1
+			cells[wall, rng.randint(low, high)] = 0 # doorway across a wall of constant x
+			cells[rng.randint(low, high), wall] = 0 # doorway across a wall of constant y
+	return MazeGrid(cells)
+
+def corridor_maze(size, seed=0):
+	'''
+	- a perfect maze of one cell wide corridors carved by a recursive backtracker (iterative, so big mazes do not hit the recursion limit)
+	- corridor cells sit on odd coordinates and walls on even coordinates
+	'''
+	rng = Random(seed)
+	cells = ones((size, size), dtype=uint8)
+	last = size - 2 # the last odd coordinate inside the border
+	if last % 2 == 0:
+		last -= 1
+	cells[1, 1] = 0
+	stack = [(1, 1)]
+	while stack:
+		x, y = stack[-1]
+		unvisited = []
+		for dx, dy in [(0, -2), (0, 2), (-2, 0), (2, 0)]:
+			nx = x + dx
+			ny = y + dy
+			if 1 <= nx <= last and 1 <= ny <= last and cells[nx, ny] == 1:
+				unvisited.append((nx, ny))
+		if not unvisited:
+			stack.pop()
+			continue
+		nx, ny = rng.choice(unvisited)
+		cells[(x + nx) // 2, (y + ny) // 2] = 0 # knock down the wall between the two cells
+		cells[nx, ny] = 0
+		stack.append((nx, ny))
+	return MazeGrid(cells)
+
+def corners(grid):
+	'''
+	- return the free cells closest to the top left and bottom right corners, used as the start and end of benchmark queries
+	'''
+	free = argwhere(asarray(grid.cells) == 0)
+	diagonal = free.sum(axis=1)
+	start = free[diagonal.argmin()]
+	end = free[diagonal.argmax()]
+	return (int(start[0]), int(start[1])), (int(end[0]), int(end[1]))
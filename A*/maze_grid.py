@@ -0,0 +1,395 @@
+########## maze_grid.py ##########
+
+'''
+
+- This script defines the occupancy grid that every maze script in this folder searches
+- The grid is a uint8 numpy array indexed [x][y] (or [row][column] for the list of lists mazes): 1 = blocked, 0 = free
+- It is built once from either maze format (the list of lists maze or the barrier tuples with edge_min/edge_max) so looking up a neighbour is O(1)
+- PackedMazeGrid is the same grid stored 1 bit per cell, so huge mazes can be searched straight from a memory mapped file (see maze_file.py)
+- neighbour_table() compiles the grid once into a table of move bit masks (1 byte per cell), so searches can walk the maze without building a list of children per step,
+  a packed grid or a grid of more than table_limit cells is never compiled, its table reads the moves of a cell from the grid when the search reaches it
+
+'''
+
+#########
+# imports
+#########
+
+from hashlib import blake2b
+from math import sqrt
+from numpy import asarray, ascontiguousarray, int64, ones, pad, packbits, stack, uint8, unpackbits, zeros
+
+####################
+# initial conditions
+####################
+
+moves = [(0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (-1, 1), (1, -1), (1, 1)] # up/down, left/right and the 4 diagonal directions
+move_costs = tuple(sqrt(move[0]**2 + move[1]**2) for move in moves) # 1 for the straight moves and sqrt(2) for the diagonal moves, the same as create_g()
+mask_codes = tuple(tuple(code for code in range(len(moves)) if mask >> code & 1) for mask in range(1 << len(moves))) # the indices into moves of the moves a bit mask allows, in the order of moves
+table_limit = 1 << 24 # define the most cells whose move masks neighbour_table() precomputes, 1 byte per cell (16 MB at the limit)
+
+###################
+# define the grid
+###################
+
+class MazeGrid:
+	'''
+	- occupancy grid of a maze: cells[x][y] is 1 if the cell is blocked and 0 if it is free
+	- version is incremented on every edit so anything derived from the grid can tell when it is stale
+	- cells is a read only view, every edit goes through set_blocked() so the version (and the fingerprint, the neighbour table
+	  and the cached paths keyed on them) can't go stale, a uint8 array passed in is used without a copy and must not be written to afterwards
+	'''
+
+	def __init__(self, cells):
+		self._cells = ascontiguousarray(cells, dtype=uint8)
+		if self._cells.ndim != 2:
+			raise ValueError('a maze grid must be 2 dimensional, got shape {}'.format(self._cells.shape))
+		self.cells = self._cells.view()
+		self.cells.flags.writeable = False
+		self.width, self.height = self.cells.shape
+		self.version = 0
+		self._view = memoryview(self._cells) # python level reads of a cell are faster through a memoryview than through numpy indexing
+		self._fingerprint = None
+		self._neighbour_table = None
+
+	@classmethod
+	def from_maze(cls, maze):
+		'''
+		- build the grid from a list of lists maze where any non zero entry is blocked
+		'''
+		return cls([[1 if cell != 0 else 0 for cell in row] for row in maze])
+
+	@classmethod
+	def from_barriers(cls, edge_min, edge_max, barriers):
+		'''
+		- build the grid from the maze edges and barrier positions used by astar_maze_path_plot.py
+		- every cell on (or outside) the edges is blocked, so the free cells are edge_min < x, y < edge_max
+		'''
+		cells = ones((edge_max + 1, edge_max + 1), dtype=uint8)
+		cells[edge_min + 1:edge_max, edge_min + 1:edge_max] = 0
+		for barrier in barriers:
+			cells[barrier[0], barrier[1]] = 1
+		return cls(cells)
+
+	def in_bounds(self, position):
+		'''
+		- check if a position is on the grid
+		'''
+		return 0 <= position[0] < self.width and 0 <= position[1] < self.height
+
+	def is_blocked(self, position):
+		'''
+		- check if a position is off the grid or blocked
+		'''
+		if not self.in_bounds(position):
+			return True
+		return self._view[position[0], position[1]] != 0
+
+	def set_blocked(self, position, blocked=True):
+		'''
+		- block or free a single cell
+		'''
+		self._cells[position[0], position[1]] = 1 if blocked else 0
+		self.version += 1
+
+	def fingerprint(self):
+		'''
+		- return a hash of the shape and cells that identifies this maze layout
+		- the hash is only recomputed after the grid has been edited through set_blocked(), the only way to edit it (cells is read only)
+		'''
+		if self._fingerprint is None or self._fingerprint[0] != self.version:
+			digest = blake2b(digest_size=16)
+			digest.update(str(self.cells.shape).encode())
+			digest.update(self.cells)
+			self._fingerprint = (self.version, digest.hexdigest())
+		return self._fingerprint[1]
+
+	def children(self, position):
+		'''
+		- return the free neighbours of a position in the order of moves
+		'''
+		x, y = position
+		width = self.width
+		height = self.height
+		view = self._view
+		children = []
+		for move in moves:
+			child_x = x + move[0]
+			child_y = y + move[1]
+			if child_x < 0 or child_x >= width or child_y < 0 or child_y >= height:
+				continue # moving to this position puts the path off the maze
+			if view[child_x, child_y] != 0:
+				continue # moving to this position is blocked
+			children.append((child_x, child_y))
+		return children
+
+	def move_mask(self, position):
+		'''
+		- return the moves of a position as a bit mask: bit i is set if moves[i] stays on the grid and is not blocked (0 if the position itself is blocked)
+		'''
+		x, y = position
+		width = self.width
+		height = self.height
+		view = self._view
+		if view[x, y] != 0:
+			return 0
+		mask = 0
+		for code, move in enumerate(moves):
+			child_x = x + move[0]
+			child_y = y + move[1]
+			if 0 <= child_x < width and 0 <= child_y < height and view[child_x, child_y] == 0:
+				mask |= 1 << code
+		return mask
+
+	def move_masks(self, cells=None):
+		'''
+		- return the move_mask() of the flat cell indices cells (x * height + y) as a uint8 array, or of every cell of the grid if cells is None
+		- a list of cells only reads the cells around them through cells[xs, ys], so it also works on a packed grid without unpacking it
+		'''
+		if cells is None:
+			free = asarray(self.cells) == 0
+			padded = pad(free, 1, constant_values=False) # cells off the grid are never valid moves
+			masks = zeros(free.shape, dtype=uint8)
+			for code, move in enumerate(moves):
+				masks |= (free & padded[1 + move[0]:1 + move[0] + self.width, 1 + move[1]:1 + move[1] + self.height]).view(uint8) << code
+			return masks.reshape(-1)
+		xs, ys = divmod(asarray(cells, dtype=int64), self.height)
+		free = self.cells[xs, ys] == 0
+		masks = zeros(len(xs), dtype=uint8)
+		for code, move in enumerate(moves):
+			child_xs = xs + move[0]
+			child_ys = ys + move[1]
+			valid = free & (child_xs >= 0) & (child_xs < self.width) & (child_ys >= 0) & (child_ys < self.height)
+			valid[valid] = self.cells[child_xs[valid], child_ys[valid]] == 0
+			masks |= valid.view(uint8) << code
+		return masks
+
+	def compile_masks(self):
+		'''
+		- return the move masks neighbour_table() precomputes, or None for a grid of more than table_limit cells
+		'''
+		return self.move_masks() if self.width * self.height <= table_limit else None
+
+	def valid_moves(self):
+		'''
+		- return a mask of the valid moves of every cell: valid[cell][i] is True if moves[i] from the cell stays on the grid and is not blocked
+		- cells are indexed by the flat cell index x * height + y, blocked cells have no valid moves
+		'''
+		free = asarray(self.cells) == 0
+		padded = pad(free, 1, constant_values=False) # cells off the grid are never valid moves
+		return stack([free & padded[1 + move[0]:1 + move[0] + self.width, 1 + move[1]:1 + move[1] + self.height] for move in moves], axis=-1).reshape(-1, len(moves))
+
+	def neighbour_table(self, masks=None):
+		'''
+		- return the NeighbourTable of the grid, it is only recompiled after the grid has been edited through set_blocked()
+		- masks (optional) are move masks of this grid that were already compiled, for example by another process (see batch_search.py)
+		'''
+		if masks is not None or self._neighbour_table is None or self._neighbour_table[0] != self.version:
+			self._neighbour_table = (self.version, NeighbourTable(self, self.compile_masks() if masks is None else masks))
+		return self._neighbour_table[1]
+
+	def to_maze(self):
+		'''
+		- convert the grid back to a list of lists maze
+		'''
+		return self.cells.tolist()
+
+class NeighbourTable:
+	'''
+	- move table of a grid: bit i of masks[c] is set if moves[i] from the flat cell c = x * height + y stays on the grid and is not blocked,
+	  so the free neighbours of c are c + offsets[code] for code in mask_codes[masks[c]] (in the order of moves, like MazeGrid.children())
+	  and the cost of the move to each of them is move_costs[code]
+	- the masks take 1 byte per cell, the same as the uint8 grid (4 MB for a 2048 x 2048 maze)
+	- masks is None if the grid wasn't compiled (a packed grid, or more than table_limit cells): the mask of a cell is then read from the grid
+	  when the search reaches it, so the search only touches the (packed, possibly memory mapped) cells around the nodes it expands
+	- masks_view is a memoryview of masks (or the lazy GridMasks) for fast python loops, masks_of() gathers the masks of an array of cells for vectorized code
+	'''
+
+	def __init__(self, grid, masks=None):
+		self.grid = grid
+		self.width = grid.width
+		self.height = grid.height
+		self.offsets = tuple(move[0] * grid.height + move[1] for move in moves)
+		self.masks = masks
+		self.masks_view = GridMasks(grid) if masks is None else memoryview(masks)
+
+	@property
+	def nbytes(self):
+		'''
+		- the memory the table holds on top of the grid
+		'''
+		return 0 if self.masks is None else self.masks.nbytes
+
+	def masks_of(self, cells):
+		'''
+		- return the masks of an array of flat cell indices
+		'''
+		return self.grid.move_masks(cells) if self.masks is None else self.masks[cells]
+
+	def cell(self, position):
+		'''
+		- return the flat cell index of an x,y position
+		'''
+		return position[0] * self.height + position[1]
+
+	def position(self, cell):
+		'''
+		- return the x,y position of a flat cell index
+		'''
+		return divmod(cell, self.height)
+
+class GridMasks:
+	'''
+	- the masks of a NeighbourTable that wasn't compiled: masks[cell] is the MazeGrid.move_mask() of the cell, read from the grid every time
+	'''
+
+	def __init__(self, grid):
+		self.grid = grid
+		self.height = grid.height
+
+	def __getitem__(self, cell):
+		return self.grid.move_mask(divmod(cell, self.height))
+
+	def __len__(self):
+		return self.grid.width * self.height
+
+class PackedCells:
+	'''
+	- read only view of a bit packed grid that unpacks only the bytes a lookup touches
+	- supports cells[x, y] and slices like cells[x0:x1, y0:y1] so code written against MazeGrid.cells keeps working
+	'''
+
+	def __init__(self, bits, width, height):
+		self.bits = bits
+		self.shape = (width, height)
+
+	def __getitem__(self, key):
+		xs, ys = key
+		if not isinstance(ys, slice):
+			return (self.bits[xs, ys >> 3] >> (7 - (ys & 7))) & 1
+		first, last, step = ys.indices(self.shape[1])
+		if step != 1 or last <= first:
+			return self.__array__()[xs, ys]
+		offset = first & ~7
+		chunk = unpackbits(self.bits[xs, offset >> 3:(last + 7) >> 3], axis=-1)
+		return chunk[..., first - offset:last - offset]
+
+	def __array__(self, dtype=None, copy=None):
+		cells = unpackbits(self.bits, axis=1, count=self.shape[1])
+		return cells if dtype is None else cells.astype(dtype)
+
+class PackedMazeGrid(MazeGrid):
+	'''
+	- occupancy grid stored 1 bit per cell: bit 7 - y % 8 of bits[x][y // 8] is 1 if the cell is blocked
+	- bits can be any uint8 array of shape (width, (height + 7) // 8), including a numpy.memmap, and is never copied,
+	  like MazeGrid.cells the bits attribute is a read only view and every edit goes through set_blocked()
+	- a 10k x 10k maze takes 12.5 MB instead of 100 MB as uint8 (or gigabytes as a list of lists)
+	'''
+
+	def __init__(self, bits, width, height):
+		if bits.shape != (width, (height + 7) // 8):
+			raise ValueError('packed bits for a {}x{} maze must have shape {}, got {}'.format(width, height, (width, (height + 7) // 8), bits.shape))
+		self._bits = bits
+		self.bits = bits.view()
+		self.bits.flags.writeable = False
+		self.cells = PackedCells(self.bits, width, height)
+		self.width = width
+		self.height = height
+		self.version = 0
+		self._view = memoryview(bits)
+		self._fingerprint = None
+		self._neighbour_table = None
+
+	@classmethod
+	def from_grid(cls, grid):
+		'''
+		- pack the cells of an unpacked MazeGrid
+		'''
+		return cls(packbits(grid.cells, axis=1), grid.width, grid.height)
+
+	def is_blocked(self, position):
+		'''
+		- check if a position is off the grid or blocked
+		'''
+		if not self.in_bounds(position):
+			return True
+		y = position[1]
+		return (self._view[position[0], y >> 3] >> (7 - (y & 7))) & 1 != 0
+
+	def set_blocked(self, position, blocked=True):
+		'''
+		- block or free a single cell (the bits must be writable, for example a file opened with mode='r+')
+		'''
+		x, y = position
+		mask = 1 << (7 - (y & 7))
+		if blocked:
+			self._bits[x, y >> 3] |= mask
+		else:
+			self._bits[x, y >> 3] &= ~mask & 0xff
+		self.version += 1
+
+	def fingerprint(self):
+		'''
+		- return a hash of the shape and packed cells that identifies this maze layout
+		'''
+		if self._fingerprint is None or self._fingerprint[0] != self.version:
+			digest = blake2b(digest_size=16)
+			digest.update(str(self.cells.shape).encode())
+			digest.update(ascontiguousarray(self.bits))
+			self._fingerprint = (self.version, digest.hexdigest())
+		return self._fingerprint[1]
+
+	def children(self, position):
+		'''
+		- return the free neighbours of a position in the order of moves
+		'''
+		x, y = position
+		width = self.width
+		height = self.height
+		view = self._view
+		children = []
+		for move in moves:
+			child_x = x + move[0]
+			child_y = y + move[1]
+			if child_x < 0 or child_x >= width or child_y < 0 or child_y >= height:
+				continue # moving to this position puts the path off the maze
+			if (view[child_x, child_y >> 3] >> (7 - (child_y & 7))) & 1:
+				continue # moving to this position is blocked
+			children.append((child_x, child_y))
+		return children
+
+	def move_mask(self, position):
+		'''
+		- return the moves of a position as a bit mask: bit i is set if moves[i] stays on the grid and is not blocked (0 if the position itself is blocked)
+		'''
+		x, y = position
+		width = self.width
+		height = self.height
+		view = self._view
+		if (view[x, y >> 3] >> (7 - (y & 7))) & 1:
+			return 0
+		mask = 0
+		for code, move in enumerate(moves):
+			child_x = x + move[0]
+			child_y = y + move[1]
+			if 0 <= child_x < width and 0 <= child_y < height and not (view[child_x, child_y >> 3] >> (7 - (child_y & 7))) & 1:
+				mask |= 1 << code
+		return mask
+
+	def compile_masks(self):
+		'''
+		- a packed grid is never compiled, compiling it would unpack it (and a memory mapped file would be read into memory)
+		'''
+		return None
+
+	def unpack(self):
+		'''
+		- return an unpacked (and writable) MazeGrid copy of this grid
+		'''
+		return MazeGrid(self.cells.__array__())
+
+	def to_maze(self):
+		'''
+		- convert the grid back to a list of lists maze
+		'''
+		return self.cells.__array__().tolist()
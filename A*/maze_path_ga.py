@@ -0,0 +1,266 @@
+########## maze_path_ga.py ##########
+
+'''
+
+- This script implements a genetic algorithm that evolves paths around a maze, used by the guess_maze_path_*_if_blocked.py scripts
+- A path is a chromosome of move codes (indices into maze_grid.moves) walked from the start node, the whole population is one int8 array
+- Every generation walks all the chromosomes at once with numpy, one gene column at a time, so the fitness of the population is computed in batch
+- A gene that moves into a block or off the maze is handled like the script that uses it:
+  'stop' ends the path at the block, 'skip' ignores the gene, and 'mutate' replaces it with a random valid move
+- Big populations can be evaluated on a process pool, the maze is then held in shared memory (see batch_search.py)
+- usage: python maze_path_ga.py [size] [population_size] [generations] [processes]
+
+'''
+
+#########
+# imports
+#########
+
+from math import sqrt
+from multiprocessing import Pool
+from sys import argv
+from time import perf_counter
+from numpy import arange, asarray, concatenate, cumsum, flatnonzero, full, int8, int64, isinf, minimum, nonzero, searchsorted, where, zeros
+from numpy.random import default_rng
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from astar_maze_path_plot import create_g
+from batch_search import attach, share, worker
+from guess_maze_path import create_move_table, create_valid_moves
+from maze_grid import moves
+
+####################
+# initial conditions
+####################
+
+modes = ('stop', 'skip', 'mutate') # what happens to a gene that moves into a block or off the maze
+distance_weight = 4.0 # define how much a path is penalized per unit of cost left between its last node and the end_node
+chunk_size = 1024 # define how many chromosomes are sent to a worker at a time when the population is evaluated on a pool
+move_costs = asarray([sqrt(move[0]**2 + move[1]**2) for move in moves]) # the cost of each move code, the same as create_g()
+
+######################
+# define the algorithm
+######################
+
+def create_goal_distance(valid, offsets, end):
+	'''
+	create the lowest cost from every cell of the maze to the end cell (moves are symmetric, so it is a single dijkstra() from the end)
+	cells that can't reach the end get the largest finite distance plus one, so walking towards them is never worth it
+	'''
+	cells, codes = nonzero(valid)
+	size = len(valid)
+	graph = csr_matrix((move_costs[codes], (cells, cells + offsets[codes])), shape=(size, size))
+	distance = dijkstra(graph, indices=end)
+	unreachable = isinf(distance)
+	distance[unreachable] = (distance[~unreachable].max() + 1) if (~unreachable).any() else 0
+	return distance
+
+def create_tables(grid, end_node):
+	'''
+	create everything walk_population() needs to know about the maze: the valid move mask, the move table,
+	the flat index offset of each move and the cost left from every cell to the end_node
+	'''
+	valid = create_valid_moves(grid)
+	counts, table = create_move_table(grid, valid)
+	offsets = asarray([move[0] * grid.height + move[1] for move in moves], dtype=int64)
+	distance = create_goal_distance(valid, offsets, end_node[0] * grid.height + end_node[1])
+	return valid, counts, table, offsets, distance, grid.height
+
+def walk_population(population, start_node, end_node, tables, mode, rng):
+	'''
+	walk every chromosome of the population from the start_node and return the score of each path (lower is better) and whether it reached the end_node
+	- the score is the cost of the path plus distance_weight times the lowest cost left from where it ended to the end_node,
+	  paths that don't reach the end_node also score the cost of the longest possible path so they always rank below paths that do
+	- in 'mutate' mode the population is repaired in place, every invalid gene is replaced by the valid move that was walked instead
+	'''
+	valid, counts, table, offsets, distance, height = tables
+	size, length = population.shape
+	end = end_node[0] * height + end_node[1]
+	position = full(size, start_node[0] * height + start_node[1], dtype=int64)
+	cost = zeros(size)
+	reached = position == end
+	walking = ~reached
+	for i in range(length):
+		walkers = flatnonzero(walking)
+		if not len(walkers):
+			break
+		cells = position[walkers]
+		genes = population[walkers, i]
+		ok = valid[cells, genes]
+		if mode == 'mutate' and not ok.all():
+			bad = flatnonzero(~ok & (counts[cells] > 0))
+			genes[bad] = table[cells[bad], (rng.random(len(bad)) * counts[cells[bad]]).astype(int64)]
+			population[walkers, i] = genes
+			ok = valid[cells, genes]
+		if mode != 'skip':
+			walking[walkers[~ok]] = False # 'stop' (or a cell with no valid move at all) ends the path here
+		walkers = walkers[ok]
+		genes = genes[ok]
+		position[walkers] += offsets[genes]
+		cost[walkers] += move_costs[genes]
+		hit = walkers[position[walkers] == end]
+		reached[hit] = True
+		walking[hit] = False
+	return cost + distance_weight * distance[position] + (~reached) * (length * sqrt(2)), reached
+
+def evaluate_chunk(task):
+	'''
+	pool task: walk a chunk of the population on the shared maze of this worker
+	'''
+	population, start_node, end_node, mode, seed = task
+	if worker.get('ga_end') != end_node:
+		worker['ga_tables'] = create_tables(worker['grid'], end_node)
+		worker['ga_end'] = end_node
+	scores, reached = walk_population(population, start_node, end_node, worker['ga_tables'], mode, default_rng(seed))
+	return population, scores, reached
+
+def create_population(population_size, genome_length, rng):
+	'''
+	create a population of random chromosomes
+	'''
+	return rng.integers(0, len(moves), size=(population_size, genome_length), dtype=int8)
+
+def rank_population(population, start_node, end_node, tables, mode, rng, pool=None):
+	'''
+	compute the fitness (1 / (1 + score)) of every chromosome and return the population indices from the fittest down, with the fitness and reached arrays
+	- with a pool the population is split into chunks of chunk_size chromosomes, in 'mutate' mode the repaired chunks are copied back
+	'''
+	if pool is None:
+		scores, reached = walk_population(population, start_node, end_node, tables, mode, rng)
+	else:
+		chunks = [population[i:i + chunk_size] for i in range(0, len(population), chunk_size)]
+		seeds = rng.integers(0, 2**32, size=len(chunks))
+		results = pool.map(evaluate_chunk, [(chunk, start_node, end_node, mode, int(seed)) for chunk, seed in zip(chunks, seeds)])
+		population[:] = concatenate([result[0] for result in results])
+		scores = concatenate([result[1] for result in results])
+		reached = concatenate([result[2] for result in results])
+	fitness = 1 / (1 + scores)
+	return (-fitness).argsort(kind='stable'), fitness, reached
+
+def select_parents(rank, fitness, elite_size, rng):
+	'''
+	keep the elite_size fittest chromosomes and pick the rest of the mating pool with a chance proportional to fitness
+	'''
+	fitness = fitness[rank]
+	cumulative = cumsum(fitness)
+	picks = searchsorted(cumulative, rng.random(len(rank) - elite_size) * cumulative[-1], side='right')
+	return concatenate([rank[:elite_size], rank[minimum(picks, len(rank) - 1)]])
+
+def breed_population(mating_pool, elite_size, rng):
+	'''
+	keep the elites and breed the rest of the population by one point crossover of random pairs from the mating pool
+	'''
+	size, length = mating_pool.shape
+	children = mating_pool.copy()
+	count = size - elite_size
+	if count > 0 and length > 1:
+		mothers = mating_pool[rng.integers(0, size, size=count)]
+		fathers = mating_pool[rng.integers(0, size, size=count)]
+		cut = rng.integers(1, length, size=count)
+		children[elite_size:] = where(arange(length) < cut[:, None], mothers, fathers)
+	return children
+
+def mutate_population(population, elite_size, mutation_rate, rng):
+	'''
+	replace each gene (except those of the elites) with a random move code with a chance of mutation_rate
+	'''
+	mutations = rng.random(population[elite_size:].shape) < mutation_rate
+	population[elite_size:][mutations] = rng.integers(0, len(moves), size=int(mutations.sum()), dtype=int8)
+	return population
+
+def next_generation(population, start_node, end_node, tables, elite_size, mutation_rate, mode, rng, pool=None):
+	'''
+	rank the population, select a mating pool, breed it and mutate the children
+	returns the next generation and the best fitness of this one
+	'''
+	rank, fitness, reached = rank_population(population, start_node, end_node, tables, mode, rng, pool)
+	mating_pool = population[select_parents(rank, fitness, elite_size, rng)]
+	children = breed_population(mating_pool, elite_size, rng)
+	return mutate_population(children, elite_size, mutation_rate, rng), fitness[rank[0]]
+
+def decode_path(chromosome, start_node, end_node, tables, mode):
+	'''
+	walk a single (already repaired) chromosome and return the node x,y positions of its path
+	'''
+	valid, counts, table, offsets, distance, height = tables
+	position = start_node[0] * height + start_node[1]
+	end = end_node[0] * height + end_node[1]
+	path = [start_node]
+	for gene in chromosome.tolist():
+		if position == end:
+			break
+		if not valid[position, gene]:
+			if mode == 'skip':
+				continue
+			break
+		position += int(offsets[gene])
+		path.append((position // height, position % height))
+	return path
+
+def genetic_algorithm(grid, start_node, end_node, population_size, elite_size, mutation_rate, generations, mode='stop', genome_length=None, processes=None, seed=None, stats=None):
+	'''
+	evolve a population of paths from start_node towards end_node and return the path of the fittest chromosome
+	- genome_length is the most moves a path can take, by default twice the width plus the height of the maze
+	- processes > 1 evaluates the population on a pool of that many processes
+	- if stats is a dict, the cost of the best path, whether it reached the end_node, the number of paths walked and the best fitness of each generation are written to it
+	'''
+	if mode not in modes:
+		raise ValueError('mode must be one of {}, got {!r}'.format(modes, mode))
+	if not 0 <= elite_size <= population_size:
+		raise ValueError('elite_size must be between 0 and the population_size')
+	rng = default_rng(seed)
+	tables = create_tables(grid, end_node)
+	if genome_length is None:
+		genome_length = 2 * (grid.width + grid.height)
+	population = create_population(population_size, genome_length, rng)
+	history = []
+	pool = None
+	memory = None
+	try:
+		if processes is not None and processes > 1:
+			memory, layout = share(grid)
+			pool = Pool(processes, initializer=attach, initargs=(layout, None))
+		for i in range(generations):
+			population, best_fitness = next_generation(population, start_node, end_node, tables, elite_size, mutation_rate, mode, rng, pool)
+			history.append(float(best_fitness))
+		rank, fitness, reached = rank_population(population, start_node, end_node, tables, mode, rng, pool)
+	finally:
+		if pool is not None:
+			pool.close()
+			pool.join()
+		if memory is not None:
+			memory.close()
+			memory.unlink()
+	best = rank[0]
+	path = decode_path(population[best], start_node, end_node, tables, mode)
+	if stats is not None:
+		stats['cost'] = sum(create_g(a, b) for a, b in zip(path, path[1:]))
+		stats['reached'] = bool(reached[best])
+		stats['evaluations'] = population_size * (generations + 1)
+		stats['history'] = history
+	return path
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	from astar_maze_path_plot import astar
+	from jps_benchmark import path_cost
+	from maze_generator import corners, random_maze
+	size = int(argv[1]) if len(argv) > 1 else 32
+	population_size = int(argv[2]) if len(argv) > 2 else 2000
+	generations = int(argv[3]) if len(argv) > 3 else 200
+	processes = int(argv[4]) if len(argv) > 4 else 2
+	grid = random_maze(size, 0.2, 0)
+	start_node, end_node = corners(grid)
+	start_time = perf_counter()
+	optimal_cost = path_cost(astar(start_node, end_node, grid))
+	print('astar(): cost {:.3f} in {:.4f} s'.format(optimal_cost, perf_counter() - start_time))
+	for mode in modes:
+		for workers in (None, processes):
+			stats = {}
+			start_time = perf_counter()
+			path = genetic_algorithm(grid, start_node, end_node, population_size, population_size // 10, 0.01, generations, mode, processes=workers, seed=0, stats=stats)
+			elapsed = perf_counter() - start_time
+			print('{:>6} ({} processes): reached {}, cost {:.3f} ({:.2f}x astar()) in {:.3f} s, {:.0f} paths/s'.format(mode, workers or 1, stats['reached'], stats['cost'], stats['cost'] / optimal_cost, elapsed, stats['evaluations'] / elapsed))
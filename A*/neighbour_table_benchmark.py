@@ -0,0 +1,163 @@
+########## neighbour_table_benchmark.py ##########
+
+'''
+
+- This script measures the cost per step of walking the maze through the neighbour table of move masks against building the children of every node
+- It times the random walk of guess_maze_path.create_path(), the greedy walk of guess_maze_path_continue_if_blocked.create_path() and astar(),
+  each next to a copy of the version that called grid.children() and built a create_node() list for every candidate
+- astar() is also timed on the packed copy of the maze, whose table is never compiled and reads the moves of each expanded cell from the bits
+- usage: python neighbour_table_benchmark.py [size] [density]
+
+'''
+
+#########
+# imports
+#########
+
+from heapq import heappush, heappop
+from math import sqrt
+from random import choice, seed
+from sys import argv
+from time import perf_counter
+from astar_maze_path_plot import astar, create_g, create_h
+from maze_generator import corners, random_maze
+from maze_grid import PackedMazeGrid
+import guess_maze_path
+import guess_maze_path_continue_if_blocked
+
+####################
+# initial conditions
+####################
+
+size = 2048 # define the side length of the benchmark maze
+density = 0.2 # define the chance that a cell of the maze is blocked
+walk_steps = 1000000 # define how many steps the random walks take
+
+######################
+# define the baselines
+######################
+
+def create_path_children(grid, start_node, end_node, max_steps):
+	'''
+	- the random walk of guess_maze_path.create_path() as it was before the neighbour table
+	'''
+	path = [start_node]
+	current_node = [start_node]
+	while current_node[0] != end_node and len(path) <= max_steps:
+		next_moves = []
+		for node_position in grid.children(current_node[0]):
+			next_moves.append([node_position])
+		current_node = choice(next_moves)
+		path.append(current_node[0])
+	return path
+
+def create_greedy_path_children(grid, start_node, end_node):
+	'''
+	- the greedy walk of guess_maze_path_continue_if_blocked.create_path() as it was before the neighbour table
+	'''
+	path = [start_node]
+	current_node = [start_node, 0.0, 0.0, 0.0]
+	while current_node[0] != end_node:
+		next_moves = [[node_position, 0.0, 0.0, 0.0] for node_position in grid.children(current_node[0])]
+		for node in next_moves:
+			if node[0] in path:
+				continue
+			if node[0][0] == current_node[0][0] or node[0][1] == current_node[0][1]:
+				node[1] = current_node[1] + 1
+			else:
+				node[1] = current_node[1] + sqrt(2)
+			node[2] = (node[0][0] - end_node[0])**2 + (node[0][1] - end_node[1])**2
+			node[3] = node[1] + node[2]
+		next_moves = [node for node in next_moves if not node[1] == 0]
+		if not next_moves:
+			break
+		next_moves.sort(key=lambda x: x[-1])
+		current_node = next_moves[0]
+		path.append(current_node[0])
+	return path
+
+def astar_children(start, end, grid):
+	'''
+	- astar() as it was before the neighbour table, with x,y tuple nodes and grid.children()
+	'''
+	g = {start: 0}
+	h = create_h(start, end)
+	closed_list = set()
+	open_list = [(h, h, start)]
+	parent = {}
+	while open_list:
+		current_f, current_h, current_node = heappop(open_list)
+		if current_node in closed_list:
+			continue
+		if current_node == end:
+			path = [current_node]
+			while current_node in parent:
+				current_node = parent[current_node]
+				path.append(current_node)
+			path.reverse()
+			return path
+		closed_list.add(current_node)
+		for child in grid.children(current_node):
+			if child in closed_list:
+				continue
+			candidates_g = g[current_node] + create_g(current_node, child)
+			if child in g and candidates_g >= g[child]:
+				continue
+			parent[child] = current_node
+			g[child] = candidates_g
+			h = create_h(child, end)
+			heappush(open_list, (candidates_g + h, h, child))
+
+######################
+# define the benchmark
+######################
+
+def timed(function, *args):
+	'''
+	- run a function once and return its result with the elapsed wall clock time
+	'''
+	start_time = perf_counter()
+	result = function(*args)
+	return result, perf_counter() - start_time
+
+def benchmark(size, density):
+	'''
+	- time each walker per step with and without the neighbour table
+	'''
+	grid = random_maze(size, density)
+	start, end = corners(grid)
+	table, compile_time = timed(grid.neighbour_table)
+	print('{0}x{0} maze: neighbour table compiled in {1:.3f} s, {2:.1f} MB (the grid is {3:.1f} MB)'.format(size, compile_time, table.nbytes / 1e6, grid.cells.nbytes / 1e6))
+	print('{:>20} {:>10} {:>16} {:>16} {:>9}'.format('walker', 'steps', 'children (us)', 'table (us)', 'speedup'))
+	seed(0)
+	old_path, old_time = timed(create_path_children, grid, start, end, walk_steps)
+	seed(0)
+	new_path, new_time = timed(guess_maze_path.create_path, grid, start, end, walk_steps)
+	assert old_path == new_path
+	steps = len(new_path) - 1
+	print('{:>20} {:>10} {:>16.3f} {:>16.3f} {:>8.1f}x'.format('random walk', steps, old_time / steps * 1e6, new_time / steps * 1e6, old_time / new_time))
+	old_path, old_time = timed(create_greedy_path_children, grid, start, end)
+	new_path, new_time = timed(guess_maze_path_continue_if_blocked.create_path, grid, start, end, 0.0, 0.0, 0.0)
+	assert old_path == new_path
+	steps = max(len(new_path) - 1, 1)
+	print('{:>20} {:>10} {:>16.3f} {:>16.3f} {:>8.1f}x'.format('greedy walk', steps, old_time / steps * 1e6, new_time / steps * 1e6, old_time / new_time))
+	old_path, old_time = timed(astar_children, start, end, grid)
+	stats = {}
+	new_path, new_time = timed(astar, start, end, grid, stats)
+	assert old_path == new_path
+	steps = stats['expanded']
+	print('{:>20} {:>10} {:>16.3f} {:>16.3f} {:>8.1f}x'.format('astar() expansion', steps, old_time / steps * 1e6, new_time / steps * 1e6, old_time / new_time))
+	packed_path, packed_time = timed(astar, start, end, PackedMazeGrid.from_grid(grid))
+	assert packed_path == new_path
+	print('{:>20} {:>10} {:>16.3f} {:>16.3f} {:>8.1f}x'.format('packed astar()', steps, old_time / steps * 1e6, packed_time / steps * 1e6, old_time / packed_time))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		size = int(argv[1])
+	if len(argv) > 2:
+		density = float(argv[2])
+	benchmark(size, density)
@@ -0,0 +1,121 @@
+########## path_cache.py ##########
+
+'''
+
+- This script implements a bounded least recently used (LRU) cache of path finding results
+- Paths are keyed on (maze fingerprint, start, end), so any edit to the maze changes the key and stale paths are never served
+- Every part of an optimal path is itself optimal, so a cached path from A to B also answers any query from a node C on it to B
+
+'''
+
+#########
+# imports
+#########
+
+from collections import OrderedDict
+from astar_maze_path_plot import astar, start, end, grid
+
+####################
+# initial conditions
+####################
+
+maxsize = 1024 # define how many paths the cache holds before the least recently used one is evicted
+
+##################
+# define the cache
+##################
+
+class PathCache:
+	'''
+	- LRU cache in front of a search function with the astar(start, end, grid) signature
+	- hits, misses and subpath_hits count how queries were answered (subpath_hits are also counted in hits)
+	'''
+
+	def __init__(self, search=astar, maxsize=maxsize):
+		self.search = search
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self.subpath_hits = 0
+		self._paths = OrderedDict() # (fingerprint, start, end) -> (path, {node: index on the path}), least recently used first
+		self._by_end = {} # (fingerprint, end) -> set of cached keys ending there
+
+	def get(self, start, end, grid=grid):
+		'''
+		- return the path from start to end, searching the maze only if neither the path nor a path that contains it is cached
+		'''
+		fingerprint = grid.fingerprint()
+		key = (fingerprint, start, end)
+		if key in self._paths:
+			self._paths.move_to_end(key)
+			self.hits += 1
+			path = self._paths[key][0]
+			return None if path is None else list(path)
+		for cached_key in self._by_end.get((fingerprint, end), ()):
+			path, positions = self._paths[cached_key]
+			if start in positions:
+				self._paths.move_to_end(cached_key)
+				self.hits += 1
+				self.subpath_hits += 1
+				return list(path[positions[start]:])
+		self.misses += 1
+		path = self.search(start, end, grid)
+		self.put(key, path)
+		return None if path is None else list(path)
+
+	def put(self, key, path):
+		'''
+		- store a path, evicting the least recently used paths if the cache is full
+		'''
+		if path is None:
+			positions = {}
+		else:
+			path = tuple(path)
+			positions = {node: i for i, node in enumerate(path)}
+		self._paths[key] = (path, positions)
+		self._paths.move_to_end(key)
+		if path is not None:
+			self._by_end.setdefault((key[0], key[2]), set()).add(key)
+		while len(self._paths) > self.maxsize:
+			self.evict()
+
+	def evict(self):
+		'''
+		- drop the least recently used path
+		'''
+		key, (path, positions) = self._paths.popitem(last=False)
+		keys = self._by_end.get((key[0], key[2]))
+		if keys is not None:
+			keys.discard(key)
+			if not keys:
+				del self._by_end[(key[0], key[2])]
+
+	def clear(self):
+		'''
+		- drop every cached path and reset the counters
+		'''
+		self._paths.clear()
+		self._by_end.clear()
+		self.hits = 0
+		self.misses = 0
+		self.subpath_hits = 0
+
+	def cache_info(self):
+		'''
+		- return the counters and size of the cache
+		'''
+		return {'hits': self.hits, 'misses': self.misses, 'subpath_hits': self.subpath_hits, 'maxsize': self.maxsize, 'currsize': len(self._paths)}
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	cache = PathCache()
+	path = cache.get(start, end)
+	print(path)
+	print(cache.get(start, end)) # answered from the cache
+	print(cache.get(path[3], end)) # answered from the cached path through path[3]
+	grid.set_blocked(path[5]) # editing the maze changes its fingerprint, so the next query searches again
+	print(cache.get(start, end))
+	print(cache.cache_info())
@@ -0,0 +1,113 @@
+########## path_nodes.py ##########
+
+'''
+
+- This script defines NodePath, the compact store of the nodes the guess_maze_path_* walkers put on a path
+- The walkers used to keep every node as a [position, g, h, f] list (with its own position tuple and float objects, about 250 bytes a node)
+  next to a second list of the same positions, NodePath keeps one structured numpy array with int32 x, y and float32 g, h, f (20 bytes a node)
+- Indexing a NodePath still gives a [position, g, h, f] node, built only when it is read, so code that reads nodes keeps working
+- The walkers keep the g and f of their current node as python floats and only store them as float32, so they take the same steps as before
+- usage: nodes = NodePath(); nodes.append(position, g, h, f); nodes.positions()
+
+'''
+
+#########
+# imports
+#########
+
+from numpy import dtype, empty, float32, int32
+
+####################
+# initial conditions
+####################
+
+node_dtype = dtype([('x', int32), ('y', int32), ('g', float32), ('h', float32), ('f', float32)]) # one node of a path, 20 bytes
+capacity = 16 # define how many nodes a new NodePath has room for before its array grows
+
+###################
+# define the nodes
+###################
+
+class NodePath:
+	'''
+	- the nodes of a path in the order they were added, nodes[i] is the [position, g, h, f] node i (negative i counts from the end)
+	- the array doubles when it is full, so append() is amortized O(1)
+	'''
+	__slots__ = ('nodes', 'size')
+
+	def __init__(self, capacity=capacity):
+		self.nodes = empty(max(capacity, 1), dtype=node_dtype)
+		self.size = 0
+
+	def append(self, position, g, h, f):
+		'''
+		- add a node at the end of the path
+		'''
+		if self.size == len(self.nodes):
+			nodes = empty(2 * self.size, dtype=node_dtype)
+			nodes[:self.size] = self.nodes
+			self.nodes = nodes
+		self.nodes[self.size] = (position[0], position[1], g, h, f)
+		self.size += 1
+
+	def __len__(self):
+		return self.size
+
+	def __getitem__(self, i):
+		if i < 0:
+			i += self.size
+		if not 0 <= i < self.size:
+			raise IndexError('node index out of range')
+		x, y, g, h, f = self.nodes[i].item()
+		return [(x, y), g, h, f]
+
+	def position(self, i):
+		'''
+		- return the x,y position of node i
+		'''
+		return self[i][0]
+
+	def positions(self):
+		'''
+		- return the x,y positions of the path as a list of tuples, the path the walkers return
+		'''
+		nodes = self.nodes[:self.size]
+		return list(zip(nodes['x'].tolist(), nodes['y'].tolist()))
+
+	def array(self):
+		'''
+		- return the nodes as a structured array view (fields x, y, g, h and f), without copying them
+		'''
+		return self.nodes[:self.size]
+
+	def nbytes(self):
+		'''
+		- return the bytes the nodes take, counting the room the array has left to grow
+		'''
+		return self.nodes.nbytes
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	from math import sqrt
+	from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+	count = 100000
+	# the old layout: a [position, g, h, f] list per node next to a list of the positions
+	start_tracing()
+	on_path = []
+	path = []
+	for i in range(count):
+		on_path.append([(i, i + 1), i * sqrt(2), float(i), i * sqrt(2) + i])
+		path.append(on_path[-1][0])
+	old_bytes = get_traced_memory()[0]
+	stop_tracing()
+	start_tracing()
+	nodes = NodePath()
+	for i in range(count):
+		nodes.append((i, i + 1), i * sqrt(2), float(i), i * sqrt(2) + i)
+	new_bytes = get_traced_memory()[0]
+	stop_tracing()
+	assert nodes.positions() == path
+	print('lists: {:.1f} bytes a node, NodePath: {:.1f} bytes a node ({:.0f}x less)'.format(old_bytes / count, new_bytes / count, old_bytes / new_bytes))
@@ -0,0 +1,89 @@
+########## render_benchmark.py ##########
+
+'''
+
+- This script compares the time to draw many paths over a maze with one plt.plot() per path against plot_paths() and save_png() of maze_render.py
+- The paths are random 8 connected walks, the drawing time only depends on how many paths there are and how long they are
+- Every figure is saved to an in memory PNG, so the times include rendering and the benchmark runs without a display
+- usage: python render_benchmark.py [size ...]
+
+'''
+
+#########
+# imports
+#########
+
+from io import BytesIO
+from sys import argv
+from time import perf_counter
+import matplotlib.pyplot as plt
+from numpy import asarray, clip
+from numpy.random import default_rng
+from maze_generator import random_maze
+from maze_grid import moves
+from maze_render import plot_grid, plot_paths, save_png
+
+####################
+# initial conditions
+####################
+
+sizes = [512, 4096] # define the side length of each benchmark maze
+path_counts = [100, 1000, 5000] # define the numbers of paths drawn on each maze
+slow_limit = 1000 # define the most paths drawn with one plt.plot() per path, it gets slow past this
+
+######################
+# define the benchmark
+######################
+
+def random_walks(size, count, seed=0):
+	'''
+	- return count walks of size // 2 random 8 connected moves that stay inside a size x size maze, as lists of positions
+	'''
+	rng = default_rng(seed)
+	steps = asarray(moves)[rng.integers(len(moves), size=(count, size // 2))]
+	walks = clip(rng.integers(size, size=(count, 1, 2)) + steps.cumsum(axis=1), 0, size - 1)
+	return [list(map(tuple, walk)) for walk in walks.tolist()]
+
+def time_figure(draw, grid, paths):
+	'''
+	- draw the maze and the paths on a new figure with draw(ax, paths), save it as a PNG in memory and return the seconds it took
+	'''
+	start_time = perf_counter()
+	figure, ax = plt.subplots(figsize=(8, 8))
+	plot_grid(grid, ax)
+	draw(ax, paths)
+	figure.savefig(BytesIO(), format='png')
+	plt.close(figure)
+	return perf_counter() - start_time
+
+def plot_each(ax, paths):
+	'''
+	- draw the paths the way the scripts in this folder used to, one plt.plot() per path
+	'''
+	for path in paths:
+		ax.plot([i[0] for i in path], [i[1] for i in path])
+
+def benchmark(sizes):
+	'''
+	- draw every number of paths over every maze size with each method
+	'''
+	print('{:>6} {:>6} {:>12} {:>14} {:>14} {:>10}'.format('size', 'paths', 'steps', 'plt.plot (s)', 'collection (s)', 'png (s)'))
+	for size in sizes:
+		grid = random_maze(size, 0.3, 0)
+		for count in path_counts:
+			paths = random_walks(size, count)
+			each_time = '{:>14.3f}'.format(time_figure(plot_each, grid, paths)) if count <= slow_limit else '{:>14}'.format('-')
+			collection_time = time_figure(lambda ax, paths: plot_paths(paths, ax), grid, paths)
+			start_time = perf_counter()
+			save_png(BytesIO(), grid, paths)
+			png_time = perf_counter() - start_time
+			print('{:>6} {:>6} {:>12} {} {:>14.3f} {:>10.3f}'.format(size, count, sum(len(path) for path in paths), each_time, collection_time, png_time))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		sizes = [int(size) for size in argv[1:]]
+	benchmark(sizes)
@@ -0,0 +1,185 @@
+########## search_stats.py ##########
+
+'''
+
+- This script turns the counters of the searches in this folder into records that can be aggregated, so a slow query can be explained
+- The searches fill an optional stats dict with counters that are worked out when they finish, so with stats=None they run exactly as before
+- profile() also times the heap operations and tracks the peak size of the open list, by swapping timed heappush() and heappop() into the module
+  of the search for one call, so no timing code lives in the search loops
+- walk_stats() works out the per-step counters of the greedy walkers (create_optimal_path() and the create_path() variants) from the path they walked
+- A record is a plain dict, aggregate() sums records per search and write_records() appends them to a JSON lines file
+- usage: path, record = profile(astar, start, end, grid)
+
+'''
+
+#########
+# imports
+#########
+
+import json
+from heapq import heappush, heappop
+from time import perf_counter
+from maze_grid import mask_codes
+
+####################
+# initial conditions
+####################
+
+peak_keys = ('peak_open', 'peak_closed') # record keys that are aggregated with max() instead of sum()
+calibration_calls = 100000 # define how many calls measure the cost of the timing probes themselves
+probe_cost = [] # the seconds one timing probe adds to a search, measured once by calibrate()
+
+######################
+# define the profiler
+######################
+
+def calibrate():
+	'''
+	- measure how much time a timing probe adds around a heap operation, it is subtracted from the children_time of profiled searches
+	'''
+	if not probe_cost:
+		heap = []
+		start_time = perf_counter()
+		for i in range(calibration_calls):
+			heappush(heap, i)
+			heappop(heap)
+		plain = perf_counter() - start_time
+		counts = {'heap_time': 0.0}
+		push, pop = timed_heap(counts)
+		start_time = perf_counter()
+		for i in range(calibration_calls):
+			push(heap, i)
+			pop(heap)
+		timed = perf_counter() - start_time
+		probe_cost.append(max(timed - plain, 0.0) / (2 * calibration_calls)) # the extra time of a wrapped call over a plain one
+	return probe_cost[0]
+
+def timed_heap(counts):
+	'''
+	- return heappush() and heappop() wrappers that add their time, their calls and the peak heap size to counts
+	'''
+	counts.update(pushes=0, pops=0, heap_time=0.0, peak_open=0)
+	def push(heap, item):
+		start_time = perf_counter()
+		heappush(heap, item)
+		counts['heap_time'] += perf_counter() - start_time
+		counts['pushes'] += 1
+		if len(heap) > counts['peak_open']:
+			counts['peak_open'] = len(heap)
+	def pop(heap):
+		start_time = perf_counter()
+		item = heappop(heap)
+		counts['heap_time'] += perf_counter() - start_time
+		counts['pops'] += 1
+		return item
+	return push, pop
+
+def profile(search, start, end, grid, **options):
+	'''
+	- run search(start, end, grid, stats, **options) once and return its path and a record of its counters and timings
+	- heap_time is the time spent inside heappush() and heappop(), children_time is the rest of the search (generating and scoring children)
+	  with the cost of the probes taken out, both are rough on searches that run for less than a millisecond
+	- the heap functions are swapped in the module the search is defined in, so profile one search at a time and not from several threads
+	'''
+	probe = calibrate()
+	namespace = search.__globals__
+	counts = {}
+	push, pop = timed_heap(counts)
+	saved = {name: namespace[name] for name in ('heappush', 'heappop') if name in namespace}
+	namespace.update({name: push if name == 'heappush' else pop for name in saved})
+	stats = {}
+	try:
+		start_time = perf_counter()
+		path = search(start, end, grid, stats, **options)
+		elapsed = perf_counter() - start_time
+	finally:
+		namespace.update(saved)
+	record = {'search': search.__name__, 'start': list(start), 'end': list(end), 'reached': path is not None, 'length': 0 if path is None else len(path)}
+	record.update(stats)
+	record.update(counts)
+	record['time'] = elapsed
+	record['children_time'] = max(elapsed - counts['heap_time'] - probe * (counts['pushes'] + counts['pops']), 0.0)
+	return path, record
+
+def walk_stats(grid, path, end_node, stats):
+	'''
+	- write the per-step counters of a greedy walk along path to stats: the steps taken, the neighbours scanned,
+	  the neighbours skipped because they were already on the path, and why the walk stopped ('end', 'stuck' or 'f increased')
+	- the cells of a walk are all different (a walk never steps on its own path), so the step at which each neighbour joined the path tells if it was skipped
+	'''
+	table = grid.neighbour_table()
+	masks = table.masks_view
+	offsets = table.offsets
+	cells = [table.cell(position) for position in path]
+	step_of = {cell: step for step, cell in enumerate(cells)}
+	reached = path[-1] == end_node
+	candidates = 0
+	revisits = 0
+	for step, cell in enumerate(cells[:-1] if reached else cells): # the walk scans the neighbours of every node it stands on, except the end
+		codes = mask_codes[masks[cell]]
+		candidates += len(codes)
+		for code in codes:
+			if step_of.get(cell + offsets[code], step + 1) <= step:
+				revisits += 1
+	if reached:
+		stop = 'end'
+	elif all(cells[-1] + offsets[code] in step_of for code in mask_codes[masks[cells[-1]]]):
+		stop = 'stuck'
+	else:
+		stop = 'f increased'
+	stats['steps'] = len(path) - 1
+	stats['candidates'] = candidates
+	stats['revisits'] = revisits
+	stats['stop'] = stop
+
+######################
+# define the records
+######################
+
+def aggregate(records):
+	'''
+	- sum the numeric fields of the records per search (peak sizes take the max) and count the queries and the ones that reached the end
+	'''
+	totals = {}
+	for record in records:
+		total = totals.setdefault(record['search'], {'queries': 0, 'reached': 0})
+		total['queries'] += 1
+		total['reached'] += bool(record.get('reached'))
+		for key, value in record.items():
+			if key == 'reached' or isinstance(value, bool) or not isinstance(value, (int, float)):
+				continue
+			total[key] = max(total.get(key, value), value) if key in peak_keys else total.get(key, 0) + value
+	return totals
+
+def write_records(records, path):
+	'''
+	- append the records to a JSON lines file, one record per line
+	'''
+	with open(path, 'a') as file:
+		for record in records:
+			file.write(json.dumps(record) + '\n')
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	from random import Random
+	from sys import argv
+	from numpy import argwhere, asarray
+	from astar_maze_path_plot import astar
+	from bidirectional_astar import bidirectional_astar
+	from maze_generator import random_maze
+	size = int(argv[1]) if len(argv) > 1 else 256
+	grid = random_maze(size, 0.3, 0)
+	grid.neighbour_table()
+	free = [tuple(cell) for cell in argwhere(asarray(grid.cells) == 0).tolist()]
+	rng = Random(0)
+	records = []
+	for i in range(20):
+		start, end = rng.choice(free), rng.choice(free)
+		for search in (astar, bidirectional_astar):
+			records.append(profile(search, start, end, grid)[1])
+	print(json.dumps(records[0]))
+	for search, total in aggregate(records).items():
+		print(search, {key: round(value, 4) if isinstance(value, float) else value for key, value in total.items()})
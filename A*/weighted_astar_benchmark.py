@@ -0,0 +1,73 @@
+########## weighted_astar_benchmark.py ##########
+
+'''
+
+- This script measures what weighted A* and anytime_astar() trade in path cost for speed on corner to corner queries
+- For every weight it reports the nodes expanded, the time and the cost of the path relative to the optimal astar() path (never more than the weight)
+- Then it runs anytime_astar() and prints every path it finds, with the time it was found and its suboptimality bound next to the true cost ratio
+- usage: python weighted_astar_benchmark.py [size] [deadline]
+
+'''
+
+#########
+# imports
+#########
+
+from sys import argv
+from time import perf_counter
+from astar_maze_path_plot import astar
+from jps_benchmark import path_cost
+from maze_generator import corners, corridor_maze, random_maze, rooms_maze
+
+####################
+# initial conditions
+####################
+
+size = 1024 # define the side length of the benchmark mazes
+weights = [1.0, 1.1, 1.25, 1.5, 2.0, 3.0, 5.0] # define the weights to compare, 1.0 is the optimal astar()
+anytime_weight = 3.0 # define the weight of the first path of anytime_astar()
+deadline = 1.0 # define the time budget of anytime_astar() in seconds
+mazes = [('random 0.3', lambda size: random_maze(size, 0.3, 0)), ('rooms', lambda size: rooms_maze(size, room_size=32, seed=0)), ('corridors', lambda size: corridor_maze(size, seed=0))]
+
+######################
+# define the benchmark
+######################
+
+def benchmark(size, deadline):
+	'''
+	- run weighted A* for every weight and anytime_astar() with the deadline on every maze
+	'''
+	for name, create_maze in mazes:
+		grid = create_maze(size)
+		start, end = corners(grid)
+		grid.neighbour_table() # compile the neighbour table before timing the searches
+		optimal_cost = None
+		print('{} {}x{}:'.format(name, size, size))
+		print('{:>8} {:>12} {:>10} {:>10}'.format('weight', 'expanded', 'time (s)', 'cost/A*'))
+		for weight in weights:
+			stats = {}
+			start_time = perf_counter()
+			path = astar(start, end, grid, stats, weight=weight)
+			elapsed = perf_counter() - start_time
+			cost = path_cost(path)
+			if optimal_cost is None:
+				optimal_cost = cost
+			print('{:>8.2f} {:>12} {:>10.4f} {:>10.4f}'.format(weight, stats['expanded'], elapsed, cost / optimal_cost))
+		stats = {}
+		path = astar(start, end, grid, stats, weight=anytime_weight, deadline=deadline)
+		print('anytime_astar() from weight {} with a {} s deadline, {} nodes expanded:'.format(anytime_weight, deadline, stats['expanded']))
+		print('{:>8} {:>12} {:>10} {:>14}'.format('time (s)', 'cost', 'cost/A*', 'suboptimality'))
+		for seconds, cost, suboptimality in stats['improvements']:
+			print('{:>8.4f} {:>12.3f} {:>10.4f} {:>14.4f}'.format(seconds, cost, cost / optimal_cost, suboptimality))
+		print('returned a path of cost {:.3f} within {:.4f} of the optimal cost'.format(path_cost(path), stats['suboptimality']))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		size = int(argv[1])
+	if len(argv) > 2:
+		deadline = float(argv[2])
+	benchmark(size, deadline)
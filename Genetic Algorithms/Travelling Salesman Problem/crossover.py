@@ -0,0 +1,162 @@
+########## crossover.py ##########
+
+'''
+
+- This script implements the crossover operators of tsp.py on int permutation routes, a whole generation of children per call
+- moms and dads are (children, nodes) arrays, child i is bred from moms[i] and dads[i], and every operator keeps each child a permutation
+- order_crossover() (OX) and partially_mapped_crossover() (PMX) are built from node lookup tables and boolean masks, O(n) per child
+  (PMX follows its mapping chains by pointer doubling, so O(n log n) at worst) with no python loop over the genes
+- edge_recombination() (ERX) picks each next node from the edges of both parents, which depends on the node picked before it,
+  so it steps through the positions once for the whole generation: a python loop of n steps, each vectorized over the children
+- usage: children = crossover(moms, dads, 'ox')
+
+'''
+
+#########
+# imports
+#########
+
+from numpy import arange, concatenate, empty, empty_like, inf, int32, roll, sort, where, zeros
+from numpy.random import default_rng
+
+####################
+# initial conditions
+####################
+
+operators = ('ox', 'pmx', 'erx') # the crossover operators crossover() accepts
+random_guesses = 8 # define how many random nodes edge_recombination() tries before it draws from the unvisited ones when it has to jump
+rng = default_rng() # the random generator of the crossovers, pass a seeded one to repeat a run
+
+######################
+# define the operators
+######################
+
+def cut_points(count, length, rng=rng):
+	'''
+	- return the start and end of a random segment [start, end) of each of count routes of length nodes, like breed() draws them
+	'''
+	cuts = sort(rng.integers(length, size=(count, 2)), axis=1)
+	return cuts[:, :1], cuts[:, 1:]
+
+def flat_indices(routes):
+	'''
+	- return the index of every gene of routes into a flattened (routes, nodes) table: routes[i][j] becomes i * nodes + routes[i][j]
+	'''
+	return routes + (arange(len(routes)) * routes.shape[1])[:, None]
+
+def order_crossover(moms, dads, rng=rng):
+	'''
+	- OX as breed() does it: the genes of mom between two cut points, then the other nodes in the order dad visits them
+	'''
+	count, length = moms.shape
+	start, end = cut_points(count, length, rng)
+	position = arange(length)
+	in_segment = (position >= start) & (position < end) # the positions of mom that go to the child
+	from_mom = zeros(count * length, dtype=bool) # from_mom[i * length + node] is True if mom gave the node to child i
+	from_mom[flat_indices(moms)] = in_segment
+	from_dad = ~from_mom[flat_indices(dads)] # the positions of dad whose node the child still needs
+	# each row of the mask keeps exactly length genes of mom followed by dad, so compressing it lays the children out row by row
+	return concatenate([moms, dads], axis=1)[concatenate([in_segment, from_dad], axis=1)].reshape(count, length)
+
+def partially_mapped_crossover(moms, dads, rng=rng):
+	'''
+	- PMX: the child is dad with mom's genes between two cut points, a node of dad outside the segment that mom's segment already placed
+	  is replaced by following the mapping mom[p] -> dad[p] of the segment until it reaches a node the segment doesn't hold
+	'''
+	count, length = moms.shape
+	start, end = cut_points(count, length, rng)
+	position = arange(length)
+	in_segment = (position >= start) & (position < end)
+	mom_indices = flat_indices(moms)
+	in_mom_segment = zeros(count * length, dtype=bool) # in_mom_segment[i * length + node] is True if the node is in the segment of mom i
+	in_mom_segment[mom_indices] = in_segment
+	# mapping[i][node] is the node dad holds where mom holds the node, for the nodes of mom's segment, every other node maps to itself
+	mapping = empty((count, length), dtype=moms.dtype)
+	mapping.ravel()[mom_indices] = dads
+	mapping = where(in_mom_segment.reshape(count, length), mapping, arange(length, dtype=moms.dtype))
+	children = where(in_segment, moms, dads)
+	conflicts = ~in_segment & in_mom_segment[flat_indices(dads)] # dad's nodes outside the segment that the segment already holds
+	rows, columns = conflicts.nonzero()
+	nodes = dads[rows, columns]
+	# the chains from a conflict end at a node outside mom's segment (a fixed point of mapping), squaring mapping doubles how far it jumps
+	while len(nodes):
+		nodes = mapping[rows, nodes]
+		done = ~in_mom_segment[rows * length + nodes]
+		children[rows[done], columns[done]] = nodes[done]
+		rows, columns, nodes = rows[~done], columns[~done], nodes[~done]
+		mapping = mapping.ravel()[flat_indices(mapping)]
+	return children
+
+def create_edges(moms, dads):
+	'''
+	- return the edge table of every pair of parents: edges[i][node] holds the up to 4 different neighbours of the node in mom and dad (-1 for a repeat)
+	'''
+	count, length = moms.shape
+	edges = empty((count, length, 4), dtype=moms.dtype)
+	flat_edges = edges.reshape(count * length, 4)
+	for column, (routes, shift) in enumerate([(moms, 1), (moms, -1), (dads, 1), (dads, -1)]):
+		flat_edges[flat_indices(routes).ravel(), column] = roll(routes, shift, axis=1).ravel()
+	for column in (2, 3):
+		repeat = (edges[:, :, column:column + 1] == edges[:, :, :column]).any(axis=2)
+		edges[:, :, column][repeat] = -1
+	return edges
+
+def edge_recombination(moms, dads, rng=rng):
+	'''
+	- ERX: start at mom's first node and move to the unvisited neighbour (in either parent) with the fewest unvisited neighbours of its own,
+	  ties broken at random, or to a random unvisited node when every neighbour has been visited
+	'''
+	count, length = moms.shape
+	edges = create_edges(moms, dads).reshape(count * length, 4) # edges[i * length + node] are the neighbours of the node for child i
+	base = arange(count) * length
+	visited = zeros(count * length, dtype=bool)
+	children = empty_like(moms)
+	current = moms[:, 0].astype(int32)
+	for step in range(length):
+		children[:, step] = current
+		visited[base + current] = True
+		if step == length - 1:
+			break
+		candidates = edges[base + current] # (count, 4), a -1 slot is looked up like any node but never picked
+		candidate_indices = base[:, None] + candidates
+		valid = (candidates >= 0) & ~visited[candidate_indices]
+		neighbours = edges[candidate_indices] # (count, 4, 4), the neighbours of each candidate
+		degree = ((neighbours >= 0) & ~visited[base[:, None, None] + neighbours]).sum(axis=2)
+		score = where(valid, degree + rng.random(degree.shape) * 0.5, inf)
+		current = candidates[arange(count), score.argmin(axis=1)]
+		stuck = ~valid.any(axis=1)
+		if stuck.any(): # no unvisited neighbour left, jump to a random unvisited node
+			stuck = stuck.nonzero()[0]
+			guesses = rng.integers(length, size=(len(stuck), random_guesses)) # cheap while most nodes are unvisited
+			free = ~visited[base[stuck, None] + guesses]
+			current[stuck] = guesses[arange(len(stuck)), free.argmax(axis=1)]
+			missed = stuck[~free.any(axis=1)] # every guess was visited, draw from the unvisited nodes of the row instead
+			if len(missed):
+				current[missed] = (rng.random((len(missed), length)) + ~visited.reshape(count, length)[missed]).argmax(axis=1)
+	return children
+
+def crossover(moms, dads, operator='ox', rng=rng):
+	'''
+	- breed one child from each pair moms[i], dads[i] with the operator ('ox', 'pmx' or 'erx') and return the children as one array
+	'''
+	breeders = {'ox': order_crossover, 'pmx': partially_mapped_crossover, 'erx': edge_recombination}
+	if operator not in breeders:
+		raise ValueError('unknown crossover operator {!r}, expected one of {}'.format(operator, operators))
+	if not len(moms):
+		return moms.copy()
+	return breeders[operator](moms, dads, rng)
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	from time import perf_counter
+	size, length = 130, 5000 # the children of a tsp.py generation of 150 routes with 20 elites
+	parents = rng.permuted(arange(length, dtype=int32)[None, :].repeat(2 * size, axis=0), axis=1)
+	for operator in operators:
+		start_time = perf_counter()
+		children = crossover(parents[:size], parents[size:], operator)
+		elapsed = perf_counter() - start_time
+		assert (sort(children, axis=1) == arange(length)).all(), 'a child is not a permutation'
+		print('{}: {} children of {} nodes in {:.3f} s'.format(operator, size, length, elapsed))
@@ -0,0 +1,231 @@
+########## local_search.py ##########
+
+'''
+
+- This script implements the memetic stage of tsp.py: 2-opt and Or-opt local search that removes the crossings the swap mutate() leaves behind
+- Moves are only tried towards the k nearest neighbours of a city (found once with a KD-tree), and each move is scored in O(1)
+  from the lengths of the 3 or 4 edges it removes and adds, so a pass over a tour doesn't depend on checking every pair of cities
+- Cities whose edges changed are queued again (don't look bits), the search stops when no move improves the tour or when its deadline passes
+- A route is improved in place: the tour is the int32 route itself and a position array, a 2-opt move reverses the shorter side of the tour
+- usage: LocalSearch(cities).improve_population(population, rows, time_budget)
+
+'''
+
+#########
+# imports
+#########
+
+from collections import deque
+from math import hypot
+from time import perf_counter
+from numpy import arange, empty, int32
+from scipy.spatial import cKDTree
+
+####################
+# initial conditions
+####################
+
+neighbours = 8 # define how many nearest neighbours of each city the moves are tried towards
+segment_lengths = (1, 2, 3) # define the lengths of the segments Or-opt moves
+tolerance = 1e-9 # a move has to shorten the tour by more than this, so rounding can't make the search cycle
+
+######################
+# define the search
+######################
+
+def create_neighbours(coordinates, k=neighbours):
+	'''
+	- return the k nearest other cities of every city as a (cities, k) int32 array, nearest first, found with a KD-tree
+	'''
+	k = min(k, len(coordinates) - 1)
+	indices = cKDTree(coordinates).query(coordinates, k + 1)[1]
+	return indices[:, 1:].astype(int32)
+
+class LocalSearch:
+	'''
+	- 2-opt and Or-opt local search on the cities of tsp.create_cities(), the neighbour lists are built once
+	- distances are computed in float64 from the coordinates, so they work the same with and without the distance matrix
+	'''
+
+	def __init__(self, cities, k=neighbours):
+		coordinates = cities[0]
+		self.size = len(coordinates)
+		self.xs = coordinates[:, 0].astype(float).tolist()
+		self.ys = coordinates[:, 1].astype(float).tolist()
+		self.neighbours = create_neighbours(coordinates, k).tolist() if self.size > 1 else [[]]
+		self.moves = 0 # the improving moves applied since the search was made
+		self.gain = 0.0 # the total length they removed
+
+	def distance(self, a, b):
+		'''
+		- return the linear distance between cities a and b
+		'''
+		return hypot(self.xs[a] - self.xs[b], self.ys[a] - self.ys[b])
+
+	def reverse(self, i, j):
+		'''
+		- reverse the tour from position i forward to position j (wrapping past the end), or the rest of the tour if that is shorter,
+		  both give the same cycle
+		'''
+		n = self.size
+		length = (j - i) % n + 1
+		if 2 * length > n:
+			i, j, length = (j + 1) % n, (i - 1) % n, n - length
+		if length < 2:
+			return
+		tour, position = self.tour, self.position
+		if i <= j:
+			tour[i:j + 1] = tour[i:j + 1][::-1].copy()
+			position[tour[i:j + 1]] = arange(i, j + 1, dtype=int32)
+		else:
+			indices = (arange(i, i + length) % n).astype(int32)
+			tour[indices] = tour[indices[::-1]]
+			position[tour[indices]] = indices
+
+	def exchange(self, a, b, c, d):
+		'''
+		- 2-opt move: remove the tour edges (a, b) and (c, d) and add (a, c) and (b, d), where the tour runs a, b, ..., c, d in one direction
+		'''
+		position = self.position_view
+		n = self.size
+		if self.tour_view[(position[a] + 1) % n] == b:
+			self.reverse(position[b], position[c])
+		else:
+			self.reverse(position[c], position[b])
+
+	def two_opt(self, a):
+		'''
+		- try the 2-opt moves that give city a an edge to one of its neighbours, apply the best one and return the cities it touched
+		'''
+		tour, position, n = self.tour_view, self.position_view, self.size
+		distance = self.distance
+		best = -tolerance
+		move = None
+		for step in (1, -1): # the edge to the next city, then to the previous one
+			i = position[a]
+			b = tour[(i + step) % n]
+			ab = distance(a, b)
+			for c in self.neighbours[a]:
+				ac = distance(a, c)
+				if ac >= ab:
+					break # the neighbours are sorted, no nearer city is left to gain from
+				d = tour[(position[c] + step) % n]
+				if c == b or d == a:
+					continue
+				delta = ac + distance(b, d) - ab - distance(c, d)
+				if delta < best:
+					best = delta
+					move = (a, b, c, d)
+		if move is None:
+			return ()
+		self.exchange(*move)
+		self.moves += 1
+		self.gain -= best
+		return move
+
+	def or_opt(self, a):
+		'''
+		- try moving the segment of 1 to 3 cities that starts at city a between two cities next to a neighbour of its ends (either way round),
+		  apply the best move and return the cities it touched
+		'''
+		tour, position, n = self.tour_view, self.position_view, self.size
+		distance = self.distance
+		best = -tolerance
+		move = None
+		i = position[a]
+		for length in segment_lengths:
+			if length + 3 > n:
+				break
+			first, last = a, tour[(i + length - 1) % n]
+			before, after = tour[(i - 1) % n], tour[(i + length) % n]
+			removed = distance(before, first) + distance(last, after) - distance(before, after)
+			if removed <= tolerance:
+				continue # nothing to gain from taking the segment out
+			for c in self.neighbours[first] + self.neighbours[last]:
+				if (position[c] - i) % n < length:
+					continue # c is in the segment
+				for x, y in ((tour[(position[c] - 1) % n], c), (c, tour[(position[c] + 1) % n])): # the edges on each side of c
+					if x == before or x == last:
+						continue # the segment is already between x and y
+					xy = distance(x, y)
+					for flip, (start, end) in enumerate(((first, last), (last, first))):
+						delta = distance(x, start) + distance(end, y) - xy - removed
+						if delta < best:
+							best = delta
+							move = (before, first, last, after, x, y, flip)
+		if move is None:
+			return ()
+		before, first, last, after, x, y, flip = move
+		# the tour runs before, first ... last, after ... x, y: two 2-opt moves insert the segment reversed between x and y, a third turns it back
+		self.exchange(before, first, x, y)
+		self.exchange(before, x, after, last)
+		if not flip:
+			self.exchange(x, last, first, y)
+		self.moves += 1
+		self.gain -= best
+		return (before, first, last, after, x, y)
+
+	def improve(self, route, deadline=None):
+		'''
+		- apply improving 2-opt and Or-opt moves to the route (an int32 permutation, changed in place) until none is left or the deadline
+		  (a perf_counter() time) passes, and return the route
+		'''
+		if self.size < 5:
+			return route
+		self.tour = route
+		self.position = empty(self.size, dtype=int32)
+		self.position[route] = arange(self.size, dtype=int32)
+		self.tour_view = memoryview(route)
+		self.position_view = memoryview(self.position)
+		queued = bytearray(b'\x01') * self.size
+		active = deque(route.tolist())
+		while active:
+			if deadline is not None and perf_counter() > deadline:
+				break
+			a = active.popleft()
+			queued[a] = 0
+			touched = self.two_opt(a) or self.or_opt(a)
+			for city in touched:
+				if not queued[city]:
+					queued[city] = 1
+					active.append(city)
+		self.tour = self.position = self.tour_view = self.position_view = None
+		return route
+
+	def improve_population(self, population, rows, time_budget=None):
+		'''
+		- improve the routes population[rows] in place, sharing time_budget seconds (None for no limit) evenly between the routes left
+		'''
+		rows = list(rows)
+		start_time = perf_counter()
+		for done, row in enumerate(rows):
+			deadline = None
+			if time_budget is not None:
+				left = start_time + time_budget - perf_counter()
+				if left <= 0:
+					break
+				deadline = perf_counter() + left / (len(rows) - done)
+			self.improve(population[row], deadline)
+		return population
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	from numpy.random import default_rng
+	from tsp import create_cities, route_distance
+	rng = default_rng(0)
+	for count in (1000, 10000):
+		cities = create_cities((rng.random((count, 2)) * 10).tolist())
+		start_time = perf_counter()
+		search = LocalSearch(cities)
+		build_time = perf_counter() - start_time
+		route = rng.permutation(count).astype(int32)
+		before = route_distance(route, cities)
+		start_time = perf_counter()
+		search.improve(route, perf_counter() + 30)
+		elapsed = perf_counter() - start_time
+		assert (sorted(route.tolist()) == list(range(count))), 'the route is not a permutation any more'
+		after = route_distance(route, cities)
+		print('{} cities: neighbour lists in {:.3f} s, {:.1f} -> {:.1f} with {} moves in {:.2f} s (the moves claim {:.1f})'.format(count, build_time, before, after, search.moves, elapsed, before - search.gain))
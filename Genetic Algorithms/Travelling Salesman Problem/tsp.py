@@ -3,6 +3,11 @@
 '''
 
 - This script implements a GA to solve the tsp
+- The distances between the nodes are computed once into a float32 matrix (or on the fly from the coordinates past matrix_limit nodes)
+- A route is an int32 permutation of the node indices and the population is one 2D array with a route per row
+- layout: crossover.py and local_search.py sit next to this script, selection.py is shared with guess_add_n_up_to_x.py and sits in the
+  Genetic Algorithms folder above it, which is added to sys.path from the location of this file (not the working directory) on import,
+  so tsp.py and the scripts that import it run from any directory
 
 '''
 
@@ -10,13 +15,18 @@
 # imports
 #########
 
-from numpy import array, linspace, pi, sqrt, repeat
-from random import random, uniform, sample
-from pandas import DataFrame
-from operator import itemgetter
+from numpy import arange, asarray, concatenate, float32, float64, int32, nonzero, roll, sqrt, subtract, tile
+from numpy.random import default_rng
+from os.path import abspath, dirname
 import matplotlib.pyplot as plt
-import itertools
+import sys
 import warnings
+genetic_algorithms = dirname(dirname(abspath(__file__))) # the Genetic Algorithms folder, home of selection.py (see layout above)
+if genetic_algorithms not in sys.path:
+	sys.path.append(genetic_algorithms)
+from selection import select
+from crossover import crossover, order_crossover
+from local_search import LocalSearch
 warnings.filterwarnings('ignore')
 
 ##################
@@ -26,6 +36,14 @@ warnings.filterwarnings('ignore')
 # initial conditions
 nodes = 50
 node_list = []
+matrix_limit = 5000 # the most nodes whose distance matrix is precomputed, it takes 4 * nodes**2 bytes (100 MB for 5000 nodes)
+chunk_genes = 1 << 16 # define how many genes of the population route_distances() gathers at a time
+crossover_operator = 'ox' # define how children are bred: 'ox' (order), 'pmx' (partially mapped) or 'erx' (edge recombination) crossover (see crossover.py)
+selection_method = 'roulette' # define how the mating pool is picked: 'roulette', 'stochastic_universal' or 'tournament' (see selection.py)
+memetic = None # define which routes 2-opt / Or-opt local search improves every generation: None, 'elites' or 'children' (see local_search.py)
+time_budget = 0.1 # define the seconds of local search per generation, shared between the routes it improves
+seed = None # define the seed of the random generator, an int makes the nodes and the run of the demo repeatable
+rng = default_rng(seed) # the random generator of the GA, every function takes an rng and genetic_algorithm() also takes a seed, so a run can be repeated
 
 # function to create x,y node data
 def create_node(x, y):
@@ -33,148 +51,127 @@ def create_node(x, y):
 
 # create a list of random nodes
 for i in range(nodes):
-	node_list.append(create_node(x = random()*10, y = random()*10))
+	node_list.append(create_node(x = rng.random()*10, y = rng.random()*10))
 
 ##########################
 # algorithm implementation
 ##########################
 
-# define the linear distance between two nodes
-def linear_distance(from_node, to_node):
-	x_distance = abs(from_node[0] - to_node[0])
-	y_distance = abs(from_node[1] - to_node[1])
-	distance = sqrt((x_distance)**2 + (y_distance)**2)
-	return distance
+# create the cities the routes visit: the float32 x,y coordinates of the nodes and the float32 matrix of the linear distances between them
+# past matrix_limit nodes the matrix would take too much memory, so it is None and distances are computed from the coordinates when they are needed
+def create_cities(node_list):
+	coordinates = asarray(node_list, dtype=float32)
+	if len(coordinates) > matrix_limit:
+		return coordinates, None
+	distances = subtract.outer(coordinates[:, 0], coordinates[:, 0]) # the x distances, squared in place so only two matrices are ever allocated
+	distances *= distances
+	y_distance = subtract.outer(coordinates[:, 1], coordinates[:, 1])
+	y_distance *= y_distance
+	distances += y_distance
+	return coordinates, sqrt(distances, out=distances)
+
+# define the length of every edge of a route (or of every route of a population): edge i goes from route[i] to route[i + 1] and the last edge back to route[0]
+def edge_lengths(routes, cities):
+	coordinates, distances = cities
+	following = roll(routes, -1, axis=-1)
+	if distances is not None:
+		return distances[routes, following]
+	delta = coordinates[routes] - coordinates[following]
+	return sqrt((delta**2).sum(axis=-1))
 
 # define the route distance as the sum of the linear distances: dist(node[0] to node[1]) + dist(node[1] to node[2]) + ...... + dist(node[-1] to node[0])
-def route_distance(node_list):
-	distance = 0
-	if distance == 0:
-		path_distance = 0
-		for i in range(len(node_list)):
-			from_node = node_list[i]
-			to_node = None
-			if i + 1 < len(node_list):
-				to_node = node_list[i + 1]
-			else:
-				to_node = node_list[0]
-			path_distance += linear_distance(from_node, to_node)
-		distance = path_distance
-	return distance
+def route_distance(route, cities):
+	return float(edge_lengths(route, cities).sum(dtype=float64))
 
 # define route fitness (fitness = 1 / route_distance) --> the smaller the route_distance, the higher the fitness
-def route_fitness(node_list):
-	fitness = 0.0
-	if fitness == 0:
-		fitness = 1 / float(route_distance(node_list))
-	return fitness
-
-# create a randomized route of nodes sampled from the node_list:
-def create_route(node_list):
-	route = sample(node_list, len(node_list))
-	return route
-
-# create an initial population (first generation of chromosones) of random routes
-def initial_population(population_size, node_list):
-	population = []
-	for i in range(population_size):
-		population.append(create_route(node_list))
-	return population
-
-# determine the fitness for each route in the population, then rank them
-def rank_routes(population):
-	fitness_results = {}
-	for i in range(len(population)):
-		fitness_results[i] = route_fitness(population[i])
-	return sorted(fitness_results.items(), key = itemgetter(1), reverse = True)
-
-# create the selection method for being chromosones to the mating pool
-def selection(rank, elite_size):
-	selection_results = []
-	df = DataFrame(array(rank), columns = ['Index', 'Fitness'])
-	df['Cum_Sum'] = df.Fitness.cumsum()
-	df['Cum_Percent'] = (df.Cum_Sum / df.Fitness.sum())*100
-	for i in range(elite_size):
-		selection_results.append(rank[i][0])
-	for i in range(len(rank) - elite_size):
-		pick = random()*100
-		for i in range(len(rank)):
-			if pick <= df.iat[i, 3]:
-				selection_results.append(rank[i][0])
-				break
-	return selection_results
+def route_fitness(route, cities):
+	return 1 / route_distance(route, cities)
+
+# create a randomized route: a permutation of the indices of the nodes
+def create_route(node_list, rng=rng):
+	return rng.permutation(len(node_list)).astype(int32)
+
+# create an initial population (first generation of chromosones) of random routes, one route per row
+def initial_population(population_size, node_list, rng=rng):
+	return rng.permuted(tile(arange(len(node_list), dtype=int32), (population_size, 1)), axis=1)
+
+# define the length of every route of the population at once, a gather of the distance matrix with the rolled population
+# the rows are gathered chunk_genes genes at a time, so the rolled routes and their edge lengths stay in the cache on big populations
+def route_distances(population, cities):
+	rows = max(1, chunk_genes // population.shape[1])
+	if len(population) <= rows:
+		return edge_lengths(population, cities).sum(axis=1, dtype=float64)
+	return concatenate([edge_lengths(population[i:i + rows], cities).sum(axis=1, dtype=float64) for i in range(0, len(population), rows)])
+
+# determine the fitness for each route in the population, then rank them: a list of (index, fitness) pairs from the fittest route down
+def rank_routes(population, cities):
+	fitness = 1 / route_distances(population, cities)
+	order = (-fitness).argsort(kind='stable') # stable, so routes with the same fitness keep their order like sorted() did
+	return list(zip(order.tolist(), fitness[order].tolist()))
+
+# create the selection method for being chromosones to the mating pool: the elites, then the rest picked by the method of selection.py in one call
+def selection(rank, elite_size, method=selection_method, rng=rng):
+	return select(rank, elite_size, method, rng)
 
 # extract the selected chromosones into a mating pool
 def mating_pool(population, selection_results):
-	mating_pool = []
-	for i in range(len(selection_results)):
-		index = selection_results[i]
-		mating_pool.append(population[index])
-	return mating_pool
-
-# create a child through crossover breeding
-def breed(mom, dad):
-	child = []
-	child_mom = []
-	child_dad = []
-	gene_mom = int(random()*len(mom))
-	gene_dad = int(random()*len(dad))
-	start_gene = min(gene_mom, gene_dad)
-	end_gene = max(gene_mom, gene_dad)
-	for i in range(start_gene, end_gene):
-		child_mom.append(mom[i])
-	child_dad = [i for i in dad if i not in child_mom]
-	child = child_mom + child_dad
-	return child
-
-# breed the entire population
-def breed_population(mating_pool, elite_size):
-	children = []
+	return population[asarray(selection_results, dtype=int32)]
+
+# create a child through crossover breeding: the genes of mom between two random cut points, then the rest of the nodes in the order dad visits them
+def breed(mom, dad, rng=rng):
+	return order_crossover(mom[None, :], dad[None, :], rng)[0]
+
+# breed the entire population: the elites stay, then every other child is bred from a pair of the shuffled pool in one crossover() call (see crossover.py)
+def breed_population(mating_pool, elite_size, operator=crossover_operator, rng=rng):
+	children = mating_pool.copy()
 	length = len(mating_pool) - elite_size
-	pool = sample(mating_pool, len(mating_pool))
-	for i in range(elite_size):
-		children.append(mating_pool[i])
-	for i in range(length):
-		child = breed(pool[i], pool[len(mating_pool) - i - 1])
-		children.append(child)
+	pool = mating_pool[rng.permutation(len(mating_pool))]
+	children[elite_size:] = crossover(pool[:length], pool[::-1][:length], operator, rng) # child i is bred from pool[i] and pool[len(mating_pool) - i - 1]
 	return children
 
 # create a mutation using swapping --> two cities potentially swap places
-def mutate(individual, mutation_rate):
-	for swapped in range(len(individual)):
-		if random() < mutation_rate:
-			swap_with = int(random()*len(individual))
-			node1 = individual[swapped]
-			node2 = individual[swap_with]
-			individual[swapped] = node2
-			individual[swap_with] = node1
+def mutate(individual, mutation_rate, rng=rng):
+	swapped = nonzero(rng.random(len(individual)) < mutation_rate)[0]
+	swap_with = rng.integers(len(individual), size=len(swapped))
+	for i, j in zip(swapped.tolist(), swap_with.tolist()):
+		individual[i], individual[j] = individual[j], individual[i]
 	return individual
 
 # mutate the entire population of chromosones
-def mutate_population(population, mutation_rate):
-	mutated_population = []
+def mutate_population(population, mutation_rate, rng=rng):
 	for i in range(len(population)):
-		mutated_index = mutate(population[i], mutation_rate)
-		mutated_population.append(mutated_index)
-	return mutated_population
-
-# produce a new generation of chromosones based on breeding the population with potential mutations
-def next_generation(current_generation, elite_size, mutation_rate):
-	rank = rank_routes(current_generation)
-	selection_results = selection(rank, elite_size)
+		mutate(population[i], mutation_rate, rng)
+	return population
+
+# improve the routes of a new generation in place with the local search, the elites (the first elite_size routes) or every bred child
+def improve_population(population, search, elite_size, mode=memetic, time_budget=time_budget):
+	rows = range(elite_size) if mode == 'elites' else range(elite_size, len(population))
+	return search.improve_population(population, rows, time_budget)
+
+# produce a new generation of chromosones based on breeding the population with potential mutations, then local search if a search is given
+def next_generation(current_generation, cities, elite_size, mutation_rate, rng=rng, search=None):
+	rank = rank_routes(current_generation, cities)
+	selection_results = selection(rank, elite_size, selection_method, rng)
 	matingpool = mating_pool(current_generation, selection_results)
-	children = breed_population(matingpool, elite_size)
-	next_generation = mutate_population(children, mutation_rate)
+	children = breed_population(matingpool, elite_size, crossover_operator, rng)
+	next_generation = mutate_population(children, mutation_rate, rng)
+	if search is not None:
+		improve_population(next_generation, search, elite_size, memetic, time_budget)
 	return next_generation
 
-# create a main function that calls the genetic algorithm
-def genetic_algorithm(population, population_size, elite_size, mutation_rate, generations):
-	population = initial_population(population_size, population)
-	print('Initial route distance:', str(1 / rank_routes(population)[0][1]))
+# create a main function that calls the genetic algorithm, population is the list of nodes and the best route is returned as a permutation of their indices
+# the same seed (or a generator in the same state) gives the same run, seed=None draws from rng
+def genetic_algorithm(population, population_size, elite_size, mutation_rate, generations, rng=rng, seed=None):
+	if seed is not None:
+		rng = default_rng(seed)
+	cities = create_cities(population)
+	search = LocalSearch(cities) if memetic else None
+	population = initial_population(population_size, population, rng)
+	print('Initial route distance:', str(1 / rank_routes(population, cities)[0][1]))
 	for i in range(generations):
-		population = next_generation(population, elite_size, mutation_rate)
-	print('Final route distance:', str(1 / rank_routes(population)[0][1]))
-	best_route_index = rank_routes(population)[0][0]
+		population = next_generation(population, cities, elite_size, mutation_rate, rng, search)
+	print('Final route distance:', str(1 / rank_routes(population, cities)[0][1]))
+	best_route_index = rank_routes(population, cities)[0][0]
 	best_route = population[best_route_index]
 	return best_route
 
@@ -182,22 +179,18 @@ def genetic_algorithm(population, population_size, elite_size, mutation_rate, ge
 # solve and visualize the solution
 ##################################
 
-# visualize each node
-for i in range(nodes):
-	plt.plot(node_list[i][0], node_list[i][1], 'ro')
+if __name__ == '__main__':
+	# visualize each node
+	coordinates = asarray(node_list)
+	plt.plot(coordinates[:, 0], coordinates[:, 1], 'ro')
 	plt.gca().set_aspect('equal')
 
-# determine the best_route according to the tsp genetic algorithm
-best_route = genetic_algorithm(population = node_list, population_size = 150, elite_size = 20, mutation_rate = 0.01, generations = 500)
+	# determine the best_route according to the tsp genetic algorithm
+	best_route = genetic_algorithm(population = node_list, population_size = 150, elite_size = 20, mutation_rate = 0.01, generations = 500)
 
-# visualize the path
-i = 0
-j = 1
-while j < len(node_list):
-	plt.plot([best_route[i][0], best_route[j][0]], [best_route[i][1], best_route[j][1]], '-')
-	i += 1
-	j += 1
-plt.plot([best_route[-1][0], best_route[0][0]], [best_route[-1][1], best_route[0][1]], '-')
+	# visualize the path, back to the first node
+	tour = coordinates[concatenate([best_route, best_route[:1]])]
+	plt.plot(tour[:, 0], tour[:, 1], '-')
 
-# show the plot
-plt.show()
+	# show the plot
+	plt.show()
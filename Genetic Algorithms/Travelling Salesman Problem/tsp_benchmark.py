@@ -0,0 +1,238 @@
+########## tsp_benchmark.py ##########
+
+'''
+
+- This script measures the generations per second of the tsp GA in tsp.py for different numbers of cities
+- It times next_generation() on int32 permutation routes with the float32 distance matrix and with distances computed on the fly,
+  next to a copy of the version whose routes were lists of x,y tuples and whose route_distance() called sqrt() for every edge
+- The list version is only timed up to list_limit cities, its breed() is quadratic in the number of cities
+- It also times rank_routes() on big populations against a copy of the version that called route_fitness() once per route,
+  and the selection methods of selection.py against a copy of the selection() that scanned a pandas DataFrame once per pick
+- The crossover operators of crossover.py are timed on the children of one generation next to the list breed()
+- The memetic stage (local_search.py) is run for memetic_time seconds of GA on memetic_counts cities per mode and time budget,
+  it reports how many generations ran and the best route distance they reached
+- usage: python tsp_benchmark.py [cities ...]
+
+'''
+
+#########
+# imports
+#########
+
+from random import random, sample, seed
+from operator import itemgetter
+from sys import argv
+from time import perf_counter
+from numpy import array, sqrt
+from numpy.random import default_rng
+from pandas import DataFrame
+from local_search import LocalSearch
+import crossover
+import tsp
+import selection
+
+####################
+# initial conditions
+####################
+
+city_counts = [50, 500, 5000] # define the numbers of cities to benchmark
+population_size = 150 # the population of the tsp.py demo
+elite_size = 20
+mutation_rate = 0.01
+min_time = 2.0 # define how long each version runs generations for (at least one generation is always run)
+list_limit = 500 # define the most cities the list version is timed on
+rank_sizes = [1000, 5000] # define the population sizes rank_routes() is timed on
+selection_sizes = [150, 1000, 5000] # define the population sizes the selection methods are timed on
+dataframe_limit = 1000 # define the largest population the DataFrame selection is timed on, it is quadratic in the population size
+memetic_counts = [1000, 10000] # define the numbers of cities the memetic stage is run on
+memetic_runs = [(None, 0.0), ('elites', 0.1), ('elites', 1.0), ('children', 0.1), ('children', 1.0)] # define the (memetic, time_budget) pairs to run
+memetic_time = 10.0 # define how long each memetic run lasts (at least one generation is always run)
+
+######################
+# define the baselines
+######################
+
+def linear_distance(from_node, to_node):
+	'''
+	- the linear distance between two x,y nodes, as tsp.py computed it for every edge before the distance matrix
+	'''
+	x_distance = abs(from_node[0] - to_node[0])
+	y_distance = abs(from_node[1] - to_node[1])
+	return sqrt((x_distance)**2 + (y_distance)**2)
+
+def route_distance_list(route):
+	'''
+	- route_distance() as it was before the distance matrix, one sqrt() per edge of a list of x,y tuples
+	'''
+	distance = 0
+	for i in range(len(route)):
+		distance += linear_distance(route[i], route[(i + 1) % len(route)])
+	return distance
+
+def breed_list(mom, dad):
+	'''
+	- breed() as it was before the position lookup, with a list scan for every gene of dad
+	'''
+	gene_mom = int(random()*len(mom))
+	gene_dad = int(random()*len(dad))
+	child_mom = mom[min(gene_mom, gene_dad):max(gene_mom, gene_dad)]
+	return child_mom + [i for i in dad if i not in child_mom]
+
+def next_generation_list(population):
+	'''
+	- next_generation() as it was before the int32 routes, with the same selection()
+	'''
+	fitness_results = {i: 1 / float(route_distance_list(route)) for i, route in enumerate(population)}
+	rank = sorted(fitness_results.items(), key=lambda item: item[1], reverse=True)
+	matingpool = [population[i] for i in tsp.selection(rank, elite_size)]
+	pool = sample(matingpool, len(matingpool))
+	children = matingpool[:elite_size] + [breed_list(pool[i], pool[len(matingpool) - i - 1]) for i in range(len(matingpool) - elite_size)]
+	for individual in children:
+		for swapped in range(len(individual)):
+			if random() < mutation_rate:
+				swap_with = int(random()*len(individual))
+				individual[swapped], individual[swap_with] = individual[swap_with], individual[swapped]
+	return children
+
+def rank_routes_loop(population, cities):
+	'''
+	- rank_routes() as it was before the batched route_distances(), one route_fitness() per route and a dict sorted by fitness
+	'''
+	fitness_results = {}
+	for i in range(len(population)):
+		fitness_results[i] = tsp.route_fitness(population[i], cities)
+	return sorted(fitness_results.items(), key = itemgetter(1), reverse = True)
+
+def selection_dataframe(rank, elite_size):
+	'''
+	- selection() as it was before selection.py, a pandas DataFrame of the cumulative fitness scanned with df.iat for every pick
+	'''
+	selection_results = []
+	df = DataFrame(array(rank), columns = ['Index', 'Fitness'])
+	df['Cum_Sum'] = df.Fitness.cumsum()
+	df['Cum_Percent'] = (df.Cum_Sum / df.Fitness.sum())*100
+	for i in range(elite_size):
+		selection_results.append(rank[i][0])
+	for i in range(len(rank) - elite_size):
+		pick = random()*100
+		for i in range(len(rank)):
+			if pick <= df.iat[i, 3]:
+				selection_results.append(rank[i][0])
+				break
+	return selection_results
+
+######################
+# define the benchmark
+######################
+
+def generations_per_second(step, population):
+	'''
+	- run population = step(population) until min_time has passed and return the generations per second
+	'''
+	generations = 0
+	start_time = perf_counter()
+	while generations == 0 or perf_counter() - start_time < min_time:
+		population = step(population)
+		generations += 1
+	return generations / (perf_counter() - start_time)
+
+def benchmark(city_counts):
+	'''
+	- time every version of the GA on random cities in a 10 x 10 square
+	'''
+	print('{:>7} {:>12} {:>10} {:>12} {:>13} {:>9} {:>16}'.format('cities', 'matrix (MB)', 'build (s)', 'lists (g/s)', 'arrays (g/s)', 'speedup', 'on the fly (g/s)'))
+	for count in city_counts:
+		seed(0)
+		rng = default_rng(0)
+		node_list = [tsp.create_node(x = random()*10, y = random()*10) for i in range(count)]
+		start_time = perf_counter()
+		cities = tsp.create_cities(node_list)
+		build_time = perf_counter() - start_time
+		population = tsp.initial_population(population_size, node_list, rng)
+		arrays = generations_per_second(lambda population: tsp.next_generation(population, cities, elite_size, mutation_rate, rng), population.copy())
+		on_the_fly = generations_per_second(lambda population: tsp.next_generation(population, (cities[0], None), elite_size, mutation_rate, rng), population.copy())
+		if count <= list_limit:
+			lists = generations_per_second(next_generation_list, [[node_list[i] for i in route] for route in population.tolist()])
+			lists_text = '{:>12.2f} {:>13.2f} {:>8.1f}x'.format(lists, arrays, arrays / lists)
+		else:
+			lists_text = '{:>12} {:>13.2f} {:>9}'.format('-', arrays, '-')
+		matrix = cities[1].nbytes / 1e6 if cities[1] is not None else 0.0
+		print('{:>7} {:>12.1f} {:>10.3f} {} {:>16.2f}'.format(count, matrix, build_time, lists_text, on_the_fly))
+	print()
+	print('{:>7} {:>11} {:>10} {:>13} {:>9}'.format('cities', 'population', 'loop (s)', 'batched (s)', 'speedup'))
+	for count in city_counts:
+		rng = default_rng(0)
+		node_list = [tsp.create_node(x, y) for x, y in (rng.random((count, 2)) * 10).tolist()]
+		cities = tsp.create_cities(node_list)
+		for size in rank_sizes:
+			population = tsp.initial_population(size, node_list, rng)
+			start_time = perf_counter()
+			loop_rank = rank_routes_loop(population, cities)
+			loop_time = perf_counter() - start_time
+			start_time = perf_counter()
+			rank = tsp.rank_routes(population, cities)
+			batched_time = perf_counter() - start_time
+			assert [index for index, fitness in rank] == [index for index, fitness in loop_rank], 'the batched ranking changed the order of the routes'
+			print('{:>7} {:>11} {:>10.4f} {:>13.4f} {:>8.1f}x'.format(count, size, loop_time, batched_time, loop_time / batched_time))
+	print()
+	print('{:>11} {:>15} {:>13} {:>25} {:>15}'.format('population', 'DataFrame (ms)', 'roulette (ms)', 'stochastic_universal (ms)', 'tournament (ms)'))
+	node_list = [tsp.create_node(x = random()*10, y = random()*10) for i in range(50)]
+	cities = tsp.create_cities(node_list)
+	for size in selection_sizes:
+		rank = tsp.rank_routes(tsp.initial_population(size, node_list, rng), cities)
+		times = []
+		for select in [selection_dataframe] * (size <= dataframe_limit) + [lambda rank, elite_size, method=method: selection.select(rank, elite_size, method, rng) for method in selection.methods]:
+			start_time = perf_counter()
+			picks = select(rank, elite_size)
+			times.append((perf_counter() - start_time) * 1e3)
+			assert len(picks) == size
+		times = ['{:.3f}'.format(time) for time in times]
+		print('{:>11} {:>15} {:>13} {:>25} {:>15}'.format(size, *(['-'] * (size > dataframe_limit) + times)))
+	print()
+	print('{:>7} {:>9} {:>15} {:>9} {:>9} {:>9}'.format('cities', 'children', 'list breed (s)', 'ox (s)', 'pmx (s)', 'erx (s)'))
+	for count in city_counts:
+		rng = default_rng(0)
+		node_list = [tsp.create_node(x, y) for x, y in (rng.random((count, 2)) * 10).tolist()]
+		parents = tsp.initial_population(2 * (population_size - elite_size), node_list, rng)
+		moms, dads = parents[:population_size - elite_size], parents[population_size - elite_size:]
+		times = []
+		if count <= list_limit:
+			mom_lists = [[node_list[i] for i in route] for route in moms.tolist()]
+			dad_lists = [[node_list[i] for i in route] for route in dads.tolist()]
+			start_time = perf_counter()
+			for mom, dad in zip(mom_lists, dad_lists):
+				breed_list(mom, dad)
+			times.append('{:.4f}'.format(perf_counter() - start_time))
+		else:
+			times.append('-')
+		for operator in crossover.operators:
+			start_time = perf_counter()
+			crossover.crossover(moms, dads, operator, rng)
+			times.append('{:.4f}'.format(perf_counter() - start_time))
+		print('{:>7} {:>9} {:>15} {:>9} {:>9} {:>9}'.format(count, len(moms), *times))
+	print()
+	print('{:>7} {:>9} {:>11} {:>12} {:>14}'.format('cities', 'memetic', 'budget (s)', 'generations', 'best distance'))
+	for count in memetic_counts:
+		rng = default_rng(0)
+		node_list = [tsp.create_node(x, y) for x, y in (rng.random((count, 2)) * 10).tolist()]
+		cities = tsp.create_cities(node_list)
+		search = LocalSearch(cities)
+		for memetic, time_budget in memetic_runs:
+			tsp.memetic, tsp.time_budget = memetic, time_budget
+			population = tsp.initial_population(population_size, node_list, rng)
+			generations = 0
+			start_time = perf_counter()
+			while generations == 0 or perf_counter() - start_time < memetic_time:
+				population = tsp.next_generation(population, cities, elite_size, mutation_rate, rng, search if memetic else None)
+				generations += 1
+			best = 1 / tsp.rank_routes(population, cities)[0][1]
+			print('{:>7} {:>9} {:>11} {:>12} {:>14.1f}'.format(count, str(memetic), '{:.1f}'.format(time_budget) if memetic else '-', generations, best))
+
+#####################
+# run the benchmark
+#####################
+
+if __name__ == '__main__':
+	if len(argv) > 1:
+		city_counts = [int(count) for count in argv[1:]]
+	benchmark(city_counts)
@@ -0,0 +1,92 @@
+########## selection.py ##########
+
+'''
+
+- This script implements the parent selection methods shared by the genetic algorithms in this folder (tsp.py and guess_add_n_up_to_x.py)
+- Every method draws all of its picks in one call with numpy instead of scanning a cumulative table once per pick:
+  roulette() is fitness proportionate (a cumulative sum and searchsorted(), O(log n) per pick),
+  stochastic_universal() is fitness proportionate with evenly spaced pointers (the picks can't all land on the same few routes),
+  and tournament() picks the fittest of tournament_size random contestants per pick
+- An infinite fitness (an exact solution, fitness = 1 / 0) takes every fitness proportionate pick
+- usage: selection_results = select(rank, elite_size, 'roulette')
+
+'''
+
+#########
+# imports
+#########
+
+from numpy import arange, asarray, cumsum, float64, intp, isinf, minimum, searchsorted
+from numpy.random import default_rng
+
+####################
+# initial conditions
+####################
+
+methods = ('roulette', 'stochastic_universal', 'tournament') # the selection methods select() accepts
+tournament_size = 3 # define how many random contestants each tournament pick compares
+rng = default_rng() # the random generator of the selection, pass a seeded one to repeat a run
+
+######################
+# define the methods
+######################
+
+def create_weights(fitness):
+	'''
+	- return the fitness as float64 weights, if any fitness is infinite only the infinite ones get a (equal) weight
+	'''
+	fitness = asarray(fitness, dtype=float64)
+	infinite = isinf(fitness)
+	return infinite.astype(float64) if infinite.any() else fitness
+
+def roulette(fitness, count, rng=rng):
+	'''
+	- pick count indices into fitness, each with a chance proportional to its fitness
+	'''
+	cumulative = cumsum(create_weights(fitness))
+	picks = searchsorted(cumulative, rng.random(count) * cumulative[-1], side='right')
+	return minimum(picks, len(cumulative) - 1)
+
+def stochastic_universal(fitness, count, rng=rng):
+	'''
+	- pick count indices into fitness with count evenly spaced pointers from one random offset,
+	  each index is picked its expected number of times (count * fitness / total) rounded up or down
+	'''
+	cumulative = cumsum(create_weights(fitness))
+	pointers = (rng.random() + arange(count)) * (cumulative[-1] / count)
+	picks = searchsorted(cumulative, pointers, side='right')
+	return minimum(picks, len(cumulative) - 1)
+
+def tournament(fitness, count, rng=rng, size=tournament_size):
+	'''
+	- pick count indices into fitness, each the fittest of size contestants drawn at random (with replacement)
+	'''
+	fitness = asarray(fitness, dtype=float64)
+	contestants = rng.integers(len(fitness), size=(count, size))
+	return contestants[arange(count), fitness[contestants].argmax(axis=1)]
+
+def select(rank, elite_size, method='roulette', rng=rng):
+	'''
+	- rank is the list of (index, fitness) pairs from the fittest down that the rank functions of the genetic algorithms return
+	- keep the indices of the elite_size fittest and pick the rest of the mating pool with the method, returns a list of indices
+	'''
+	pickers = {'roulette': roulette, 'stochastic_universal': stochastic_universal, 'tournament': tournament}
+	if method not in pickers:
+		raise ValueError('unknown selection method {!r}, expected one of {}'.format(method, methods))
+	if not 0 <= elite_size <= len(rank):
+		raise ValueError('elite_size must be between 0 and the population size {}, got {}'.format(len(rank), elite_size))
+	ranked = asarray(rank, dtype=float64).reshape(-1, 2)
+	indices = ranked[:, 0].astype(intp)
+	picks = pickers[method](ranked[:, 1], len(ranked) - elite_size, rng)
+	return indices[:elite_size].tolist() + indices[picks].tolist()
+
+#########
+# testing
+#########
+
+if __name__ == '__main__':
+	fitness = [4.0, 3.0, 2.0, 1.0] # the expected share of the picks is 40%, 30%, 20% and 10%
+	for method in (roulette, stochastic_universal, tournament):
+		picks = method(fitness, 100000)
+		print(method.__name__, [round(float((picks == i).mean()), 3) for i in range(len(fitness))])
+	print(select([(2, 4.0), (0, 3.0), (1, 2.0), (3, 1.0)], 1, 'stochastic_universal'))